@@ -1,15 +1,25 @@
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Set
 
 
 class DownloadQueue:
     """Persistent FIFO queue for media downloads."""
 
-    def __init__(self, queue_path: str):
+    def __init__(self, queue_path: str, unique_key: Optional[str] = None):
         self.queue_path = queue_path
+        # When set, extend() drops items whose value for this key is already queued.
+        self.unique_key = unique_key
         self._queue: List[Dict] = []
+        # Keys ever queued through this instance, popped items included, so media
+        # found again on a later site isn't downloaded twice in one run.
+        self._keys: Set = set()
+        # Discovery and downloads may touch the queue from different threads.
+        self._lock = threading.RLock()
         self._load()
+        if unique_key:
+            self.ensure_unique(unique_key)
 
     # Internal utilities -------------------------------------------------
     def _load(self) -> None:
@@ -57,46 +67,76 @@ class DownloadQueue:
         return len(self._queue)
 
     def as_list(self) -> List[Dict]:
-        return list(self._queue)
+        with self._lock:
+            return list(self._queue)
 
-    def extend(self, items: List[Dict]) -> None:
-        if not items:
-            return
-        self._queue.extend(items)
-        self._save()
+    def extend(self, items: List[Dict]) -> int:
+        """Append items, skipping duplicates when unique_key is set.
+
+        Returns the number of items actually queued.
+        """
+        with self._lock:
+            if self.unique_key and items:
+                key = self.unique_key
+                fresh = []
+                for item in items:
+                    value = item.get(key)
+                    if value in self._keys:
+                        continue
+                    self._keys.add(value)
+                    fresh.append(item)
+                items = fresh
+            if not items:
+                return 0
+            self._queue.extend(items)
+            self._save()
+            return len(items)
 
     def pop_next(self) -> Optional[Dict]:
-        if not self._queue:
-            return None
-        item = self._queue.pop(0)
-        self._save()
-        return item
+        with self._lock:
+            if not self._queue:
+                return None
+            item = self._queue.pop(0)
+            self._save()
+            return item
 
     def remove_where(self, predicate) -> int:
         """Remove queued entries matching predicate(item)."""
-        if not self._queue:
-            return 0
-        initial = len(self._queue)
-        self._queue = [item for item in self._queue if not predicate(item)]
-        if len(self._queue) != initial:
-            self._save()
-        return initial - len(self._queue)
+        with self._lock:
+            if not self._queue:
+                return 0
+            initial = len(self._queue)
+            kept = []
+            for item in self._queue:
+                if not predicate(item):
+                    kept.append(item)
+                elif self.unique_key:
+                    self._keys.discard(item.get(self.unique_key))
+            self._queue = kept
+            if len(self._queue) != initial:
+                self._save()
+            return initial - len(self._queue)
 
     def clear(self) -> None:
-        self._queue = []
-        if os.path.exists(self.queue_path):
-            os.remove(self.queue_path)
+        with self._lock:
+            self._queue = []
+            self._keys = set()
+            if os.path.exists(self.queue_path):
+                os.remove(self.queue_path)
 
     def ensure_unique(self, key: str) -> None:
         """Deduplicate queue entries based on the provided key name."""
-        seen = set()
-        deduped = []
-        for item in self._queue:
-            value = item.get(key)
-            if value in seen:
-                continue
-            seen.add(value)
-            deduped.append(item)
-        if len(deduped) != len(self._queue):
-            self._queue = deduped
-            self._save()
+        with self._lock:
+            seen = set()
+            deduped = []
+            for item in self._queue:
+                value = item.get(key)
+                if value in seen:
+                    continue
+                seen.add(value)
+                deduped.append(item)
+            if key == self.unique_key:
+                self._keys |= seen
+            if len(deduped) != len(self._queue):
+                self._queue = deduped
+                self._save()
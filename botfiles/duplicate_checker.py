@@ -4,8 +4,17 @@ Uses file hashing to guarantee 100% duplicate detection even if files are moved
 """
 import hashlib
 import json
+import mmap
 import os
+from collections import Counter
 from pathlib import Path
+from .hash_cache import HashCache
+
+
+# Bytes read by calculate_head_hash; files this size or smaller have head hash == full hash
+HEAD_BYTES = 64 * 1024
+# Files larger than this are hashed from a memory map instead of chunked reads
+MMAP_MIN_BYTES = 16 * 1024 * 1024
 
 
 class DuplicateChecker:
@@ -17,6 +26,12 @@ class DuplicateChecker:
     def __init__(self, history_file='botfiles/file_hashes.json'):
         self.history_file = history_file
         self.file_hashes = self._load_hashes()
+        # Tracked file sizes (see has_size), kept in step with file_hashes
+        self._size_counts = Counter()
+        self._unsized_entries = 0
+        self._rebuild_size_index()
+        # Hashes of scanned files, reused while their size and mtime are unchanged
+        self.hash_cache = HashCache(os.path.join(os.path.dirname(history_file), 'hash_cache.db'))
     
     def _load_hashes(self):
         """Load existing file hashes from disk"""
@@ -28,16 +43,50 @@ class DuplicateChecker:
                 return {}
         return {}
     
+    def _rebuild_size_index(self):
+        self._size_counts = Counter()
+        self._unsized_entries = 0
+        for info in self.file_hashes.values():
+            self._index_size(info, 1)
+    
+    def _index_size(self, info, delta):
+        size = info.get('size') if isinstance(info, dict) else None
+        if size is None:
+            self._unsized_entries += delta
+        else:
+            self._size_counts[size] += delta
+            if self._size_counts[size] <= 0:
+                del self._size_counts[size]
+    
+    def _forget(self, file_hash):
+        """Drop a tracked hash (without saving)"""
+        info = self.file_hashes.pop(file_hash, None)
+        if info is not None:
+            self._index_size(info, -1)
+    
+    def has_size(self, size):
+        """
+        True if a tracked file might have this size, i.e. a file of this size
+        could match the database and is worth hashing. Always True while some
+        tracked entries have no size recorded.
+        """
+        return self._unsized_entries > 0 or size in self._size_counts
+    
     def _save_hashes(self):
         """Save file hashes to disk"""
         os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
         with open(self.history_file, 'w', encoding='utf-8') as f:
             json.dump(self.file_hashes, f, indent=2)
     
-    def calculate_file_hash(self, file_path, chunk_size=8192):
+    def calculate_file_hash(self, file_path, chunk_size=1024 * 1024):
         """
         Calculate SHA256 hash of a file
         
+        Large files are memory-mapped and hashed in a single update() call (no
+        copies into Python buffers); smaller ones are read into one reusable
+        buffer. hashlib releases the GIL while hashing, so several files can be
+        hashed in parallel threads.
+        
         Args:
             file_path: Path to the file
             chunk_size: Size of chunks to read (for large files)
@@ -47,13 +96,89 @@ class DuplicateChecker:
         """
         sha256_hash = hashlib.sha256()
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    sha256_hash.update(chunk)
+            with open(file_path, "rb", buffering=0) as f:
+                if os.fstat(f.fileno()).st_size > MMAP_MIN_BYTES:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            sha256_hash.update(mapped)
+                        return sha256_hash.hexdigest()
+                    except (OSError, ValueError):
+                        # Can't map this file (e.g. some network shares) - read it instead
+                        sha256_hash = hashlib.sha256()
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    sha256_hash.update(view[:n])
             return sha256_hash.hexdigest()
         except Exception as e:
             return None
     
+    def calculate_head_hash(self, file_path, n=HEAD_BYTES):
+        """
+        Calculate SHA256 hash of the first n bytes of a file
+        
+        Cheap pre-check for duplicate scans: files with different head hashes
+        can't be identical, so only matching heads need a full hash.
+        
+        Returns:
+            str: Hexadecimal hash string, or None if the file can't be read
+        """
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.sha256(f.read(n)).hexdigest()
+        except Exception:
+            return None
+    
+    def cached_file_hash(self, file_path, stat_result=None, pending=None):
+        """
+        Hash a file, reusing the cached hash when size and mtime still match
+        
+        Args:
+            file_path: Path to the file
+            stat_result: os.stat_result for the file if already known (e.g. DirEntry.stat())
+            pending: Optional list collecting new cache rows; the caller stores them
+                     with hash_cache.put_many() once done. Without it each new hash
+                     is written straight away.
+            
+        Returns:
+            str: Hexadecimal hash string, or None if the file can't be read
+        """
+        try:
+            st = stat_result if stat_result is not None else os.stat(file_path)
+        except OSError:
+            return None
+        file_hash = self.hash_cache.get(file_path, st.st_size, st.st_mtime_ns)
+        if file_hash:
+            return file_hash
+        file_hash = self.calculate_file_hash(file_path)
+        if file_hash:
+            self._remember_hash(file_path, st, file_hash, None, pending)
+        return file_hash
+    
+    def cached_head_hash(self, file_path, stat_result=None, pending=None):
+        """Head-hash counterpart of cached_file_hash (same arguments and caching)"""
+        try:
+            st = stat_result if stat_result is not None else os.stat(file_path)
+        except OSError:
+            return None
+        head_hash = self.hash_cache.get(file_path, st.st_size, st.st_mtime_ns, 'head_hash')
+        if head_hash:
+            return head_hash
+        head_hash = self.calculate_head_hash(file_path)
+        if head_hash:
+            self._remember_hash(file_path, st, None, head_hash, pending)
+        return head_hash
+    
+    def _remember_hash(self, file_path, st, file_hash, head_hash, pending):
+        row = (file_path, st.st_size, st.st_mtime_ns, file_hash, head_hash)
+        if pending is not None:
+            pending.append(row)
+        else:
+            self.hash_cache.put_many([row])
+    
     def is_duplicate(self, file_path, verify_exists=False):
         """
         Check if a file is a duplicate based on its hash
@@ -78,7 +203,7 @@ class DuplicateChecker:
             if verify_exists and existing_path != 'unknown location':
                 if not os.path.exists(existing_path):
                     # File was deleted, remove from tracking and allow re-download
-                    del self.file_hashes[file_hash]
+                    self._forget(file_hash)
                     self._save_hashes()
                     return False, None
             
@@ -106,14 +231,14 @@ class DuplicateChecker:
                     file_path = info.get('path')
                     if file_path and not os.path.exists(file_path):
                         # File was deleted, remove from tracking
-                        del self.file_hashes[file_hash]
+                        self._forget(file_hash)
                         self._save_hashes()
                         return False
                 return True
         
         return False
     
-    def add_file(self, file_path, source_url=None, metadata=None):
+    def add_file(self, file_path, source_url=None, metadata=None, file_hash=None):
         """
         Add a file to the duplicate checker
         
@@ -121,8 +246,10 @@ class DuplicateChecker:
             file_path: Path to the downloaded file
             source_url: URL where file was downloaded from
             metadata: Additional metadata (username, subreddit, etc.)
+            file_hash: The file's hash if the caller already has it
         """
-        file_hash = self.calculate_file_hash(file_path)
+        if file_hash is None:
+            file_hash = self.cached_file_hash(file_path)
         if not file_hash:
             return
         
@@ -139,7 +266,9 @@ class DuplicateChecker:
         if metadata:
             info['metadata'] = metadata
         
+        self._forget(file_hash)
         self.file_hashes[file_hash] = info
+        self._index_size(info, 1)
         self._save_hashes()
     
     def scan_existing_files(self, directory, progress_callback=None):
@@ -152,20 +281,23 @@ class DuplicateChecker:
             progress_callback: Optional callback function(message)
         """
         files_added = 0
+        new_hashes = []
         
         for root, dirs, files in os.walk(directory):
             for filename in files:
                 file_path = os.path.join(root, filename)
                 
                 # Skip if already tracked
-                file_hash = self.calculate_file_hash(file_path)
+                file_hash = self.cached_file_hash(file_path, pending=new_hashes)
                 if file_hash and file_hash not in self.file_hashes:
-                    self.add_file(file_path)
+                    self.add_file(file_path, file_hash=file_hash)
                     files_added += 1
                     
                     if progress_callback and files_added % 10 == 0:
                         progress_callback(f"Scanned {files_added} files...")
         
+        self.hash_cache.put_many(new_hashes)
+        
         if progress_callback:
             progress_callback(f"Scan complete! Added {files_added} files to database.")
         
@@ -249,7 +381,7 @@ class DuplicateChecker:
         # Find and remove the hash entry for this file path
         for file_hash, info in list(self.file_hashes.items()):
             if info.get('path') == file_path:
-                del self.file_hashes[file_hash]
+                self._forget(file_hash)
                 self._save_hashes()
                 return True
         return False
@@ -264,7 +396,7 @@ class DuplicateChecker:
         for file_hash, info in list(self.file_hashes.items()):
             file_path = info.get('path')
             if file_path and not os.path.exists(file_path):
-                del self.file_hashes[file_hash]
+                self._forget(file_hash)
                 files_removed += 1
         
         if files_removed > 0:
@@ -275,4 +407,5 @@ class DuplicateChecker:
     def clear_all(self):
         """Clear all tracked files (use with caution!)"""
         self.file_hashes = {}
+        self._rebuild_size_index()
         self._save_hashes()
@@ -3,22 +3,537 @@ GUI Application for Media Scraper Bot
 """
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import font as tkfont
 import threading
 import asyncio
+import errno
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 import os
 import time
 import json
-from .utils import ConfigManager, TextFileManager
+import re
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import webbrowser
+from urllib.parse import urlparse
+from .utils import (ConfigManager, TextFileManager, create_http_adapter,
+                    ensure_download_directory, parse_url_entry, sanitize_filename,
+                    strip_www)
 from .reddit_scraper import RedditScraper
 from .twitter_scraper import TwitterScraper
 from .website_scraper import WebsiteScraper
 from .history import DownloadHistory
 from .sitemap_scanner import SitemapScanner, GalleryDLDownloader
 from .user_manager import UserManager
-from .duplicate_checker import DuplicateChecker
+from .duplicate_checker import HEAD_BYTES, DuplicateChecker
 from .download_queue import DownloadQueue
 
 
+# Characters not allowed in a Twitter handle (matches twitter_scraper normalization)
+_TWITTER_HANDLE_INVALID = re.compile(r'[^A-Za-z0-9_]')
+# Same mapping as a translate table for the (usual) all-ASCII case
+_TWITTER_HANDLE_TABLE = str.maketrans(
+    {chr(c): '_' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')}
+)
+
+# Placeholder text shown in empty date entries
+_DATE_PLACEHOLDER = "YYYY-MM-DD"
+
+
+def _normalize_twitter_handle(raw):
+    """Turn '@name', 'name?x=1' or a profile URL into a bare, filesystem-safe handle"""
+    handle = raw.strip().lstrip('@')
+    if handle.startswith(('http://', 'https://')):
+        try:
+            path = urlparse(handle).path
+        except ValueError:
+            # Malformed netloc (e.g. unbalanced '['); fall back to the raw text
+            path = ''
+        for seg in path.split('/'):
+            if seg:
+                handle = seg
+                break
+    handle = handle.partition('?')[0].partition('#')[0]
+    if handle.isascii():
+        handle = handle.translate(_TWITTER_HANDLE_TABLE)
+    else:
+        handle = _TWITTER_HANDLE_INVALID.sub('_', handle)
+    return handle or 'user'
+
+
+def _total_size_bytes(paths):
+    """Sum file sizes with one stat() per path, skipping files that are gone"""
+    total = 0
+    for path in paths:
+        try:
+            total += os.stat(path).st_size
+        except OSError:
+            pass
+    return total
+
+
+def _scan_tree(root, keep_dir=None):
+    """Walk root like os.walk (top-down, symlinked folders not followed), yielding
+    (dirpath, file DirEntry list) per folder. Entries carry their own cached type
+    and stat data. keep_dir(entry) may return False to skip a subfolder."""
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry)
+                    elif not entry.is_symlink() and (keep_dir is None or keep_dir(entry)):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        yield dirpath, files
+        stack.extend(reversed(subdirs))
+
+
+def _size_buckets(files):
+    """Group (size, path) pairs by size, yielding (size, [paths]) in size order
+    (paths keep their input order). The pairs are spilled to a temporary SQLite
+    file instead of a dict, so memory is bounded by the largest bucket rather
+    than the number of files."""
+    fd, db_path = tempfile.mkstemp(prefix='sizes_', suffix='.db')
+    os.close(fd)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE sized (size INTEGER, path TEXT)")
+        batch = []
+        for item in files:
+            batch.append(item)
+            if len(batch) >= 10000:
+                conn.executemany("INSERT INTO sized VALUES (?, ?)", batch)
+                batch.clear()
+        conn.executemany("INSERT INTO sized VALUES (?, ?)", batch)
+        conn.commit()
+        current, paths = None, []
+        for size, path in conn.execute("SELECT size, path FROM sized ORDER BY size, rowid"):
+            if size != current:
+                if paths:
+                    yield current, paths
+                current, paths = size, []
+            paths.append(path)
+        if paths:
+            yield current, paths
+    finally:
+        conn.close()
+        try:
+            os.remove(db_path)
+        except OSError:
+            pass
+
+
+def _sized_files(root):
+    """(size, path) for every file under root, for _size_buckets"""
+    for _, entries in _scan_tree(root):
+        for entry in entries:
+            try:
+                yield entry.stat().st_size, entry.path
+            except OSError:
+                continue
+
+
+def _compile_file_filter(dest_abs, exclude_re, include_exts, min_size, is_hidden=None):
+    """Bind the Filters settings once and return passes(entry) -> stat or None.
+    Used per file by the preserve-structure sweep, so no dict lookups in the loop."""
+    search = exclude_re.search if exclude_re else None
+    splitext = os.path.splitext
+
+    def passes(entry):
+        fp = entry.path
+        if fp.lower().startswith(dest_abs):
+            return None
+        # exclude_re is case-insensitive, no need to lowercase first
+        if search and search(fp):
+            return None
+        if include_exts and splitext(entry.name)[1].lower() not in include_exts:
+            return None
+        try:
+            st = entry.stat()
+        except OSError:
+            return None
+        if st.st_size < min_size:
+            return None
+        if is_hidden and is_hidden(fp, st):
+            return None
+        return st
+
+    return passes
+
+
+def _existing_paths(paths):
+    """The subset of paths that exist, listing each parent folder once instead of
+    stat'ing every file"""
+    by_dir = {}
+    for fp in paths:
+        by_dir.setdefault(os.path.dirname(fp), []).append(fp)
+    found = set()
+    for dirname, group in by_dir.items():
+        try:
+            with os.scandir(dirname or '.') as it:
+                names = {os.path.normcase(entry.name) for entry in it}
+        except OSError:
+            continue
+        found.update(fp for fp in group if os.path.normcase(os.path.basename(fp)) in names)
+    return found
+
+
+def _with_stat(paths):
+    """(path, stat) for each path that still exists"""
+    for fp in paths:
+        try:
+            yield fp, os.stat(fp)
+        except OSError:
+            continue
+
+
+def _fast_move(src, dst):
+    """Move a file with a single rename, falling back to shutil.move across drives.
+    os.rename (not os.replace) so Windows still refuses to overwrite an existing dst."""
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+# Settings-tab fields persisted by save_settings()
+_TWITTER_CREDENTIAL_FIELDS = (
+    ('bearer_token', 'twitter_bearer'),
+    ('api_key', 'twitter_api_key'),
+    ('api_secret', 'twitter_api_secret'),
+    ('access_token', 'twitter_access_token'),
+    ('access_token_secret', 'twitter_access_secret'),
+)
+
+_ONLYFANS_OPTION_KEYS = (
+    'download_posts',
+    'download_paid_posts',
+    'download_messages',
+    'download_paid_messages',
+    'download_stories',
+    'download_highlights',
+    'download_archived',
+    'download_streams',
+    'download_images',
+    'download_videos',
+    'download_audios',
+    'download_avatar_header',
+    'folder_per_post',
+    'folder_per_paid_post',
+    'folder_per_message',
+    'folder_per_paid_message',
+    'skip_ads',
+    'ignore_own_messages',
+    'include_expired',
+    'include_restricted',
+    'download_duplicates',
+    'download_incrementally',
+)
+
+
+# OF-DL config.json key -> (onlyfans.* setting, default)
+_OFDL_OPTION_FIELDS = (
+    ("DownloadPosts", 'download_posts', True),
+    ("DownloadPaidPosts", 'download_paid_posts', True),
+    ("DownloadMessages", 'download_messages', True),
+    ("DownloadPaidMessages", 'download_paid_messages', True),
+    ("DownloadStories", 'download_stories', True),
+    ("DownloadHighlights", 'download_highlights', True),
+    ("DownloadArchived", 'download_archived', True),
+    ("DownloadStreams", 'download_streams', True),
+    ("DownloadImages", 'download_images', True),
+    ("DownloadVideos", 'download_videos', True),
+    ("DownloadAudios", 'download_audios', True),
+    ("DownloadAvatarHeaderPhoto", 'download_avatar_header', True),
+    ("FolderPerPost", 'folder_per_post', False),
+    ("FolderPerPaidPost", 'folder_per_paid_post', False),
+    ("FolderPerMessage", 'folder_per_message', False),
+    ("FolderPerPaidMessage", 'folder_per_paid_message', False),
+    ("SkipAds", 'skip_ads', False),
+    ("IgnoreOwnMessages", 'ignore_own_messages', False),
+    ("IncludeExpiredSubscriptions", 'include_expired', False),
+    ("IncludeRestrictedSubscriptions", 'include_restricted', False),
+    ("DownloadDuplicatedMedia", 'download_duplicates', False),
+    ("DownloadPostsIncrementally", 'download_incrementally', False),
+)
+
+# Keys only written when creating a fresh OF-DL config.json
+_OFDL_NEW_CONFIG_DEFAULTS = {
+    "NonInteractiveMode": False,
+    "LoggingLevel": "Information",
+}
+
+# Expired/deleted accounts: grab everything while the accounts are still accessible
+# (folder layout still follows the GUI settings)
+_OFDL_EXPIRED_OVERRIDES = {
+    "DownloadPosts": True,
+    "DownloadPaidPosts": True,
+    "DownloadMessages": True,
+    "DownloadPaidMessages": True,
+    "DownloadStories": True,
+    "DownloadHighlights": True,
+    "DownloadArchived": True,
+    "DownloadStreams": True,
+    "DownloadImages": True,
+    "DownloadVideos": True,
+    "DownloadAudios": True,
+    "DownloadAvatarHeaderPhoto": True,
+    "SkipAds": True,
+    "IgnoreOwnMessages": True,
+    "IncludeExpiredSubscriptions": True,  # KEY: Include expired
+    "IncludeRestrictedSubscriptions": True,  # KEY: Include restricted/deleted
+    "DownloadDuplicatedMedia": False,
+    "DownloadPostsIncrementally": False,
+}
+
+# Paid content only: paid posts/messages (plus archived, which may contain paid content)
+_OFDL_PAID_OVERRIDES = {
+    "DownloadPosts": False,
+    "DownloadPaidPosts": True,
+    "DownloadMessages": False,
+    "DownloadPaidMessages": True,
+    "DownloadStories": False,
+    "DownloadHighlights": False,
+    "DownloadArchived": True,
+    "DownloadStreams": False,
+    "DownloadImages": True,
+    "DownloadVideos": True,
+    "DownloadAudios": True,
+    "DownloadAvatarHeaderPhoto": False,
+    "FolderPerPaidPost": True,
+    "FolderPerPaidMessage": True,
+    "SkipAds": True,
+    "IgnoreOwnMessages": True,
+    "IncludeExpiredSubscriptions": True,  # Include expired to get all paid content
+    "IncludeRestrictedSubscriptions": True,
+    "DownloadDuplicatedMedia": False,
+}
+
+# Static help, about and statistics text used by the dialogs in ScraperGUI
+_REDDIT_HELP_TEXT = """
+This scraper uses gallery-dl to download Reddit content.
+No Reddit API credentials are needed!
+
+How to use:
+
+1. Enter a subreddit name (e.g., "pics", "wallpapers")
+   OR a Reddit username
+
+2. Click "Scrape" to download media
+
+3. gallery-dl will automatically download:
+   • Images from posts
+   • Videos from posts
+   • Gallery albums
+   • Crossposts
+
+Note: gallery-dl scrapes public Reddit content without authentication.
+For private or age-restricted content, you may need to configure
+browser cookies in gallery-dl's configuration file.
+
+"""
+
+_TWITTER_HELP_STEPS = """
+2. Sign up for a Developer Account:
+   • Click "Sign up" in the top right
+   • Apply for a developer account
+   • Fill out the application form
+   • Wait for approval (usually instant to 24 hours)
+
+3. Create a Project & App:
+   • Go to Developer Portal
+   • Create a new Project
+   • Create a new App within the Project
+
+4. Generate Keys:
+   • Go to your App's "Keys and tokens" tab
+   • Generate/Regenerate:
+     - API Key & API Secret
+     - Bearer Token
+     - Access Token & Access Token Secret
+
+5. Copy all credentials to Settings tab:
+   • Bearer Token (required for Twitter API v2)
+   • API Key, API Secret
+   • Access Token, Access Token Secret
+
+"""
+
+_ONLYFANS_HELP_TEXT = """📝 OnlyFans API Access (Advanced Users)
+
+⚠️ WARNING: Direct OnlyFans API access is complex and may violate their Terms of Service.
+OF-DL is the recommended method for most users.
+
+If OF-DL stops working and you need direct API access:
+
+Method 1: Browser Developer Tools (Easiest)
+═══════════════════════════════════════════
+
+1. Log into OnlyFans in your browser (Chrome/Firefox)
+
+2. Open Developer Tools (F12)
+
+3. Go to "Network" tab
+
+4. Click on any OnlyFans request
+
+5. Look for these headers:
+   • Cookie: (contains auth_id and sess values)
+   • User-Agent: Your browser's user agent
+   • x-bc: Browser fingerprint token
+
+6. Important values to extract:
+   • sess: Session token
+   • auth_id: Authentication ID
+   • user-agent: Browser identifier
+   • x-bc: Security token
+
+Method 2: Manual API Calls
+═══════════════════════════
+
+OnlyFans uses these endpoints:
+• https://onlyfans.com/api2/v2/users/me
+• https://onlyfans.com/api2/v2/subscriptions/subscribes
+• https://onlyfans.com/api2/v2/posts/{userId}
+
+Required headers for API calls:
+• Cookie: auth_id={your_auth_id}; sess={your_sess};
+• User-Agent: {your_browser_user_agent}
+• x-bc: {browser_checksum}
+• Accept: application/json
+
+⚠️ IMPORTANT NOTES:
+═══════════════════
+
+• Session tokens expire regularly (need to re-extract)
+• OnlyFans actively blocks automated access
+• This may violate OnlyFans Terms of Service
+• Account suspension risk if detected
+• Headers change frequently - no guarantee this will work
+
+RECOMMENDATION:
+═══════════════
+
+Use OF-DL (https://git.ofdl.tools/sim0n00ps/OF-DL) instead:
+✓ Handles authentication automatically
+✓ Uses browser-based login (more reliable)
+✓ Maintained by the community
+✓ Updates when OnlyFans changes API
+
+Only attempt direct API access if:
+• You understand the risks
+• OF-DL is not working
+• You have programming experience
+• You accept potential account suspension
+
+For most users, waiting for OF-DL updates is safer.
+"""
+
+_ABOUT_TEXT = """🎬 Media Scraper Bot v2.0
+
+A comprehensive media downloader for:
+• Reddit (subreddits & users)
+• Twitter/X (user timelines)
+• Websites (any URL)
+• OnlyFans (via OF-DL)
+
+Features:
+✓ 100% Duplicate Detection (SHA256)
+✓ Active/Inactive User Management
+✓ Download History Tracking
+✓ Folder Organization
+✓ Discord Bot Integration
+
+Created with ❤️ for archiving
+"""
+
+_STATS_TEMPLATE = """📊 Statistics
+
+User Management:
+Reddit Users: {reddit_active} active, {reddit_inactive} inactive
+Subreddits: {subreddits_active} active, {subreddits_inactive} inactive
+Twitter Users: {twitter_active} active, {twitter_inactive} inactive
+Websites: {websites_active} active, {websites_inactive} inactive
+
+Download History:
+Reddit: {history_reddit} tracked posts
+Twitter: {history_twitter} tracked tweets
+Websites: {history_websites} tracked URLs
+
+Duplicate Detection:
+{total_files} unique files tracked by SHA256 hash
+"""
+
+# Body of show_history_stats(); filled from DownloadHistory and DuplicateChecker statistics
+_HISTORY_STATS_TEMPLATE = """Download History Statistics:
+
+Reddit:
+  - {total_reddit_sources} sources tracked
+  - {total_reddit_posts} posts seen
+
+Twitter:
+  - {total_twitter_sources} users tracked
+  - {total_twitter_tweets} tweets seen
+
+Websites:
+  - {total_websites} websites tracked
+  - {total_website_urls} URLs seen
+
+""" + "=" * 40 + """
+
+Downloaded Files:
+  - {video_count} videos
+  - {image_count} images
+  - {other_count} other files
+  - {total_files} total files
+
+Total Size: {total_size_gb:.2f} GB ({total_size_mb:.2f} MB)
+"""
+
+
+class _ScrollableDialog(tk.Toplevel):
+    """Transient Toplevel whose body is a vertically scrollable frame (self.content)"""
+    
+    def __init__(self, master, title, size):
+        super().__init__(master)
+        self.title(title)
+        self.geometry(size)
+        self.transient(master)
+        
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill='both', expand=True)
+        canvas = tk.Canvas(main_frame, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = ttk.Frame(canvas)
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.pack(side=tk.LEFT, fill='both', expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill='y')
+        
+        self.content = ttk.Frame(scrollable_frame, padding=10)
+        self.content.pack(fill='both', expand=True)
+
+
 class ScraperGUI:
     """Main GUI application for the scraper bot"""
 
@@ -26,6 +541,7 @@ class ScraperGUI:
         """Save the activity log to a file."""
         if not log_path:
             log_path = os.path.join(self.botfiles_dir, 'scraper_activity.log')
+        self._flush_log()
         try:
             with open(log_path, 'w', encoding='utf-8') as f:
                 f.write(self.log_text.get('1.0', 'end'))
@@ -112,7 +628,6 @@ class ScraperGUI:
                         deleted_count += 1
                     except PermissionError:
                         # Try using rmdir command with force
-                        import subprocess
                         try:
                             result = subprocess.run(['rmdir', '/S', '/Q', root], 
                                                   capture_output=True, 
@@ -145,11 +660,13 @@ class ScraperGUI:
         if error_count > 0:
             self.log(f"⚠ {error_count} errors occurred (protected system folders)")
 
-    def organize_downloads(self):
+    def organize_downloads(self, base_path=None):
         """Organize files in the base download folder into videos/images/gifs/others.
         Operates per top-level folder inside the base path. Updates duplicate tracker paths.
         """
-        base_path = str(self.config.get('downloads.base_path', 'Downloads'))
+        if base_path is None:
+            base_path = self.config.get('downloads.base_path', 'Downloads')
+        base_path = str(base_path)
         if not os.path.exists(base_path):
             self.log(f"Download path does not exist: {base_path}")
             return
@@ -218,7 +735,6 @@ class ScraperGUI:
                         dest = os.path.join(dest_dir, f"{base_name} ({counter}){ext}")
                         counter += 1
                     try:
-                        import shutil
                         shutil.move(src, dest)
                         # Update duplicate tracker
                         try:
@@ -246,7 +762,6 @@ class ScraperGUI:
                 dest = os.path.join(dest_dir, f"{base_name} ({counter}){ext}")
                 counter += 1
             try:
-                import shutil
                 shutil.move(src, dest)
                 try:
                     self.duplicate_checker.remove_file(src)
@@ -262,6 +777,12 @@ class ScraperGUI:
     
     def __init__(self, root):
         self.root = root
+        # Keep the window hidden while the tabs are built so geometry is solved once on first map
+        self.root.withdraw()
+        # Pending log lines; any thread appends, the Tk thread drains them (see _poll_log)
+        self._log_queue = deque()
+        # Lines for mirror logs that were off screen, keyed by widget path (see _mirror_log)
+        self._log_backlog = {}
         self.root.title("🎬 Media Scraper Bot")
         self.root.geometry("1200x800")
         self.root.minsize(900, 600)
@@ -270,6 +791,18 @@ class ScraperGUI:
         self.style = ttk.Style()
         self.current_theme = 'light'
         
+        # Shared font objects (one Tk font reused by every bold label)
+        self.bold_font = tkfont.Font(font=('TkDefaultFont', 9, 'bold'))
+        # Monospaced log font; tab stops are measured once here rather than per widget
+        self.log_font = tkfont.Font(font='TkFixedFont')
+        self.log_tabs = (self.log_font.measure('0' * 8),)
+        # Default window background, queried once for widgets that should blend into dialogs
+        self._default_bg = self.root.cget('bg')
+        # Heading fonts shared by help dialogs and the named label styles
+        self.heading_font = tkfont.Font(font=('TkDefaultFont', 12, 'bold'))
+        self.subheading_font = tkfont.Font(font=('TkDefaultFont', 10, 'bold'))
+        self._configure_named_styles()
+        
         # Try to set window icon
         try:
             icon_path = os.path.join(os.path.dirname(__file__), 'icon.ico')
@@ -311,6 +844,12 @@ class ScraperGUI:
         # Website scraping state for resume functionality
         self.website_scrape_state_file = os.path.join(botfiles_dir, 'website_scrape_state.json')
         self.website_scrape_state = self._load_website_scrape_state()
+        # Pending debounced state write (see _schedule_website_scrape_state_save)
+        self._state_lock = threading.Lock()
+        self._state_timer = None
+        
+        # One connection pool shared by every requests-based scraper
+        self.http_adapter = create_http_adapter(pool_connections=20, pool_maxsize=40)
         
         # Initialize scrapers (will be created when needed)
         self.reddit_scraper = None
@@ -319,13 +858,33 @@ class ScraperGUI:
         self.website_scraper = self._create_website_scraper()
         
         # Initialize sitemap scanner and gallery-dl downloader
-        self.sitemap_scanner = SitemapScanner()
+        self.sitemap_scanner = SitemapScanner(http_adapter=self.http_adapter)
         self.gallery_dl = GalleryDLDownloader()
         
         # Progress tracking
         self.current_progress = 0
         self.total_items = 0
         self.progress_label_var = tk.StringVar(value="Ready")
+        self._progress_commit_id = None  # pending status-bar redraw (see update_progress)
+        self._idle_dirty = False  # status text changed since the last _idle_pulse
+        self._ofdl_exists_cache = None  # (path, exists, checked_at) for _ofdl_path_exists
+        self._ofdl_config_cache = None  # ((path, mtime_ns, size), dict) for _update_ofdl_config
+        # Duplicates-tab progress: worker slot and what the 100 ms tick last drew
+        self._dup_update_pending = None
+        self._dup_update_drawn = None
+        self._dup_update_id = None
+        # Help dialogs are built on first open, then hidden/re-shown
+        self._help_dialogs = {}
+        # Last contents written to each user/subreddit listbox (see _sync_listbox)
+        self._listbox_snapshots = {}
+        # Contents for listboxes on hidden tabs, applied when they are mapped
+        self._pending_listbox_items = {}
+        # (cache key, text) of the last Statistics dialog
+        self._stats_cache = None
+        # kind -> (user_manager revision, frozenset of active names), see _is_active_user
+        self._active_user_sets = {}
+        # Dotted config keys of checkbox settings changed since the last save
+        self._dirty_settings = set()
         
         # Create menu bar
         self._create_menu_bar()
@@ -346,6 +905,23 @@ class ScraperGUI:
         self.create_duplicates_tab()
         self.create_settings_tab()
         
+        # Remember which user/subreddit listbox was used last (remove_* asks it first),
+        # and fill listboxes on hidden tabs only when they are shown
+        self._last_listbox_focus = None
+        for listbox in (self.subreddit_active_listbox, self.subreddit_inactive_listbox,
+                        self.reddit_user_active_listbox, self.reddit_user_inactive_listbox,
+                        self.twitter_user_active_listbox, self.twitter_user_inactive_listbox,
+                        self.website_active_listbox, self.website_inactive_listbox):
+            listbox.bind('<FocusIn>', lambda e, lb=listbox: setattr(self, '_last_listbox_focus', lb))
+            listbox.bind('<Map>', lambda e, lb=listbox: self._on_listbox_map(lb))
+        
+        # Checkbox settings mark themselves dirty so save_settings writes only what changed
+        setting_vars = {f'onlyfans.{key}': getattr(self, f'of_{key}') for key in _ONLYFANS_OPTION_KEYS}
+        setting_vars['downloads.redownload_deleted_files'] = self.redownload_deleted
+        self._setting_vars = setting_vars
+        for key, var in setting_vars.items():
+            var.trace_add('write', lambda *args, k=key: self._dirty_settings.add(k))
+        
         # Status bar frame
         status_frame = tk.Frame(root, bd=1, relief=tk.SUNKEN)
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
@@ -360,9 +936,21 @@ class ScraperGUI:
         self.progress_bar.pack(side=tk.RIGHT, padx=5, pady=2)
         self.progress_bar.pack_forget()  # Hide initially
         
+        # All widgets exist now - show the window
+        self.root.deiconify()
+        self.root.after(50, self._poll_log)
+        self.root.after(50, self._idle_pulse)
+        
         # Download progress
         self.is_downloading = False
-        self.is_paused = False
+        # Set while running, cleared while paused; scrape threads block on it (see wait_if_paused)
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # External programs (OF-DL, notepad) are started here, off the Tk thread
+        self._proc_pool = ThreadPoolExecutor(max_workers=2)
+        # Cleared while a post-scrape organize pass runs (see _organize_after_scrape)
+        self._organize_idle = threading.Event()
+        self._organize_idle.set()
         
         # Show disclaimer on first launch
         self.root.after(100, self._show_first_launch_disclaimer)
@@ -713,7 +1301,7 @@ Ctrl+Tab - Switch Between Tabs"""
         active_frame = ttk.Frame(lists_frame)
         active_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(0, 5))
         
-        ttk.Label(active_frame, text="Active (Will be scraped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(active_frame, text="Active (Will be scraped)", font=self.bold_font).pack()
         active_scroll = ttk.Scrollbar(active_frame)
         active_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -734,7 +1322,7 @@ Ctrl+Tab - Switch Between Tabs"""
         inactive_frame = ttk.Frame(lists_frame)
         inactive_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(5, 0))
         
-        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=self.bold_font).pack()
         inactive_scroll = ttk.Scrollbar(inactive_frame)
         inactive_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -767,12 +1355,12 @@ Ctrl+Tab - Switch Between Tabs"""
         ttk.Label(date_frame, text="From:").pack(side=tk.LEFT, padx=(10, 2))
         self.subreddit_start_date = ttk.Entry(date_frame, width=12)
         self.subreddit_start_date.pack(side=tk.LEFT, padx=2)
-        self.subreddit_start_date.insert(0, "YYYY-MM-DD")
+        self.subreddit_start_date.insert(0, _DATE_PLACEHOLDER)
         
         ttk.Label(date_frame, text="To:").pack(side=tk.LEFT, padx=(10, 2))
         self.subreddit_end_date = ttk.Entry(date_frame, width=12)
         self.subreddit_end_date.pack(side=tk.LEFT, padx=2)
-        self.subreddit_end_date.insert(0, "YYYY-MM-DD")
+        self.subreddit_end_date.insert(0, _DATE_PLACEHOLDER)
         
         ttk.Label(date_frame, text="(leave blank for all posts)", foreground="gray", font=('TkDefaultFont', 8)).pack(side=tk.LEFT, padx=5)
         
@@ -803,7 +1391,7 @@ Ctrl+Tab - Switch Between Tabs"""
         active_frame2 = ttk.Frame(lists_frame2)
         active_frame2.pack(side=tk.LEFT, fill='both', expand=True, padx=(0, 5))
         
-        ttk.Label(active_frame2, text="Active (Will be scraped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(active_frame2, text="Active (Will be scraped)", font=self.bold_font).pack()
         active_scroll2 = ttk.Scrollbar(active_frame2)
         active_scroll2.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -824,7 +1412,7 @@ Ctrl+Tab - Switch Between Tabs"""
         inactive_frame2 = ttk.Frame(lists_frame2)
         inactive_frame2.pack(side=tk.LEFT, fill='both', expand=True, padx=(5, 0))
         
-        ttk.Label(inactive_frame2, text="Inactive (Skipped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(inactive_frame2, text="Inactive (Skipped)", font=self.bold_font).pack()
         inactive_scroll2 = ttk.Scrollbar(inactive_frame2)
         inactive_scroll2.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -860,7 +1448,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Current operation label
         self.reddit_current_op_var = tk.StringVar(value="Ready to scrape...")
         current_op_label = ttk.Label(progress_frame, textvariable=self.reddit_current_op_var, 
-                                     font=('TkDefaultFont', 9, 'bold'))
+                                     font=self.bold_font)
         current_op_label.pack(anchor=tk.W, pady=(0, 5))
         
         # Progress bar
@@ -871,6 +1459,7 @@ Ctrl+Tab - Switch Between Tabs"""
         
         # Progress stats
         self.reddit_progress_text_var = tk.StringVar(value="0 / 0 items (0%)")
+        self._reddit_progress_key = None  # (done, total, unit) last shown
         progress_text_label = ttk.Label(progress_frame, textvariable=self.reddit_progress_text_var)
         progress_text_label.pack(anchor=tk.W)
         
@@ -900,7 +1489,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Active list
         active_frame = ttk.Frame(lists_frame)
         active_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(0, 5))
-        ttk.Label(active_frame, text="Active (Will be scraped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(active_frame, text="Active (Will be scraped)", font=self.bold_font).pack()
         active_scroll = ttk.Scrollbar(active_frame)
         active_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.twitter_user_active_listbox = tk.Listbox(active_frame, yscrollcommand=active_scroll.set, height=12,
@@ -918,7 +1507,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Inactive list
         inactive_frame = ttk.Frame(lists_frame)
         inactive_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(5, 0))
-        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=self.bold_font).pack()
         inactive_scroll = ttk.Scrollbar(inactive_frame)
         inactive_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.twitter_user_inactive_listbox = tk.Listbox(inactive_frame, yscrollcommand=inactive_scroll.set, height=12,
@@ -976,7 +1565,7 @@ Ctrl+Tab - Switch Between Tabs"""
         active_frame = ttk.Frame(lists_frame)
         active_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(0, 5))
         
-        ttk.Label(active_frame, text="Active (Will be scraped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(active_frame, text="Active (Will be scraped)", font=self.bold_font).pack()
         active_scroll = ttk.Scrollbar(active_frame)
         active_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -997,7 +1586,7 @@ Ctrl+Tab - Switch Between Tabs"""
         inactive_frame = ttk.Frame(lists_frame)
         inactive_frame.pack(side=tk.LEFT, fill='both', expand=True, padx=(5, 0))
         
-        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=('TkDefaultFont', 9, 'bold')).pack()
+        ttk.Label(inactive_frame, text="Inactive (Skipped)", font=self.bold_font).pack()
         inactive_scroll = ttk.Scrollbar(inactive_frame)
         inactive_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -1078,7 +1667,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Disclaimer
         disclaimer_frame = ttk.Frame(info_frame)
         disclaimer_frame.pack(fill='x', pady=(5, 10))
-        ttk.Label(disclaimer_frame, text="⚠️ DISCLAIMER:", foreground="red", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w')
+        ttk.Label(disclaimer_frame, text="⚠️ DISCLAIMER:", foreground="red", font=self.bold_font).pack(anchor='w')
         disclaimer_text = "OF-DL is a third-party tool (not created by us). It may stop working if OnlyFans changes their API or security. For direct API access, see instructions below."
         ttk.Label(disclaimer_frame, text=disclaimer_text, foreground="#d35400", font=('TkDefaultFont', 8), wraplength=500, justify='left').pack(anchor='w', pady=(2, 5))
         
@@ -1150,8 +1739,15 @@ Ctrl+Tab - Switch Between Tabs"""
         row.pack(fill='x', pady=2)
         ttk.Label(row, text="Drive:").pack(side=tk.LEFT, padx=(0,4))
         self.drive_select_var = tk.StringVar()
-        self.drive_select_combo = ttk.Combobox(row, textvariable=self.drive_select_var, width=8, state='readonly')
-        self.drive_select_combo.pack(side=tk.LEFT)
+        # Treeview only draws the visible rows, so long drive/share lists stay cheap
+        self.drive_tv = ttk.Treeview(row, columns=('label', 'free', 'total'), show='headings',
+                                     height=4, selectmode='browse')
+        for col, heading, width in (('label', 'Drive', 60), ('free', 'Free', 90), ('total', 'Total', 90)):
+            self.drive_tv.heading(col, text=heading)
+            self.drive_tv.column(col, width=width, anchor='w', stretch=False)
+        self.drive_tv.pack(side=tk.LEFT)
+        self.drive_tv.bind('<<TreeviewSelect>>', self._on_drive_select)
+        self.drive_tv.bind('<Double-1>', lambda e: self.run_selected_drive_preserve_duplicates())
         ttk.Button(row, text="Refresh", command=self.refresh_drive_list, width=10).pack(side=tk.LEFT, padx=6)
         
         # Folder path option
@@ -1166,7 +1762,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Global sweep button
         row_global = ttk.Frame(quick_frame)
         row_global.pack(fill='x', pady=6)
-        ttk.Label(row_global, text="⚡ Quick action:", font=('TkDefaultFont', 9, 'bold')).pack(side=tk.LEFT, padx=(0,4))
+        ttk.Label(row_global, text="⚡ Quick action:", font=self.bold_font).pack(side=tk.LEFT, padx=(0,4))
         ttk.Button(row_global, text="Global Sweep (All Downloads)", command=self.run_global_sweep, width=30).pack(side=tk.LEFT, padx=6)
         ttk.Label(row_global, text="← Scans entire Downloads folder for duplicates", foreground="gray").pack(side=tk.LEFT)
         
@@ -1213,6 +1809,9 @@ Ctrl+Tab - Switch Between Tabs"""
         ttk.Label(row2, text="Min size (MB):").pack(side=tk.LEFT, padx=(10,4))
         self.filter_min_size_mb = tk.StringVar(value="0")
         ttk.Entry(row2, textvariable=self.filter_min_size_mb, width=8).pack(side=tk.LEFT)
+        ttk.Label(row2, text="Hash threads:").pack(side=tk.LEFT, padx=(10,4))
+        self.filter_hash_threads = tk.StringVar(value="4")
+        ttk.Spinbox(row2, from_=1, to=32, textvariable=self.filter_hash_threads, width=4).pack(side=tk.LEFT)
 
         # Row 3: Exclusions and attributes
         row3 = ttk.Frame(filters_frame)
@@ -1228,7 +1827,7 @@ Ctrl+Tab - Switch Between Tabs"""
         manage_frame.pack(fill='x', padx=10, pady=5)
         self.dup_manage_frame = manage_frame
         
-        ttk.Label(manage_frame, text="After scanning, manage found duplicates:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0, 5))
+        ttk.Label(manage_frame, text="After scanning, manage found duplicates:", font=self.bold_font).pack(anchor='w', pady=(0, 5))
         
         btn_row4 = ttk.Frame(manage_frame)
         btn_row4.pack(fill='x', pady=2)
@@ -1241,7 +1840,7 @@ Ctrl+Tab - Switch Between Tabs"""
         self.dup_organizer_frame = organizer_frame
         
         ttk.Label(organizer_frame, text="Search a directory for media files and move them to a destination folder", 
-                 font=('TkDefaultFont', 9, 'bold'), foreground='#2980b9').pack(anchor='w', pady=(0, 5))
+                 font=self.bold_font, foreground='#2980b9').pack(anchor='w', pady=(0, 5))
         
         # Source directory
         org_row1 = ttk.Frame(organizer_frame)
@@ -1310,6 +1909,12 @@ Ctrl+Tab - Switch Between Tabs"""
         log_frame = ttk.LabelFrame(scrollable, text="Activity Log", padding=10)
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         self.dup_log_frame = log_frame
+        # Hidden while the log is maximized, re-packed in this order afterwards
+        self._dup_collapsible_frames = (
+            self.dup_info_frame, self.dup_quick_frame, self.dup_filters_frame,
+            self.dup_manage_frame, self.dup_stats_frame, self.dup_prog_frame,
+        )
+        self.dup_log_max = False
         log_header = ttk.Frame(log_frame)
         log_header.pack(fill='x')
         ttk.Button(log_header, text="Pop‑out Log", command=self.open_floating_log, width=14).pack(side=tk.LEFT)
@@ -1318,11 +1923,14 @@ Ctrl+Tab - Switch Between Tabs"""
 
         log_container = ttk.Frame(log_frame)
         log_container.pack(fill='both', expand=True, pady=(6,0))
-        self.dup_log_text = tk.Text(log_container, height=16, wrap='word')
+        self.dup_log_text = tk.Text(log_container, height=16, wrap='word',
+                                    font=self.log_font, tabs=self.log_tabs)
         dup_log_scroll = ttk.Scrollbar(log_container, orient='vertical', command=self.dup_log_text.yview)
         self.dup_log_text.configure(yscrollcommand=dup_log_scroll.set)
         self.dup_log_text.pack(side=tk.LEFT, fill='both', expand=True)
         dup_log_scroll.pack(side=tk.RIGHT, fill='y')
+        self.dup_log_text.bind('<Map>', lambda e: self._mirror_log(
+            self.dup_log_text, (), lambda text: self._append_log(self.dup_log_text, text)))
     
     def create_settings_tab(self):
         """Create settings configuration tab"""
@@ -1373,7 +1981,7 @@ Ctrl+Tab - Switch Between Tabs"""
         reddit_help_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Label(reddit_frame, text="ℹ️ Reddit scraping uses gallery-dl (no API key needed)", 
-                 foreground='#27ae60', font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=5)
+                 foreground='#27ae60', font=self.bold_font).pack(anchor='w', pady=5)
         ttk.Label(reddit_frame, text="gallery-dl will be automatically used for downloading Reddit content.", 
                  wraplength=500).pack(anchor='w', pady=2)
         
@@ -1423,7 +2031,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Content Type Options (Column 1)
         content_col = ttk.Frame(onlyfans_options_frame)
         content_col.grid(row=0, column=0, sticky='nw', padx=5)
-        ttk.Label(content_col, text="📥 Content Types:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(content_col, text="📥 Content Types:", font=self.bold_font).pack(anchor='w', pady=(0,4))
         
         self.of_download_posts = tk.BooleanVar(value=bool(self.config.get('onlyfans.download_posts', True)))
         ttk.Checkbutton(content_col, text="Download Posts (free)", variable=self.of_download_posts).pack(anchor='w', pady=1)
@@ -1452,7 +2060,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Media Type Options (Column 2)
         media_col = ttk.Frame(onlyfans_options_frame)
         media_col.grid(row=0, column=1, sticky='nw', padx=5)
-        ttk.Label(media_col, text="🎬 Media Types:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(media_col, text="🎬 Media Types:", font=self.bold_font).pack(anchor='w', pady=(0,4))
         
         self.of_download_images = tk.BooleanVar(value=bool(self.config.get('onlyfans.download_images', True)))
         ttk.Checkbutton(media_col, text="Download Images", variable=self.of_download_images).pack(anchor='w', pady=1)
@@ -1469,7 +2077,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Organization Options (Column 3)
         org_col = ttk.Frame(onlyfans_options_frame)
         org_col.grid(row=0, column=2, sticky='nw', padx=5)
-        ttk.Label(org_col, text="📁 Organization:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(org_col, text="📁 Organization:", font=self.bold_font).pack(anchor='w', pady=(0,4))
         
         self.of_folder_per_post = tk.BooleanVar(value=bool(self.config.get('onlyfans.folder_per_post', False)))
         ttk.Checkbutton(org_col, text="Folder per Post", variable=self.of_folder_per_post).pack(anchor='w', pady=1)
@@ -1486,7 +2094,7 @@ Ctrl+Tab - Switch Between Tabs"""
         # Advanced Options (Column 4)
         advanced_col = ttk.Frame(onlyfans_options_frame)
         advanced_col.grid(row=0, column=3, sticky='nw', padx=5)
-        ttk.Label(advanced_col, text="⚙️ Advanced:", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(advanced_col, text="⚙️ Advanced:", font=self.bold_font).pack(anchor='w', pady=(0,4))
         
         self.of_skip_ads = tk.BooleanVar(value=bool(self.config.get('onlyfans.skip_ads', False)))
         ttk.Checkbutton(advanced_col, text="Skip Ads (#ad posts)", variable=self.of_skip_ads).pack(anchor='w', pady=1)
@@ -1541,7 +2149,7 @@ Ctrl+Tab - Switch Between Tabs"""
         web_auth_help_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Label(web_auth_frame, text="ℹ️ Add cookies and custom headers for sites that require authentication", 
-                 foreground='#e67e22', font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=5)
+                 foreground='#e67e22', font=self.bold_font).pack(anchor='w', pady=5)
         
         # Cookies section
         ttk.Label(web_auth_frame, text="Cookies (for HTTP 401/403 errors):").pack(anchor='w', pady=(5,2))
@@ -1585,7 +2193,8 @@ Ctrl+Tab - Switch Between Tabs"""
         logscan_frame = ttk.LabelFrame(scrollable_frame, text="Diagnostics & Log Export", padding=10, relief='solid', borderwidth=1)
         logscan_frame.pack(fill='x', padx=10, pady=5)
         ttk.Button(logscan_frame, text="Save Activity Log", command=self.save_activity_log).pack(side=tk.LEFT, padx=5)
-        ttk.Button(logscan_frame, text="Organize Downloads (videos/images/gifs)", command=self.organize_downloads).pack(side=tk.LEFT, padx=5)
+        ttk.Button(logscan_frame, text="Organize Downloads (videos/images/gifs)",
+                   command=self.run_organize_downloads).pack(side=tk.LEFT, padx=5)
         
         # Save button
         ttk.Button(scrollable_frame, text="Save Settings", command=self.save_settings).pack(pady=10)
@@ -1605,7 +2214,8 @@ Ctrl+Tab - Switch Between Tabs"""
         log_frame = ttk.LabelFrame(log_container, text="Activity Log", padding=10)
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, wrap=tk.WORD)
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, wrap=tk.WORD,
+                                                  font=self.log_font, tabs=self.log_tabs)
         self.log_text.pack(fill='both', expand=True)
     
     def _auto_organize_startup(self):
@@ -1613,10 +2223,61 @@ Ctrl+Tab - Switch Between Tabs"""
         try:
             if bool(self.config.get('downloads.auto_organize_startup', False)):
                 self.log("Auto-organize on startup enabled — organizing downloads...")
-                self.organize_downloads()
+                self._organize_in_background()
         except Exception as e:
             self.log(f"Auto-organize failed: {e}")
     
+    def _run_bg(self, fn, *args, cb=None):
+        """Run fn(*args) on a daemon thread so blocking file I/O doesn't freeze the UI.
+        If cb is given it is scheduled back on the Tk thread once fn returns."""
+        def _target():
+            try:
+                fn(*args)
+            except Exception as e:
+                self.log(f"Background task failed: {e}")
+            finally:
+                if cb:
+                    self.root.after(0, cb)
+        
+        thread = threading.Thread(target=_target)
+        thread.daemon = True
+        thread.start()
+        return thread
+    
+    def _organize_after_scrape(self, base_path):
+        """Run organize_downloads off the scrape thread so the scrape can finish right away"""
+        self.log("Auto-organizing downloads into subfolders...")
+        self._organize_in_background(base_path)
+    
+    def _organize_in_background(self, base_path=None):
+        """Run organize_downloads on a daemon thread; _organize_idle stays clear until it's done"""
+        self._organize_idle.clear()
+        
+        def _organize():
+            try:
+                self.organize_downloads(base_path)
+            finally:
+                self._organize_idle.set()
+        
+        self._run_bg(_organize)
+    
+    def run_organize_downloads(self):
+        """Organize Downloads button/menu entry: refused while other work is moving files"""
+        if self._is_busy():
+            messagebox.showwarning("Busy", "Please wait for current operation to complete")
+            return
+        self._organize_in_background()
+    
+    def _is_busy(self):
+        """True while a scrape or file operation runs, or a background organize is still moving files"""
+        return self.is_downloading or not self._organize_idle.is_set()
+    
+    def _wait_for_organize(self):
+        """Block a scrape thread until any running post-scrape organize pass is done"""
+        if not self._organize_idle.is_set():
+            self.log("Waiting for download organization to finish...")
+            self._organize_idle.wait()
+    
     def _load_website_scrape_state(self):
         """Load website scraping state from file"""
         if os.path.exists(self.website_scrape_state_file):
@@ -1628,12 +2289,27 @@ Ctrl+Tab - Switch Between Tabs"""
         return {'completed_websites': [], 'current_website': None}
     
     def _save_website_scrape_state(self):
-        """Save website scraping state to file"""
-        try:
-            with open(self.website_scrape_state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.website_scrape_state, f, indent=2)
-        except Exception as e:
-            self.log(f"Warning: Failed to save scrape state: {e}")
+        """Save website scraping state to file now (replaces any pending debounced write)"""
+        with self._state_lock:
+            if self._state_timer is not None:
+                self._state_timer.cancel()
+                self._state_timer = None
+            try:
+                tmp_path = self.website_scrape_state_file + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.website_scrape_state, f, indent=2)
+                os.replace(tmp_path, self.website_scrape_state_file)
+            except Exception as e:
+                self.log(f"Warning: Failed to save scrape state: {e}")
+    
+    def _schedule_website_scrape_state_save(self, delay=1.0):
+        """Save the scrape state once, delay seconds after the last change"""
+        with self._state_lock:
+            if self._state_timer is not None:
+                self._state_timer.cancel()
+            self._state_timer = threading.Timer(delay, self._save_website_scrape_state)
+            self._state_timer.daemon = True
+            self._state_timer.start()
     
     def _clear_website_scrape_state(self):
         """Clear website scraping state for fresh start"""
@@ -1653,7 +2329,7 @@ Ctrl+Tab - Switch Between Tabs"""
         file_menu.add_command(label="Clear Activity Log", command=lambda: self.log_text.delete('1.0', tk.END))
         file_menu.add_separator()
         file_menu.add_command(label="Open Downloads Folder", command=self._open_downloads_folder)
-        file_menu.add_command(label="Open Config Folder", command=lambda: os.startfile(self.botfiles_dir))
+        file_menu.add_command(label="Open Config Folder", command=lambda: self.root.after_idle(os.startfile, self.botfiles_dir))
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Alt+F4")
         
@@ -1661,13 +2337,14 @@ Ctrl+Tab - Switch Between Tabs"""
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="Scan Download Folders", command=self.scan_download_folders)
-        tools_menu.add_command(label="Organize Downloads", command=self.organize_downloads)
+        tools_menu.add_command(label="Organize Downloads", command=self.run_organize_downloads)
         tools_menu.add_command(label="Flatten Folder Structure", command=self.flatten_folder_structure)
         tools_menu.add_command(label="Delete Empty Folders", command=self.delete_empty_folders)
         tools_menu.add_separator()
         tools_menu.add_command(label="View Statistics", command=self.show_statistics)
         tools_menu.add_command(label="Clear Download History", command=self._clear_history_with_confirm)
         tools_menu.add_command(label="Clear Scrape History", command=self._clear_scrape_history_with_confirm)
+        tools_menu.add_command(label="Clear Hash Cache", command=self._clear_hash_cache_with_confirm)
         
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -1708,6 +2385,17 @@ Ctrl+Tab - Switch Between Tabs"""
         else:
             # Light theme (default)
             self.style.theme_use('vista' if os.name == 'nt' else 'clam')
+        # Style options are per-theme, so re-register ours after switching
+        self._configure_named_styles()
+    
+    def _configure_named_styles(self):
+        """Register the named label styles used by help dialogs"""
+        self.style.configure('HelpH1.TLabel', font=self.heading_font)
+        self.style.configure('HelpH2.TLabel', font=self.subheading_font)
+        self.style.configure('HelpWarn.TLabel', font=self.subheading_font, foreground='orange')
+        self.style.configure('HelpInfo.TLabel', font=self.subheading_font, foreground='#3498db')
+        self.style.configure('HelpOK.TLabel', font=self.subheading_font, foreground='#27ae60')
+        self.style.configure('HelpError.TLabel', font=self.subheading_font, foreground='#e74c3c')
     
     def _toggle_theme(self):
         """Toggle between light and dark theme"""
@@ -1719,7 +2407,8 @@ Ctrl+Tab - Switch Between Tabs"""
         """Open downloads folder in file explorer"""
         download_path = str(self.config.get('downloads.base_path', 'Downloads'))
         if os.path.exists(download_path):
-            os.startfile(download_path)
+            # Defer the shell call so the menu/key event finishes repainting first
+            self.root.after_idle(os.startfile, download_path)
         else:
             messagebox.showwarning("Folder Not Found", f"Download folder does not exist:\n{download_path}")
     
@@ -1744,6 +2433,18 @@ Ctrl+Tab - Switch Between Tabs"""
             self.download_history.clear_all_history()
             self.log("✓ Download history cleared")
     
+    def _clear_hash_cache_with_confirm(self):
+        """Forget cached file hashes so the next duplicate scan re-reads every file"""
+        if not messagebox.askyesno("Clear Hash Cache",
+                "Duplicate scans reuse the hashes of files that haven't changed.\n\n"
+                "Clear the cache so every file is hashed again on the next scan?"):
+            return
+        try:
+            self.duplicate_checker.hash_cache.clear()
+            self.log("✓ Hash cache cleared")
+        except Exception as e:
+            self.log(f"Error clearing hash cache: {e}")
+    
     def _clear_scrape_history_with_confirm(self):
         """Clear all scrape history including website state and download queue"""
         result = messagebox.askyesno("Clear Scrape History",
@@ -1786,267 +2487,181 @@ Ctrl+Tab    Switch Tabs
 """
         messagebox.showinfo("Keyboard Shortcuts", shortcuts)
     
+    def _show_help_dialog(self, key, builder):
+        """Show a cached help dialog, building it on first use"""
+        dialog = self._help_dialogs.get(key)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = builder()
+            self._help_dialogs[key] = dialog
+        else:
+            dialog.deiconify()
+            dialog.lift()
+        dialog.grab_set()
+    
+    def _hide_help_dialog(self, dialog):
+        """Hide a help dialog so the next open can reuse it"""
+        try:
+            dialog.grab_release()
+        except Exception:
+            pass
+        dialog.withdraw()
+    
     def _show_reddit_api_help(self):
         """Show instructions for using gallery-dl with Reddit"""
-        # Create a custom dialog
+        self._show_help_dialog('reddit', self._build_reddit_help_dialog)
+    
+    def _build_reddit_help_dialog(self):
+        """Build the Reddit/gallery-dl help dialog"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Reddit Help")
         dialog.geometry("600x450")
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol('WM_DELETE_WINDOW', lambda: self._hide_help_dialog(dialog))
         
-        # Main frame with scrollbar
-        main_frame = ttk.Frame(dialog, padding=10)
-        main_frame.pack(fill='both', expand=True)
+        # Close button (packed first so it keeps its space when the dialog shrinks)
+        ttk.Button(dialog, text="Close", command=lambda: self._hide_help_dialog(dialog)).pack(side=tk.BOTTOM, pady=10)
         
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        text = self._create_help_text(dialog)
+        text.insert(tk.END, "📝 Reddit Scraping with gallery-dl\n", 'h1')
+        text.insert(tk.END, "✅ No API Key Required!\n", ('h2', 'ok'))
+        text.insert(tk.END, _REDDIT_HELP_TEXT)
+        text.insert(tk.END, "ℹ️ About gallery-dl:\n", ('h2', 'info'))
+        text.insert(tk.END, """gallery-dl is a command-line program to download image galleries
+and media from multiple websites, including Reddit.
+
+Documentation:
+""")
+        self._insert_help_link(text, 'https://github.com/mikf/gallery-dl')
+        text.insert(tk.END, "   (Click to copy and open)\n", 'hint')
+        text.config(state='disabled')
+        return dialog
+    
+    def _show_twitter_api_help(self):
+        """Show instructions for obtaining Twitter API credentials with clickable links"""
+        self._show_help_dialog('twitter', self._build_twitter_help_dialog)
+    
+    def _build_twitter_help_dialog(self):
+        """Build the Twitter/X API help dialog with clickable links"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Twitter/X API Help")
+        dialog.geometry("700x600")
+        dialog.transient(self.root)
+        dialog.protocol('WM_DELETE_WINDOW', lambda: self._hide_help_dialog(dialog))
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Close button (packed first so it keeps its space when the dialog shrinks)
+        ttk.Button(dialog, text="Close", command=lambda: self._hide_help_dialog(dialog)).pack(side=tk.BOTTOM, pady=10)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        text = self._create_help_text(dialog)
+        text.insert(tk.END, "📝 How to Get Twitter/X API Credentials\n\n", 'h1')
         
-        # Content
-        content = ttk.Frame(scrollable_frame, padding=10)
-        content.pack(fill='both', expand=True)
+        # Warning
+        text.insert(tk.END, "⚠️ Twitter API Access Requirements:\n", ('h2', 'warn'))
+        text.insert(tk.END, """• Free tier is very limited (read-only, low rate limits)
+• Basic tier ($100/month) recommended for scraping
+• You need a Twitter Developer Account
+
+""")
         
-        ttk.Label(content, text="📝 Reddit Scraping with gallery-dl", 
-                 font=('TkDefaultFont', 12, 'bold')).pack(anchor='w', pady=(0, 10))
+        # Step 1 with clickable link
+        text.insert(tk.END, "1. Go to Twitter Developer Portal:\n", 'h2')
+        text.insert(tk.END, "    ")
+        self._insert_help_link(text, 'https://developer.twitter.com/')
+        text.insert(tk.END, "   (Click to copy and open)\n", 'hint')
         
-        ttk.Label(content, text="✅ No API Key Required!", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#27ae60').pack(anchor='w', pady=(5, 10))
-        
-        # Instructions
-        instructions = """This scraper uses gallery-dl to download Reddit content.
-No Reddit API credentials are needed!
-
-How to use:
-
-1. Enter a subreddit name (e.g., "pics", "wallpapers")
-   OR a Reddit username
-
-2. Click "Scrape" to download media
-
-3. gallery-dl will automatically download:
-   • Images from posts
-   • Videos from posts
-   • Gallery albums
-   • Crossposts
-
-Note: gallery-dl scrapes public Reddit content without authentication.
-For private or age-restricted content, you may need to configure
-browser cookies in gallery-dl's configuration file.
-"""
-        ttk.Label(content, text=instructions, justify='left').pack(anchor='w', pady=(5, 10))
-        
-        # gallery-dl info
-        info_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
-        info_frame.pack(fill='x', pady=(10, 5))
-        ttk.Label(info_frame, text="ℹ️ About gallery-dl:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#3498db').pack(anchor='w')
-        ttk.Label(info_frame, text="""gallery-dl is a command-line program to download image galleries
-and media from multiple websites, including Reddit.
-
-Documentation:""",
-                 justify='left', wraplength=550).pack(anchor='w', pady=(2, 2))
-        
-        link_frame = ttk.Frame(info_frame)
-        link_frame.pack(anchor='w', padx=10)
-        link = tk.Text(link_frame, height=1, width=50, wrap='none', relief='flat',
-                      bg=info_frame.cget('bg'), font=('TkDefaultFont', 9), cursor='hand2')
-        link.insert('1.0', 'https://github.com/mikf/gallery-dl')
-        link.config(state='disabled', fg='blue')
-        link.pack(side='left')
-        link.bind('<Button-1>', lambda e: self._copy_and_open('https://github.com/mikf/gallery-dl'))
-        
-        ttk.Label(info_frame, text="   (Click to copy and open)", 
-                 foreground='gray', font=('TkDefaultFont', 8)).pack(anchor='w', padx=10)
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side=tk.LEFT, fill='both', expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill='y')
-        
-        # Close button
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
-    
-    def _show_twitter_api_help(self):
-        """Show instructions for obtaining Twitter API credentials with clickable links"""
-        # Create a custom dialog with clickable links
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Twitter/X API Help")
-        dialog.geometry("700x600")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Main frame with scrollbar
-        main_frame = ttk.Frame(dialog, padding=10)
-        main_frame.pack(fill='both', expand=True)
-        
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Content
-        content = ttk.Frame(scrollable_frame, padding=10)
-        content.pack(fill='both', expand=True)
-        
-        ttk.Label(content, text="📝 How to Get Twitter/X API Credentials", 
-                 font=('TkDefaultFont', 12, 'bold')).pack(anchor='w', pady=(0, 10))
-        
-        # Warning
-        warning_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
-        warning_frame.pack(fill='x', pady=(5, 10))
-        
-        ttk.Label(warning_frame, text="⚠️ Twitter API Access Requirements:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='orange').pack(anchor='w')
-        ttk.Label(warning_frame, text="""
-• Free tier is very limited (read-only, low rate limits)
-• Basic tier ($100/month) recommended for scraping
-• You need a Twitter Developer Account""",
-                 justify='left').pack(anchor='w', pady=(2, 0))
-        
-        # Step 1 with clickable link
-        ttk.Label(content, text="1. Go to Twitter Developer Portal:", 
-                 font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 2))
-        
-        link1_frame = ttk.Frame(content)
-        link1_frame.pack(anchor='w', padx=20)
-        link1 = tk.Text(link1_frame, height=1, width=50, wrap='none', relief='flat', 
-                       bg=dialog.cget('bg'), font=('TkDefaultFont', 9), cursor='hand2')
-        link1.insert('1.0', 'https://developer.twitter.com/')
-        link1.config(state='disabled', fg='blue')
-        link1.pack(side='left')
-        link1.bind('<Button-1>', lambda e: self._copy_and_open('https://developer.twitter.com/'))
-        
-        ttk.Label(content, text="   (Click to copy and open)", 
-                 foreground='gray', font=('TkDefaultFont', 8)).pack(anchor='w', padx=20)
-        
-        # Instructions
-        instructions = """
-2. Sign up for a Developer Account:
-   • Click "Sign up" in the top right
-   • Apply for a developer account
-   • Fill out the application form
-   • Wait for approval (usually instant to 24 hours)
-
-3. Create a Project & App:
-   • Go to Developer Portal
-   • Create a new Project
-   • Create a new App within the Project
-
-4. Generate Keys:
-   • Go to your App's "Keys and tokens" tab
-   • Generate/Regenerate:
-     - API Key & API Secret
-     - Bearer Token
-     - Access Token & Access Token Secret
-
-5. Copy all credentials to Settings tab:
-   • Bearer Token (required for Twitter API v2)
-   • API Key, API Secret
-   • Access Token, Access Token Secret
-"""
-        ttk.Label(content, text=instructions, justify='left').pack(anchor='w', pady=(10, 5))
+        text.insert(tk.END, _TWITTER_HELP_STEPS)
         
         # Note
-        note_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
-        note_frame.pack(fill='x', pady=(10, 5))
-        ttk.Label(note_frame, text="💡 Alternative Option:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#3498db').pack(anchor='w')
-        ttk.Label(note_frame, text="""For free tier limitations, consider using alternative Twitter scrapers
-or third-party tools that don't require paid API access.""",
-                 wraplength=600, justify='left').pack(anchor='w', pady=(2, 0))
+        text.insert(tk.END, "💡 Alternative Option:\n", ('h2', 'info'))
+        text.insert(tk.END, """For free tier limitations, consider using alternative Twitter scrapers
+or third-party tools that don't require paid API access.
+
+""")
         
         # Security note
-        security_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
-        security_frame.pack(fill='x', pady=(10, 5))
-        ttk.Label(security_frame, text="🔒 Security Note:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#27ae60').pack(anchor='w')
-        ttk.Label(security_frame, text="Keep all tokens private! Never share them publicly.",
-                 wraplength=600).pack(anchor='w', pady=(2, 0))
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side=tk.LEFT, fill='both', expand=True)
+        text.insert(tk.END, "🔒 Security Note:\n", ('h2', 'ok'))
+        text.insert(tk.END, "Keep all tokens private! Never share them publicly.\n")
+        text.config(state='disabled')
+        return dialog
+    
+    def _create_help_text(self, dialog):
+        """Create the read-only Text (with scrollbar and style tags) used by help dialogs"""
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill='both', expand=True)
+        text = tk.Text(frame, wrap='word', padx=10, pady=10, relief='flat',
+                       bg=self._default_bg, cursor='arrow')
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        text.tag_configure('h1', font=self.heading_font, spacing3=10)
+        text.tag_configure('h2', font=self.subheading_font, spacing1=5)
+        text.tag_configure('ok', foreground='#27ae60')
+        text.tag_configure('info', foreground='#3498db')
+        text.tag_configure('warn', foreground='orange')
+        text.tag_configure('hint', foreground='gray', font=('TkDefaultFont', 8))
+        text.tag_configure('link', foreground='blue', underline=1)
+        text.tag_bind('link', '<Enter>', lambda e: text.config(cursor='hand2'))
+        text.tag_bind('link', '<Leave>', lambda e: text.config(cursor='arrow'))
+        text.pack(side=tk.LEFT, fill='both', expand=True)
         scrollbar.pack(side=tk.RIGHT, fill='y')
-        
-        # Close button
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
+        return text
+    
+    def _insert_help_link(self, text, url):
+        """Insert a clickable URL into a help Text widget"""
+        url_tag = f"url{len(text.tag_names())}"
+        text.insert(tk.END, url, ('link', url_tag))
+        text.tag_bind(url_tag, '<Button-1>', lambda e: self._copy_and_open(url))
+        text.insert(tk.END, "\n")
     
     def _copy_and_open(self, url):
-        """Copy URL to clipboard and open in browser"""
-        import webbrowser
+        """Open URL in browser and copy it to the clipboard"""
         try:
-            # Copy to clipboard
-            self.root.clipboard_clear()
-            self.root.clipboard_append(url)
-            # Open in browser
-            webbrowser.open(url)
+            webbrowser.open_new_tab(url)
+            # Clipboard ownership is a round-trip to the X server; do it after the click is handled
+            self.root.after_idle(self._copy_to_clipboard, url)
             self.log(f"📋 Copied and opened: {url}")
         except Exception as e:
             self.log(f"Error opening URL: {e}")
+            self._copy_to_clipboard(url)
             messagebox.showinfo("URL", f"Link:\n\n{url}\n\nCopied to clipboard!")
     
-    def _create_website_scraper(self, max_workers=3):
+    def _copy_to_clipboard(self, text):
+        """Replace the clipboard contents with text"""
+        try:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
+        except Exception:
+            pass
+    
+    def _create_website_scraper(self, max_workers=3, aggressive_popup=True):
         """Create WebsiteScraper with cookies and custom headers from config"""
         return WebsiteScraper(
             history=self.download_history,
             max_workers=max_workers,
-            aggressive_popup=True,
+            aggressive_popup=aggressive_popup,
             duplicate_checker=self.duplicate_checker,
             cookies=self.config.get('website.cookies', ''),
-            custom_headers=self.config.get('website.custom_headers', '')
+            custom_headers=self.config.get('website.custom_headers', ''),
+            http_adapter=self.http_adapter
         )
     
     def _show_web_auth_help(self):
         """Show instructions for getting cookies and headers from browser"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Website Authentication Help")
-        dialog.geometry("750x700")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Main frame with scrollbar
-        main_frame = ttk.Frame(dialog, padding=10)
-        main_frame.pack(fill='both', expand=True)
-        
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Content
-        content = ttk.Frame(scrollable_frame, padding=10)
-        content.pack(fill='both', expand=True)
+        self._show_help_dialog('web_auth', self._build_web_auth_help_dialog)
+    
+    def _build_web_auth_help_dialog(self):
+        """Build the cookies/headers help dialog"""
+        dialog = _ScrollableDialog(self.root, "Website Authentication Help", "750x700")
+        dialog.protocol('WM_DELETE_WINDOW', lambda: self._hide_help_dialog(dialog))
+        content = dialog.content
         
         ttk.Label(content, text="🔐 How to Fix HTTP 401 & 403 Errors", 
-                 font=('TkDefaultFont', 12, 'bold')).pack(anchor='w', pady=(0, 10))
+                 style='HelpH1.TLabel').pack(anchor='w', pady=(0, 10))
         
         # Warning
         warning_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
         warning_frame.pack(fill='x', pady=(5, 10))
         
         ttk.Label(warning_frame, text="⚠️ When You Need This:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='orange').pack(anchor='w')
+                 style='HelpWarn.TLabel').pack(anchor='w')
         ttk.Label(warning_frame, text="""
 • HTTP 401 Unauthorized: Site requires login cookies
 • HTTP 403 Forbidden: Site blocking your request
@@ -2055,7 +2670,7 @@ or third-party tools that don't require paid API access.""",
         
         # Instructions
         ttk.Label(content, text="🍪 How to Get Cookies from Your Browser:", 
-                 font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 5))
+                 style='HelpH2.TLabel').pack(anchor='w', pady=(10, 5))
         
         instructions = """1. Log into the website in your browser (Chrome/Firefox/Edge)
 
@@ -2079,9 +2694,20 @@ or third-party tools that don't require paid API access.""",
         
         ttk.Label(content, text=instructions, justify='left').pack(anchor='w', pady=(0, 10))
         
+        # Everything below the first screenful is built on the next idle pass
+        self.root.after_idle(self._build_web_auth_help_rest, content)
+        
+        # Close button
+        ttk.Button(dialog, text="Close", command=lambda: self._hide_help_dialog(dialog)).pack(pady=10)
+        return dialog
+    
+    def _build_web_auth_help_rest(self, content):
+        """Build the below-the-fold sections of the cookies/headers help dialog"""
+        if not content.winfo_exists():
+            return
         # Headers section
         ttk.Label(content, text="📋 Custom Headers (Advanced):", 
-                 font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(10, 5))
+                 style='HelpH2.TLabel').pack(anchor='w', pady=(10, 5))
         
         headers_info = """If cookies don't work, some sites need custom headers:
 
@@ -2105,7 +2731,7 @@ Authorization: Bearer abc123xyz"""
         example_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
         example_frame.pack(fill='x', pady=(10, 5))
         ttk.Label(example_frame, text="💡 Common Scenarios:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#3498db').pack(anchor='w')
+                 style='HelpInfo.TLabel').pack(anchor='w')
         
         examples = """
 • Paywalled sites: Need cookies from your logged-in browser session
@@ -2119,93 +2745,17 @@ Authorization: Bearer abc123xyz"""
         security_frame = ttk.Frame(content, relief='solid', borderwidth=1, padding=10)
         security_frame.pack(fill='x', pady=(10, 5))
         ttk.Label(security_frame, text="🔒 Security Warning:", 
-                 font=('TkDefaultFont', 10, 'bold'), foreground='#e74c3c').pack(anchor='w')
+                 style='HelpError.TLabel').pack(anchor='w')
         ttk.Label(security_frame, text="""Cookies contain sensitive login information!
 • Only use cookies from YOUR OWN logged-in sessions
 • Never share your cookies publicly
 • Cookies expire - you may need to update them periodically
 • This may violate some website Terms of Service""",
                  wraplength=650, justify='left').pack(anchor='w', pady=(2, 0))
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side=tk.LEFT, fill='both', expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill='y')
-        
-        # Close button
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
     
     def _show_onlyfans_api_help(self):
         """Show instructions for obtaining OnlyFans API access"""
-        help_text = """📝 OnlyFans API Access (Advanced Users)
-
-⚠️ WARNING: Direct OnlyFans API access is complex and may violate their Terms of Service.
-OF-DL is the recommended method for most users.
-
-If OF-DL stops working and you need direct API access:
-
-Method 1: Browser Developer Tools (Easiest)
-═══════════════════════════════════════════
-
-1. Log into OnlyFans in your browser (Chrome/Firefox)
-
-2. Open Developer Tools (F12)
-
-3. Go to "Network" tab
-
-4. Click on any OnlyFans request
-
-5. Look for these headers:
-   • Cookie: (contains auth_id and sess values)
-   • User-Agent: Your browser's user agent
-   • x-bc: Browser fingerprint token
-
-6. Important values to extract:
-   • sess: Session token
-   • auth_id: Authentication ID
-   • user-agent: Browser identifier
-   • x-bc: Security token
-
-Method 2: Manual API Calls
-═══════════════════════════
-
-OnlyFans uses these endpoints:
-• https://onlyfans.com/api2/v2/users/me
-• https://onlyfans.com/api2/v2/subscriptions/subscribes
-• https://onlyfans.com/api2/v2/posts/{userId}
-
-Required headers for API calls:
-• Cookie: auth_id={your_auth_id}; sess={your_sess};
-• User-Agent: {your_browser_user_agent}
-• x-bc: {browser_checksum}
-• Accept: application/json
-
-⚠️ IMPORTANT NOTES:
-═══════════════════
-
-• Session tokens expire regularly (need to re-extract)
-• OnlyFans actively blocks automated access
-• This may violate OnlyFans Terms of Service
-• Account suspension risk if detected
-• Headers change frequently - no guarantee this will work
-
-RECOMMENDATION:
-═══════════════
-
-Use OF-DL (https://git.ofdl.tools/sim0n00ps/OF-DL) instead:
-✓ Handles authentication automatically
-✓ Uses browser-based login (more reliable)
-✓ Maintained by the community
-✓ Updates when OnlyFans changes API
-
-Only attempt direct API access if:
-• You understand the risks
-• OF-DL is not working
-• You have programming experience
-• You accept potential account suspension
-
-For most users, waiting for OF-DL updates is safer.
-"""
-        messagebox.showinfo("OnlyFans API Access", help_text)
+        messagebox.showinfo("OnlyFans API Access", _ONLYFANS_HELP_TEXT)
     
     def _copy_email_to_clipboard(self):
         """Copy email address to clipboard and show confirmation"""
@@ -2221,7 +2771,6 @@ For most users, waiting for OF-DL updates is safer.
     
     def _open_donation_link(self):
         """Open Buy Me a Coffee donation page in browser"""
-        import webbrowser
         url = "https://buymeacoffee.com/sknight"
         try:
             webbrowser.open(url)
@@ -2231,146 +2780,176 @@ For most users, waiting for OF-DL updates is safer.
     
     def _show_about(self):
         """Show about dialog"""
-        about_text = """🎬 Media Scraper Bot v2.0
-
-A comprehensive media downloader for:
-• Reddit (subreddits & users)
-• Twitter/X (user timelines)
-• Websites (any URL)
-• OnlyFans (via OF-DL)
-
-Features:
-✓ 100% Duplicate Detection (SHA256)
-✓ Active/Inactive User Management
-✓ Download History Tracking
-✓ Folder Organization
-✓ Discord Bot Integration
-
-Created with ❤️ for archiving
-"""
-        messagebox.showinfo("About Media Scraper Bot", about_text)
+        messagebox.showinfo("About Media Scraper Bot", _ABOUT_TEXT)
     
     def show_statistics(self):
         """Show comprehensive statistics"""
-        # User counts
-        stats = self.user_manager.get_statistics()
-        
-        # History stats
+        history = self.download_history.history
         history_stats = {
-            'reddit': len(self.download_history.history.get('reddit', {})),
-            'twitter': len(self.download_history.history.get('twitter', {})),
-            'websites': len(self.download_history.history.get('websites', {}))
+            'reddit': len(history.get('reddit', {})),
+            'twitter': len(history.get('twitter', {})),
+            'websites': len(history.get('websites', {}))
         }
-        
-        # Duplicate checker stats
         total_files = len(self.duplicate_checker.file_hashes)
         
-        stats_text = f"""📊 Statistics
-
-User Management:
-Reddit Users: {stats['reddit']['active']} active, {stats['reddit']['inactive']} inactive
-Subreddits: {stats['subreddits']['active']} active, {stats['subreddits']['inactive']} inactive
-Twitter Users: {stats['twitter']['active']} active, {stats['twitter']['inactive']} inactive
-Websites: {stats['websites']['active']} active, {stats['websites']['inactive']} inactive
-
-Download History:
-Reddit: {history_stats['reddit']} tracked posts
-Twitter: {history_stats['twitter']} tracked tweets
-Websites: {history_stats['websites']} tracked URLs
-
-Duplicate Detection:
-{total_files} unique files tracked by SHA256 hash
-"""
+        # Reuse the last text unless users, history or tracked hashes changed
+        cache_key = (self.user_manager.revision, tuple(history_stats.values()), total_files)
+        if self._stats_cache is not None and self._stats_cache[0] == cache_key:
+            messagebox.showinfo("Statistics", self._stats_cache[1])
+            return
+        
+        # User counts
+        stats = self.user_manager.get_statistics()
+        
+        stats_text = _STATS_TEMPLATE.format_map({
+            'reddit_active': stats['reddit']['active'],
+            'reddit_inactive': stats['reddit']['inactive'],
+            'subreddits_active': stats['subreddits']['active'],
+            'subreddits_inactive': stats['subreddits']['inactive'],
+            'twitter_active': stats['twitter']['active'],
+            'twitter_inactive': stats['twitter']['inactive'],
+            'websites_active': stats['websites']['active'],
+            'websites_inactive': stats['websites']['inactive'],
+            'history_reddit': history_stats['reddit'],
+            'history_twitter': history_stats['twitter'],
+            'history_websites': history_stats['websites'],
+            'total_files': total_files,
+        })
+        self._stats_cache = (cache_key, stats_text)
         messagebox.showinfo("Statistics", stats_text)
     
     # List management methods
+    def _sync_listbox(self, listbox, items):
+        """Update a listbox to show items, touching only the rows that changed"""
+        key = str(listbox)
+        if not listbox.winfo_ismapped():
+            # Tab not on screen: keep only the latest contents, applied on <Map>
+            self._pending_listbox_items[key] = items
+            return
+        self._pending_listbox_items.pop(key, None)
+        old = self._listbox_snapshots.get(key)
+        if old is None:
+            listbox.delete(0, tk.END)
+            old = ()
+        elif old == items:
+            return
+        
+        # Keep the common head and tail, replace only the slice in between
+        limit = min(len(old), len(items))
+        start = 0
+        while start < limit and old[start] == items[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == items[-1 - end]:
+            end += 1
+        
+        if len(old) - end > start:
+            listbox.delete(start, len(old) - end - 1)
+        new_slice = items[start:len(items) - end]
+        if new_slice:
+            listbox.insert(start, *new_slice)
+        self._listbox_snapshots[key] = items
+    
+    def _on_listbox_map(self, listbox):
+        """Apply contents deferred by _sync_listbox once the listbox is shown"""
+        items = self._pending_listbox_items.pop(str(listbox), None)
+        if items is not None:
+            self._sync_listbox(listbox, items)
+    
     def refresh_subreddit_lists(self):
         """Refresh subreddit active/inactive listboxes"""
-        self.subreddit_active_listbox.delete(0, tk.END)
-        self.subreddit_inactive_listbox.delete(0, tk.END)
-        
-        for item in self.user_manager.get_active_users('subreddits'):
-            self.subreddit_active_listbox.insert(tk.END, item)
-        
-        for item in self.user_manager.get_inactive_users('subreddits'):
-            self.subreddit_inactive_listbox.insert(tk.END, item)
+        active = tuple(self.user_manager.get_active_users('subreddits'))
+        inactive = tuple(self.user_manager.get_inactive_users('subreddits'))
+        self._sync_listbox(self.subreddit_active_listbox, active)
+        self._sync_listbox(self.subreddit_inactive_listbox, inactive)
     
     def refresh_reddit_user_lists(self):
         """Refresh Reddit user active/inactive listboxes"""
-        self.reddit_user_active_listbox.delete(0, tk.END)
-        self.reddit_user_inactive_listbox.delete(0, tk.END)
-        
-        for item in self.user_manager.get_active_users('reddit'):
-            self.reddit_user_active_listbox.insert(tk.END, item)
-        
-        for item in self.user_manager.get_inactive_users('reddit'):
-            self.reddit_user_inactive_listbox.insert(tk.END, item)
+        active = tuple(self.user_manager.get_active_users('reddit'))
+        inactive = tuple(self.user_manager.get_inactive_users('reddit'))
+        self._sync_listbox(self.reddit_user_active_listbox, active)
+        self._sync_listbox(self.reddit_user_inactive_listbox, inactive)
     
     def refresh_twitter_user_lists(self):
         """Refresh Twitter user active/inactive listboxes"""
-        self.twitter_user_active_listbox.delete(0, tk.END)
-        self.twitter_user_inactive_listbox.delete(0, tk.END)
-        
-        for item in self.user_manager.get_active_users('twitter'):
-            self.twitter_user_active_listbox.insert(tk.END, item)
-        
-        for item in self.user_manager.get_inactive_users('twitter'):
-            self.twitter_user_inactive_listbox.insert(tk.END, item)
+        active = tuple(self.user_manager.get_active_users('twitter'))
+        inactive = tuple(self.user_manager.get_inactive_users('twitter'))
+        self._sync_listbox(self.twitter_user_active_listbox, active)
+        self._sync_listbox(self.twitter_user_inactive_listbox, inactive)
     
     def refresh_website_lists(self):
         """Refresh website active/inactive listboxes"""
-        self.website_active_listbox.delete(0, tk.END)
-        self.website_inactive_listbox.delete(0, tk.END)
-        
-        for item in self.user_manager.get_active_users('websites'):
-            self.website_active_listbox.insert(tk.END, item)
-        
-        for item in self.user_manager.get_inactive_users('websites'):
-            self.website_inactive_listbox.insert(tk.END, item)
+        active = tuple(self.user_manager.get_active_users('websites'))
+        inactive = tuple(self.user_manager.get_inactive_users('websites'))
+        self._sync_listbox(self.website_active_listbox, active)
+        self._sync_listbox(self.website_inactive_listbox, inactive)
     
     # Move methods for Active/Inactive
     def move_subreddit_to_inactive(self):
         """Move selected subreddit from active to inactive"""
-        selections = self.subreddit_active_listbox.curselection()
-        for idx in selections:
-            subreddit = self.subreddit_active_listbox.get(idx)
+        items = [self.subreddit_active_listbox.get(idx) for idx in self.subreddit_active_listbox.curselection()]
+        for subreddit in items:
             self.user_manager.move_to_inactive('subreddits', subreddit)
-            self.log(f"Moved subreddit to inactive: {subreddit}")
+        if items:
+            self.log(f"Moved subreddit to inactive: {', '.join(items)}")
         self.refresh_subreddit_lists()
     
     def move_subreddit_to_active(self):
         """Move selected subreddit from inactive to active"""
-        selections = self.subreddit_inactive_listbox.curselection()
-        for idx in selections:
-            subreddit = self.subreddit_inactive_listbox.get(idx)
+        items = [self.subreddit_inactive_listbox.get(idx) for idx in self.subreddit_inactive_listbox.curselection()]
+        for subreddit in items:
             self.user_manager.move_to_active('subreddits', subreddit)
-            self.log(f"Moved subreddit to active: {subreddit}")
+        if items:
+            self.log(f"Moved subreddit to active: {', '.join(items)}")
         self.refresh_subreddit_lists()
     
     def move_reddit_user_to_inactive(self):
         """Move selected Reddit user from active to inactive"""
-        selections = self.reddit_user_active_listbox.curselection()
-        for idx in selections:
-            username = self.reddit_user_active_listbox.get(idx)
+        items = [self.reddit_user_active_listbox.get(idx) for idx in self.reddit_user_active_listbox.curselection()]
+        for username in items:
             self.user_manager.move_to_inactive('reddit', username)
-            self.log(f"Moved Reddit user to inactive: {username}")
+        if items:
+            self.log(f"Moved Reddit user to inactive: {', '.join(items)}")
         self.refresh_reddit_user_lists()
     
     def move_reddit_user_to_active(self):
         """Move selected Reddit user from inactive to active"""
-        selections = self.reddit_user_inactive_listbox.curselection()
-        for idx in selections:
-            username = self.reddit_user_inactive_listbox.get(idx)
+        items = [self.reddit_user_inactive_listbox.get(idx) for idx in self.reddit_user_inactive_listbox.curselection()]
+        for username in items:
             self.user_manager.move_to_active('reddit', username)
-            self.log(f"Moved Reddit user to active: {username}")
+        if items:
+            self.log(f"Moved Reddit user to active: {', '.join(items)}")
         self.refresh_reddit_user_lists()
     
     # Add/Remove methods
+    def _is_active_user(self, kind, name):
+        """Check whether name is already in the active list for kind (set lookup)"""
+        revision = self.user_manager.revision
+        cached = self._active_user_sets.get(kind)
+        if cached is None or cached[0] != revision:
+            cached = (revision, frozenset(self.user_manager.get_active_users(kind)))
+            self._active_user_sets[kind] = cached
+        return name in cached[1]
+    
+    def _selected_list_items(self, active_listbox, inactive_listbox):
+        """Return the selected names, asking the last-focused listbox of the pair first"""
+        if self._last_listbox_focus is inactive_listbox:
+            order = (inactive_listbox, active_listbox)
+        else:
+            order = (active_listbox, inactive_listbox)
+        for listbox in order:
+            selection = listbox.curselection()
+            if selection:
+                return [listbox.get(idx) for idx in selection]
+        return []
+    
     def add_subreddit(self):
         """Add subreddit to active list"""
         subreddit = self.subreddit_entry.get().strip()
         if subreddit:
-            if self.user_manager.add_user('subreddits', subreddit, active=True):
+            if self._is_active_user('subreddits', subreddit):
+                messagebox.showinfo("Info", "Subreddit already exists")
+            elif self.user_manager.add_user('subreddits', subreddit, active=True):
                 self.refresh_subreddit_lists()
                 self.subreddit_entry.delete(0, tk.END)
                 self.log(f"Added subreddit: {subreddit}")
@@ -2379,30 +2958,20 @@ Duplicate Detection:
     
     def remove_subreddit(self):
         """Remove selected subreddit from both lists"""
-        # Check active list first
-        selections = self.subreddit_active_listbox.curselection()
-        if selections:
-            for idx in selections:
-                subreddit = self.subreddit_active_listbox.get(idx)
-                self.user_manager.remove_user('subreddits', subreddit)
-                self.log(f"Removed subreddit: {subreddit}")
-            self.refresh_subreddit_lists()
-            return
-        
-        # Check inactive list
-        selections = self.subreddit_inactive_listbox.curselection()
-        if selections:
-            for idx in selections:
-                subreddit = self.subreddit_inactive_listbox.get(idx)
+        items = self._selected_list_items(self.subreddit_active_listbox, self.subreddit_inactive_listbox)
+        if items:
+            for subreddit in items:
                 self.user_manager.remove_user('subreddits', subreddit)
-                self.log(f"Removed subreddit: {subreddit}")
+            self.log(f"Removed subreddit: {', '.join(items)}")
             self.refresh_subreddit_lists()
     
     def add_reddit_user(self):
         """Add Reddit user to active list"""
         username = self.reddit_user_entry.get().strip()
         if username:
-            if self.user_manager.add_user('reddit', username, active=True):
+            if self._is_active_user('reddit', username):
+                messagebox.showinfo("Info", "User already exists")
+            elif self.user_manager.add_user('reddit', username, active=True):
                 self.refresh_reddit_user_lists()
                 self.reddit_user_entry.delete(0, tk.END)
                 self.log(f"Added Reddit user: {username}")
@@ -2411,59 +2980,47 @@ Duplicate Detection:
     
     def remove_reddit_user(self):
         """Remove selected Reddit user from both lists"""
-        # Check active list first
-        selections = self.reddit_user_active_listbox.curselection()
-        if selections:
-            for idx in selections:
-                username = self.reddit_user_active_listbox.get(idx)
+        items = self._selected_list_items(self.reddit_user_active_listbox, self.reddit_user_inactive_listbox)
+        if items:
+            for username in items:
                 self.user_manager.remove_user('reddit', username)
-                self.log(f"Removed Reddit user: {username}")
-            self.refresh_reddit_user_lists()
-            return
-        
-        # Check inactive list
-        selections = self.reddit_user_inactive_listbox.curselection()
-        if selections:
-            for idx in selections:
-                username = self.reddit_user_inactive_listbox.get(idx)
-                self.user_manager.remove_user('reddit', username)
-                self.log(f"Removed Reddit user: {username}")
+            self.log(f"Removed Reddit user: {', '.join(items)}")
             self.refresh_reddit_user_lists()
     
     def move_twitter_user_to_inactive(self):
         """Move selected Twitter user from active to inactive"""
-        selections = self.twitter_user_active_listbox.curselection()
-        for idx in selections:
-            username = self.twitter_user_active_listbox.get(idx)
+        items = [self.twitter_user_active_listbox.get(idx) for idx in self.twitter_user_active_listbox.curselection()]
+        for username in items:
             self.user_manager.move_to_inactive('twitter', username)
-            self.log(f"Moved Twitter user to inactive: {username}")
+        if items:
+            self.log(f"Moved Twitter user to inactive: {', '.join(items)}")
         self.refresh_twitter_user_lists()
     
     def move_twitter_user_to_active(self):
         """Move selected Twitter user from inactive to active"""
-        selections = self.twitter_user_inactive_listbox.curselection()
-        for idx in selections:
-            username = self.twitter_user_inactive_listbox.get(idx)
+        items = [self.twitter_user_inactive_listbox.get(idx) for idx in self.twitter_user_inactive_listbox.curselection()]
+        for username in items:
             self.user_manager.move_to_active('twitter', username)
-            self.log(f"Moved Twitter user to active: {username}")
+        if items:
+            self.log(f"Moved Twitter user to active: {', '.join(items)}")
         self.refresh_twitter_user_lists()
     
     def move_website_to_inactive(self):
         """Move selected website from active to inactive"""
-        selections = self.website_active_listbox.curselection()
-        for idx in selections:
-            website = self.website_active_listbox.get(idx)
+        items = [self.website_active_listbox.get(idx) for idx in self.website_active_listbox.curselection()]
+        for website in items:
             self.user_manager.move_to_inactive('websites', website)
-            self.log(f"Moved website to inactive: {website}")
+        if items:
+            self.log(f"Moved website to inactive: {', '.join(items)}")
         self.refresh_website_lists()
     
     def move_website_to_active(self):
         """Move selected website from inactive to active"""
-        selections = self.website_inactive_listbox.curselection()
-        for idx in selections:
-            website = self.website_inactive_listbox.get(idx)
+        items = [self.website_inactive_listbox.get(idx) for idx in self.website_inactive_listbox.curselection()]
+        for website in items:
             self.user_manager.move_to_active('websites', website)
-            self.log(f"Moved website to active: {website}")
+        if items:
+            self.log(f"Moved website to active: {', '.join(items)}")
         self.refresh_website_lists()
     
     def add_twitter_user(self):
@@ -2471,22 +3028,12 @@ Duplicate Detection:
         raw = self.twitter_user_entry.get().strip()
         if not raw:
             return
-        # Normalize: strip @, extract handle from full URL, remove query/fragment
-        handle = raw.lstrip('@')
-        if handle.startswith('http://') or handle.startswith('https://'):
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(handle)
-                segments = [seg for seg in parsed.path.split('/') if seg]
-                if segments:
-                    handle = segments[0]
-            except Exception:
-                pass
-        handle = handle.split('?')[0].split('#')[0]
-        # Replace invalid chars with underscore (align with twitter_scraper normalization)
-        import re
-        norm = re.sub(r'[^A-Za-z0-9_]', '_', handle) or 'user'
-        if self.user_manager.add_user('twitter', norm, active=True):
+        # Normalize: strip @, extract handle from full URL, remove query/fragment,
+        # replace invalid chars (aligned with twitter_scraper normalization)
+        norm = _normalize_twitter_handle(raw)
+        if self._is_active_user('twitter', norm):
+            messagebox.showinfo("Info", "User already exists")
+        elif self.user_manager.add_user('twitter', norm, active=True):
             self.refresh_twitter_user_lists()
             self.twitter_user_entry.delete(0, tk.END)
             self.log(f"Added Twitter user: {norm} (from input: {raw})")
@@ -2495,23 +3042,11 @@ Duplicate Detection:
     
     def remove_twitter_user(self):
         """Remove selected Twitter user from both lists"""
-        # Check active list first
-        selections = self.twitter_user_active_listbox.curselection()
-        if selections:
-            for idx in selections:
-                username = self.twitter_user_active_listbox.get(idx)
+        items = self._selected_list_items(self.twitter_user_active_listbox, self.twitter_user_inactive_listbox)
+        if items:
+            for username in items:
                 self.user_manager.remove_user('twitter', username)
-                self.log(f"Removed Twitter user: {username}")
-            self.refresh_twitter_user_lists()
-            return
-        
-        # Check inactive list
-        selections = self.twitter_user_inactive_listbox.curselection()
-        if selections:
-            for idx in selections:
-                username = self.twitter_user_inactive_listbox.get(idx)
-                self.user_manager.remove_user('twitter', username)
-                self.log(f"Removed Twitter user: {username}")
+            self.log(f"Removed Twitter user: {', '.join(items)}")
             self.refresh_twitter_user_lists()
     
     def add_website(self):
@@ -2520,7 +3055,9 @@ Duplicate Detection:
         if url:
             if not url.startswith('http'):
                 url = 'https://' + url
-            if self.user_manager.add_user('websites', url, active=True):
+            if self._is_active_user('websites', url):
+                messagebox.showinfo("Info", "Website already exists")
+            elif self.user_manager.add_user('websites', url, active=True):
                 self.refresh_website_lists()
                 self.website_entry.delete(0, tk.END)
                 self.log(f"Added website: {url}")
@@ -2529,23 +3066,11 @@ Duplicate Detection:
     
     def remove_website(self):
         """Remove selected website from both lists"""
-        # Check active list first
-        selections = self.website_active_listbox.curselection()
-        if selections:
-            for idx in selections:
-                url = self.website_active_listbox.get(idx)
-                self.user_manager.remove_user('websites', url)
-                self.log(f"Removed website: {url}")
-            self.refresh_website_lists()
-            return
-        
-        # Check inactive list
-        selections = self.website_inactive_listbox.curselection()
-        if selections:
-            for idx in selections:
-                url = self.website_inactive_listbox.get(idx)
+        items = self._selected_list_items(self.website_active_listbox, self.website_inactive_listbox)
+        if items:
+            for url in items:
                 self.user_manager.remove_user('websites', url)
-                self.log(f"Removed website: {url}")
+            self.log(f"Removed website: {', '.join(items)}")
             self.refresh_website_lists()
     
     # Settings methods
@@ -2559,46 +3084,25 @@ Duplicate Detection:
     def save_settings(self):
         """Save settings to config file"""
         # Reddit settings removed - gallery-dl doesn't need API credentials
-        
-        self.config.set('twitter.bearer_token', self.twitter_bearer.get())
-        self.config.set('twitter.api_key', self.twitter_api_key.get())
-        self.config.set('twitter.api_secret', self.twitter_api_secret.get())
-        self.config.set('twitter.access_token', self.twitter_access_token.get())
-        self.config.set('twitter.access_token_secret', self.twitter_access_secret.get())
+        values = {f'twitter.{key}': getattr(self, attr).get()
+                  for key, attr in _TWITTER_CREDENTIAL_FIELDS}
         
         # OnlyFans OF-DL path
-        self.config.set('onlyfans.ofdl_path', self.ofdl_exe_path.get())
-        
-        # OnlyFans Download Options
-        self.config.set('onlyfans.download_posts', self.of_download_posts.get())
-        self.config.set('onlyfans.download_paid_posts', self.of_download_paid_posts.get())
-        self.config.set('onlyfans.download_messages', self.of_download_messages.get())
-        self.config.set('onlyfans.download_paid_messages', self.of_download_paid_messages.get())
-        self.config.set('onlyfans.download_stories', self.of_download_stories.get())
-        self.config.set('onlyfans.download_highlights', self.of_download_highlights.get())
-        self.config.set('onlyfans.download_archived', self.of_download_archived.get())
-        self.config.set('onlyfans.download_streams', self.of_download_streams.get())
-        self.config.set('onlyfans.download_images', self.of_download_images.get())
-        self.config.set('onlyfans.download_videos', self.of_download_videos.get())
-        self.config.set('onlyfans.download_audios', self.of_download_audios.get())
-        self.config.set('onlyfans.download_avatar_header', self.of_download_avatar_header.get())
-        self.config.set('onlyfans.folder_per_post', self.of_folder_per_post.get())
-        self.config.set('onlyfans.folder_per_paid_post', self.of_folder_per_paid_post.get())
-        self.config.set('onlyfans.folder_per_message', self.of_folder_per_message.get())
-        self.config.set('onlyfans.folder_per_paid_message', self.of_folder_per_paid_message.get())
-        self.config.set('onlyfans.skip_ads', self.of_skip_ads.get())
-        self.config.set('onlyfans.ignore_own_messages', self.of_ignore_own_messages.get())
-        self.config.set('onlyfans.include_expired', self.of_include_expired.get())
-        self.config.set('onlyfans.include_restricted', self.of_include_restricted.get())
-        self.config.set('onlyfans.download_duplicates', self.of_download_duplicates.get())
-        self.config.set('onlyfans.download_incrementally', self.of_download_incrementally.get())
-        
-        self.config.set('downloads.base_path', self.download_path.get())
-        self.config.set('downloads.redownload_deleted_files', self.redownload_deleted.get())
+        values['onlyfans.ofdl_path'] = self.ofdl_exe_path.get()
+        
+        values['downloads.base_path'] = self.download_path.get()
+        
+        # OnlyFans download options and other checkboxes: only those toggled since the last save
+        for key in self._dirty_settings:
+            values[key] = self._setting_vars[key].get()
+        self._dirty_settings.clear()
         
         # Website authentication settings
-        self.config.set('website.cookies', self.website_cookies.get('1.0', 'end-1c').strip())
-        self.config.set('website.custom_headers', self.website_headers.get('1.0', 'end-1c').strip())
+        values['website.cookies'] = self.website_cookies.get('1.0', 'end-1c').strip()
+        values['website.custom_headers'] = self.website_headers.get('1.0', 'end-1c').strip()
+        
+        # One merged update of the changed keys; config.json is written once, off the Tk thread
+        self.config.update(values, background=True)
         
         # Reset scrapers to use new credentials
         self.reddit_scraper = None
@@ -2609,6 +3113,24 @@ Duplicate Detection:
         self.log("Settings saved")
     
     # Scraping methods
+    @property
+    def is_paused(self):
+        """True while the current scraping task is paused"""
+        return not self._resume_event.is_set()
+    
+    @is_paused.setter
+    def is_paused(self, value):
+        if value:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+    
+    def wait_if_paused(self):
+        """Block the calling scrape thread until the task is resumed"""
+        if not self._resume_event.is_set():
+            self.update_status("⏸ Paused - Click Resume to continue")
+            self._resume_event.wait()
+    
     def toggle_pause(self):
         """Pause or resume the current scraping task"""
         if not self.is_downloading:
@@ -2653,17 +3175,15 @@ Duplicate Detection:
         start_date = None
         end_date = None
         
-        if start_date_str and start_date_str != "YYYY-MM-DD":
+        if start_date_str and start_date_str != _DATE_PLACEHOLDER:
             try:
-                from datetime import datetime
                 start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
                 self.log(f"📅 Using start date: {start_date_str}")
             except ValueError:
                 self.log(f"⚠️ Invalid start date format: {start_date_str}, ignoring")
         
-        if end_date_str and end_date_str != "YYYY-MM-DD":
+        if end_date_str and end_date_str != _DATE_PLACEHOLDER:
             try:
-                from datetime import datetime
                 end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
                 self.log(f"📅 Using end date: {end_date_str}")
             except ValueError:
@@ -2684,53 +3204,36 @@ Duplicate Detection:
                     duplicate_checker=self.duplicate_checker
                 )
             
+            self._wait_for_organize()
             base_path = self.config.get('downloads.base_path', 'Downloads')
+            auto_organize = bool(self.config.get('downloads.auto_organize_after_scrape', True))
             total_subreddits = len(subreddits)
             self.start_progress(total_subreddits)
             
             # Initialize Reddit tab progress
             self.reddit_progress_bar['maximum'] = total_subreddits
-            total_downloaded = 0
             
-            for idx, subreddit in enumerate(subreddits):
-                # Check for pause
-                while self.is_paused:
-                    self.update_status("⏸ Paused - Click Resume to continue")
-                    time.sleep(0.5)
-                
-                self.update_status(f"Scraping r/{subreddit}...")
-                self.reddit_current_op_var.set(f"Scraping r/{subreddit}...")
-                self.reddit_progress_var.set(idx)
-                percentage = ((idx) / total_subreddits) * 100
-                self.reddit_progress_text_var.set(f"{idx} / {total_subreddits} subreddits ({percentage:.1f}%)")
-                self.log(f"Starting scrape of r/{subreddit}")
-                
-                # Get sorting and limit settings
-                sort_by = self.subreddit_sort_var.get()
-                limit = None if self.subreddit_unlimited_var.get() else self.subreddit_limit_var.get()
-                
-                downloaded = self.reddit_scraper.scrape_subreddit(
+            # Get sorting and limit settings
+            sort_by = self.subreddit_sort_var.get()
+            limit = None if self.subreddit_unlimited_var.get() else self.subreddit_limit_var.get()
+            
+            def scrape_one(subreddit):
+                return self.reddit_scraper.scrape_subreddit(
                     subreddit, base_path, limit=limit, progress_callback=self.log,
                     start_date=start_date, end_date=end_date, sort_by=sort_by
                 )
-                
-                total_downloaded += len(downloaded)
-                self.log(f"Downloaded {len(downloaded)} files from r/{subreddit}")
-                self.reddit_details_var.set(f"Total files downloaded: {total_downloaded}")
-                self.update_progress(idx + 1)
+            
+            total_downloaded = self._run_reddit_pool(subreddits, 'subreddits', 'r/', scrape_one)
             
             # Final update
-            self.reddit_progress_var.set(total_subreddits)
-            self.reddit_progress_text_var.set(f"{total_subreddits} / {total_subreddits} subreddits (100%)")
-            self.reddit_current_op_var.set("Scraping complete!")
-            self.reddit_details_var.set(f"Total files downloaded: {total_downloaded}")
+            self.root.after(0, self._apply_reddit_progress, total_subreddits, total_subreddits, 'subreddits',
+                            "Scraping complete!", f"Total files downloaded: {total_downloaded}")
             
             # Send Discord completion notification
             
             # Auto-organize downloads if enabled
-            if bool(self.config.get('downloads.auto_organize_after_scrape', True)):
-                self.log("Auto-organizing downloads into subfolders...")
-                self.organize_downloads()
+            if auto_organize:
+                self._organize_after_scrape(base_path)
             
             self.end_progress()
             self.update_status("Scraping complete!")
@@ -2784,49 +3287,34 @@ Duplicate Detection:
                     duplicate_checker=self.duplicate_checker
                 )
             
+            self._wait_for_organize()
             base_path = self.config.get('downloads.base_path', 'Downloads')
+            auto_organize = bool(self.config.get('downloads.auto_organize_after_scrape', True))
             total_users = len(users)
             self.start_progress(total_users)
             
             # Initialize Reddit tab progress
             self.reddit_progress_bar['maximum'] = total_users
-            total_downloaded = 0
             
-            for idx, username in enumerate(users):
-                while self.is_paused:
-                    self.update_status("⏸ Paused - Click Resume to continue")
-                    time.sleep(0.5)
-                
-                self.update_status(f"Scraping u/{username}...")
-                self.reddit_current_op_var.set(f"Scraping u/{username}...")
-                self.reddit_progress_var.set(idx)
-                percentage = ((idx) / total_users) * 100
-                self.reddit_progress_text_var.set(f"{idx} / {total_users} users ({percentage:.1f}%)")
-                self.log(f"Starting scrape of u/{username}")
-                
-                # Check unlimited flag
-                unlimited = getattr(self, 'reddit_user_unlimited_var', None)
-                if unlimited and unlimited.get():
-                    limit = None
-                    self.log("⚡ Unlimited mode: scanning all posts from beginning of time...")
-                else:
-                    post_limit = getattr(self, 'reddit_user_limit_var', None)
-                    limit = post_limit.get() if post_limit else 100
-                
-                downloaded = self.reddit_scraper.scrape_user(
+            # Check unlimited flag
+            unlimited = getattr(self, 'reddit_user_unlimited_var', None)
+            if unlimited and unlimited.get():
+                limit = None
+                self.log("⚡ Unlimited mode: scanning all posts from beginning of time...")
+            else:
+                post_limit = getattr(self, 'reddit_user_limit_var', None)
+                limit = post_limit.get() if post_limit else 100
+            
+            def scrape_one(username):
+                return self.reddit_scraper.scrape_user(
                     username, base_path, limit=limit, progress_callback=self.log
                 )
-                
-                total_downloaded += len(downloaded)
-                self.log(f"Downloaded {len(downloaded)} files from u/{username}")
-                self.reddit_details_var.set(f"Total files downloaded: {total_downloaded}")
-                self.update_progress(idx + 1)
+            
+            total_downloaded = self._run_reddit_pool(users, 'users', 'u/', scrape_one)
             
             # Final update
-            self.reddit_progress_var.set(total_users)
-            self.reddit_progress_text_var.set(f"{total_users} / {total_users} users (100%)")
-            self.reddit_current_op_var.set("Scraping complete!")
-            self.reddit_details_var.set(f"Total files downloaded: {total_downloaded}")
+            self.root.after(0, self._apply_reddit_progress, total_users, total_users, 'users',
+                            "Scraping complete!", f"Total files downloaded: {total_downloaded}")
             
             # Send Discord notifications
             if total_downloaded > 0:
@@ -2835,9 +3323,8 @@ Duplicate Detection:
                 download_msg += f"• Files Downloaded: {total_downloaded}"
             
             # Auto-organize downloads if enabled
-            if bool(self.config.get('downloads.auto_organize_after_scrape', True)):
-                self.log("Auto-organizing downloads into subfolders...")
-                self.organize_downloads()
+            if auto_organize:
+                self._organize_after_scrape(base_path)
             
             self.end_progress()
             self.update_status("Scraping complete!")
@@ -2882,31 +3369,12 @@ Duplicate Detection:
         
         try:
             # Normalize any stored usernames (handle legacy entries with full URLs or leading @)
-            normalized = []
-            import re
-            from urllib.parse import urlparse
-            for u in users:
-                raw = u.strip()
-                raw = raw.lstrip('@')
-                if raw.startswith('http://') or raw.startswith('https://'):
-                    try:
-                        parsed = urlparse(raw)
-                        segments = [seg for seg in parsed.path.split('/') if seg]
-                        if segments:
-                            raw = segments[0]
-                    except Exception:
-                        pass
-                raw = raw.split('?')[0].split('#')[0]
-                cleaned = re.sub(r'[^A-Za-z0-9_]', '_', raw) or 'user'
-                normalized.append(cleaned)
+            normalized = [_normalize_twitter_handle(u) for u in users]
             # If normalization changed any, update user_manager storage (avoid duplicates)
             if set(normalized) != set(users):
-                # Remove all old entries and re-add normalized unique ones as active
-                for old in users:
-                    self.user_manager.remove_user('twitter', old)
-                for new in sorted(set(normalized)):
-                    self.user_manager.add_user('twitter', new, active=True)
+                # Swap the active list for the normalized unique handles in one write
                 users = sorted(set(normalized))
+                self.user_manager.replace_users('twitter', users)
                 self.refresh_twitter_user_lists()
                 self.log(f"Normalized Twitter usernames: {', '.join(users)}")
             if not self.twitter_scraper:
@@ -2923,19 +3391,21 @@ Duplicate Detection:
                     access_token=access_token if access_token else None,
                     access_token_secret=access_secret if access_secret else None,
                     history=self.download_history,
-                    duplicate_checker=self.duplicate_checker
+                    duplicate_checker=self.duplicate_checker,
+                    http_adapter=self.http_adapter
                 )
             
+            self._wait_for_organize()
             base_path = self.config.get('downloads.base_path', 'Downloads')
+            auto_organize = bool(self.config.get('downloads.auto_organize_after_scrape', True))
             total_users = len(users)
             self.start_progress(total_users)
             
+            total_downloaded = 0
             for idx, username in enumerate(users):
-                while self.is_paused:
-                    self.update_status("⏸ Paused - Click Resume to continue")
-                    time.sleep(0.5)
+                self.wait_if_paused()
                 
-                self.update_status(f"Scraping @{username}...")
+                self.root.after(0, self.update_status, f"Scraping @{username}...")
                 self.log(f"Starting scrape of @{username}")
                 
                 # Check unlimited flag
@@ -2950,20 +3420,17 @@ Duplicate Detection:
                     username, base_path, limit=limit, progress_callback=self.log
                 )
                 
+                total_downloaded += len(downloaded)
                 self.log(f"Downloaded {len(downloaded)} files from @{username}")
-                self.update_progress(idx + 1)
+                self.root.after(0, self.update_progress, idx + 1)
             
             # Auto-organize downloads if enabled
-            if bool(self.config.get('downloads.auto_organize_after_scrape', True)):
-                self.log("Auto-organizing downloads into subfolders...")
-                self.organize_downloads()
+            if auto_organize:
+                self._organize_after_scrape(base_path)
             
             self.end_progress()
             self.update_status("Scraping complete!")
-            self.log("All Twitter users scraped successfully")
-            
-            # Send Discord notification
-            total_downloaded = sum(len(self.twitter_scraper.scrape_user(u, base_path, limit=0, progress_callback=None)) for u in [])
+            self.log(f"All Twitter users scraped successfully ({total_downloaded} files downloaded)")
         
         except Exception as e:
             self.log(f"Error: {str(e)}")
@@ -2990,7 +3457,8 @@ Duplicate Detection:
         
         # Check if there are completed websites - offer to resume or start fresh
         completed = self.website_scrape_state.get('completed_websites', [])
-        remaining = [w for w in websites if w not in completed]
+        completed_set = set(completed)
+        remaining = [w for w in websites if w not in completed_set]
         
         resume_mode = False
         if completed and remaining:
@@ -3037,19 +3505,22 @@ Duplicate Detection:
             self.pause_button.config(text="⏸ Pause")
         
         try:
+            self._wait_for_organize()
             base_path = self.config.get('downloads.base_path', 'Downloads')
+            auto_organize = bool(self.config.get('downloads.auto_organize_after_scrape', True))
 
             # Queue for discovered media (persists between runs)
             queue_path = os.path.join(self.botfiles_dir, 'download_queue.json')
-            download_queue = DownloadQueue(queue_path)
+            download_queue = DownloadQueue(queue_path, unique_key='history_url')
             existing_pending = len(download_queue.as_list())
             if existing_pending:
                 self.log(f"Pending downloads from previous run: {existing_pending}")
             
             # Filter websites based on resume mode
-            completed = self.website_scrape_state.get('completed_websites', [])
+            completed = self.website_scrape_state.setdefault('completed_websites', [])
+            completed_set = set(completed)
             if resume_mode:
-                websites_to_scrape = [w for w in websites if w not in completed]
+                websites_to_scrape = [w for w in websites if w not in completed_set]
                 self.log(f"📋 Resume mode: Skipping {len(completed)} completed websites")
                 self.update_status(f"Resuming: {len(websites_to_scrape)} websites remaining...")
             else:
@@ -3078,97 +3549,112 @@ Duplicate Detection:
             except Exception:
                 workers = 5
             
-            # Reinitialize website scraper with new worker count and auth settings
-            self.website_scraper = WebsiteScraper(
-                history=self.download_history,
-                max_workers=workers,
-                aggressive_popup=bool(self.website_aggressive_popup_var.get()),
-                duplicate_checker=self.duplicate_checker,
-                cookies=self.config.get('website.cookies', ''),
-                custom_headers=self.config.get('website.custom_headers', '')
-            )
+            # Reuse the existing scraper (and its session/browser) unless saving
+            # settings dropped it; workers and popup mode are read per run
+            aggressive_popup = bool(self.website_aggressive_popup_var.get())
+            if self.website_scraper is None:
+                self.website_scraper = self._create_website_scraper(workers, aggressive_popup)
+            else:
+                self.website_scraper.max_workers = workers
+                self.website_scraper.aggressive_popup = aggressive_popup
             self.log(f"Aggressive popup removal: {'ON' if self.website_aggressive_popup_var.get() else 'OFF'}")
             self.log(f"Using {workers} concurrent workers for downloading")
 
             total_websites = len(websites_to_scrape)
             self.start_progress(total_websites)
 
-            total_discovered = 0
-            for idx, url in enumerate(websites_to_scrape):
-                while self.is_paused:
-                    self.update_status("⏸ Paused - Click Resume to continue")
-                    time.sleep(0.5)
-                
-                # Mark as current website
-                self.website_scrape_state['current_website'] = url
-                self._save_website_scrape_state()
-
-                self.update_status(f"Scanning {url[:60]}...")
-                self.log(f"Scanning {url} for media (phase 1: discovery)")
-
-                candidates = self.website_scraper.scrape_url(
-                    url,
-                    base_path,
-                    progress_callback=self.log,
-                    max_pages=max_pages,
-                    scroll_count=scroll_count,
-                    collect_only=True,
-                )
-
-                if candidates:
-                    download_queue.extend(candidates)
-                    total_discovered += len(candidates)
-                    self.log(f"Queued {len(candidates)} media items from {url}")
-                else:
-                    self.log(f"No new media discovered on {url}")
-                
-                # Mark website as completed
-                if url not in self.website_scrape_state['completed_websites']:
-                    self.website_scrape_state['completed_websites'].append(url)
-                    self._save_website_scrape_state()
-                    self.log(f"✓ Completed: {url}")
-
-                self.update_progress(idx + 1)
-
-            self.end_progress()
+            # Phase 2 runs alongside phase 1: the download thread drains whatever
+            # discovery has queued so far, then waits for the next site's batch
+            downloads = []
+            work_ready = threading.Event()
+            discovery_done = threading.Event()
 
-            download_queue.ensure_unique('history_url')
-            pending_total = len(download_queue.as_list())
-            newly_added = max(0, pending_total - existing_pending)
+            def download_worker():
+                while True:
+                    if len(download_queue):
+                        try:
+                            downloads.extend(self.website_scraper.process_download_queue(
+                                download_queue,
+                                progress_callback=self.log,
+                                resume_event=self._resume_event,
+                            ))
+                        except Exception as e:
+                            self.log(f"Error during downloads: {e}")
+                        continue
+                    if discovery_done.is_set():
+                        break
+                    work_ready.wait()
+                    work_ready.clear()
 
-            self.log(
-                f"Discovery complete. Pending downloads: {pending_total} "
-                f"(new queue entries: {newly_added}, discovered this run: {total_discovered})"
-            )
+            download_thread = threading.Thread(target=download_worker)
+            download_thread.daemon = True
+            download_thread.start()
 
-            if pending_total == 0:
-                self.update_status("No media queued for download.")
-                return
+            total_discovered = 0
+            # Bound once; the loop below can run over thousands of sites
+            log = self.log
+            update_progress = self.update_progress
+            mark_completed = completed.append
+            try:
+                for idx, url in enumerate(websites_to_scrape):
+                    self.wait_if_paused()
+                    
+                    # Mark as current website
+                    self.website_scrape_state['current_website'] = url
+                    self._schedule_website_scrape_state_save()
+
+                    self.update_status(f"Scanning {url[:60]}...")
+                    log(f"Scanning {url} for media (phase 1: discovery)")
+
+                    candidates = self.website_scraper.scrape_url(
+                        url,
+                        base_path,
+                        progress_callback=self.log,
+                        max_pages=max_pages,
+                        scroll_count=scroll_count,
+                        collect_only=True,
+                    )
 
-            self.update_status("Starting downloads (phase 2)...")
-            self.start_progress(pending_total)
+                    if candidates:
+                        queued = download_queue.extend(candidates)
+                        total_discovered += len(candidates)
+                        log(f"Queued {queued} media items from {url}")
+                        if queued:
+                            work_ready.set()
+                    else:
+                        log(f"No new media discovered on {url}")
+                    
+                    # Mark website as completed
+                    if url not in completed_set:
+                        completed_set.add(url)
+                        mark_completed(url)
+                        self._schedule_website_scrape_state_save()
+                        log(f"✓ Completed: {url}")
 
-            processed_count = 0
+                    update_progress(idx + 1)
 
-            def progress_hook(processed, succeeded):
-                nonlocal processed_count
-                processed_count = processed
-                self.update_progress(min(processed_count, pending_total))
+                self.end_progress()
 
-            downloads = self.website_scraper.process_download_queue(
-                download_queue,
-                progress_callback=self.log,
-                pause_checker=lambda: self.is_paused,
-                progress_hook=progress_hook,
-            )
+                pending_total = len(download_queue)
+                self.log(
+                    f"Discovery complete ({total_discovered} discovered this run). "
+                    f"Downloads still pending: {pending_total}"
+                )
+            finally:
+                discovery_done.set()
+                work_ready.set()
+                # Wait for phase 2 on every exit path, so is_downloading is never
+                # cleared while the download worker is still running
+                if download_thread.is_alive():
+                    self.update_status("Finishing downloads (phase 2)...")
+                download_thread.join()
 
-            self.end_progress()
             self.update_status("Downloads complete!" if downloads else "No new files downloaded.")
             self.log(f"Completed download phase: {len(downloads)} file(s) saved")
             
             # Clear current website marker
             self.website_scrape_state['current_website'] = None
-            self._save_website_scrape_state()
+            self._schedule_website_scrape_state_save()
             
             # Show completion summary
             completed_count = len(self.website_scrape_state['completed_websites'])
@@ -3176,25 +3662,24 @@ Duplicate Detection:
             
             # Send Discord notification to downloads channel
             if downloads:
-                total_size_mb = sum(os.path.getsize(f) / (1024 * 1024) for f in downloads if os.path.exists(f))
+                total_size_mb = _total_size_bytes(downloads) / (1024 * 1024)
                 download_msg = f"📥 **Website Scrape Complete**\n"
                 download_msg += f"• Files Downloaded: {len(downloads)}\n"
                 download_msg += f"• Total Size: {total_size_mb:.2f} MB\n"
                 download_msg += f"• Websites Processed: {completed_count}"
             
             # Auto-organize downloads if enabled
-            if downloads and bool(self.config.get('downloads.auto_organize_after_scrape', True)):
-                self.log("Auto-organizing downloads into subfolders...")
-                self.organize_downloads()
+            if downloads and auto_organize:
+                self._organize_after_scrape(base_path)
         
         except Exception as e:
             self.log(f"Error: {str(e)}")
             self.update_status("Error occurred during scraping")
             self.end_progress()
-            # Save state even on error so we can resume
-            self._save_website_scrape_state()
         
         finally:
+            # Flush state even on error/early exit so we can resume
+            self._save_website_scrape_state()
             self.is_downloading = False
             self.is_paused = False
             if hasattr(self, 'pause_button'):
@@ -3226,9 +3711,7 @@ Duplicate Detection:
         
         try:
             # Parse URL and custom name
-            parts = url_entry.strip().split(None, 1)
-            url = parts[0]
-            custom_name = parts[1] if len(parts) > 1 else None
+            url, custom_name = parse_url_entry(url_entry)
             
             # Check if it's a sitemap
             if 'sitemap' in url.lower() or url.endswith('.xml'):
@@ -3325,23 +3808,16 @@ Duplicate Detection:
         
         try:
             # Parse URL and custom name
-            parts = url_entry.strip().split(None, 1)
-            url = parts[0]
-            custom_name = parts[1] if len(parts) > 1 else None
+            url, custom_name = parse_url_entry(url_entry)
             
             base_path = self.config.get('downloads.base_path', 'Downloads')
             
             # Determine folder name
             if custom_name:
-                from .utils import sanitize_filename
                 folder_name = sanitize_filename(custom_name)
             else:
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc.replace('www.', '')
-                from .utils import sanitize_filename
-                folder_name = sanitize_filename(domain)
+                folder_name = sanitize_filename(strip_www(urlparse(url).netloc))
             
-            from .utils import ensure_download_directory
             download_path = ensure_download_directory(base_path, folder_name)
             
             self.log(f"Using gallery-dl to download: {url}")
@@ -3360,34 +3836,52 @@ Duplicate Detection:
             self.is_downloading = False
     
     # OnlyFans methods
+    def _ofdl_path_exists(self, ofdl_path):
+        """os.path.exists for the OF-DL path, remembered for 5 seconds so repeated clicks don't re-stat"""
+        if not ofdl_path:
+            return False
+        now = time.monotonic()
+        cached = self._ofdl_exists_cache
+        if cached and cached[0] == ofdl_path and now - cached[2] < 5:
+            return cached[1]
+        exists = os.path.exists(ofdl_path)
+        self._ofdl_exists_cache = (ofdl_path, exists, now)
+        return exists
+    
     def launch_ofdl_exe(self):
         """Launch OF-DL.exe"""
         ofdl_path = self.ofdl_exe_path.get().strip()
-        if not ofdl_path or not os.path.exists(ofdl_path):
+        if not self._ofdl_path_exists(ofdl_path):
             messagebox.showwarning("OF-DL Not Found", 
                 "Please set the OF-DL.exe path first.\n\n" +
                 "Click 'Download OF-DL' to get it, or 'Browse' to select existing installation.")
             return
         
-        import subprocess
         self.log("=" * 60)
         self.log("LAUNCHING OF-DL")
         self.log("=" * 60)
         self.log(f"OF-DL Path: {ofdl_path}")
         self.update_status("OF-DL launched")
         
-        try:
-            # Launch OF-DL.exe in its own directory
-            subprocess.Popen([ofdl_path], cwd=os.path.dirname(ofdl_path))
-            self.log("✓ OF-DL opened successfully")
-        except Exception as e:
-            self.log(f"✗ Failed to launch OF-DL: {str(e)}")
-            messagebox.showerror("Launch Error", f"Failed to launch OF-DL:\n{str(e)}")
+        # Launch OF-DL.exe in its own directory
+        self._launch_process([ofdl_path], "OF-DL", cwd=os.path.dirname(ofdl_path))
+    
+    def _launch_process(self, args, name, cwd=None):
+        """Start an external program on the process pool; report failure back on the Tk thread"""
+        def _done(future):
+            e = future.exception()
+            if e is None:
+                self.log(f"✓ {name} opened successfully")
+                return
+            self.log(f"✗ Failed to launch {name}: {str(e)}")
+            self.root.after(0, lambda: messagebox.showerror(
+                "Launch Error", f"Failed to launch {name}:\n{str(e)}"))
+        
+        self._proc_pool.submit(subprocess.Popen, args, cwd=cwd).add_done_callback(_done)
     
     # OF-DL Integration Methods
     def browse_ofdl_exe(self):
         """Browse for OF-DL.exe"""
-        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Select OF-DL.exe",
             filetypes=[("Executable", "*.exe"), ("All Files", "*.*")]
@@ -3400,14 +3894,13 @@ Duplicate Detection:
     
     def open_ofdl_download(self):
         """Open OF-DL download page"""
-        import webbrowser
         webbrowser.open('https://git.ofdl.tools/sim0n00ps/OF-DL/releases')
         self.log("Opening OF-DL download page in browser...")
     
     def edit_ofdl_config(self):
         """Open OF-DL config.json in notepad"""
         ofdl_path = self.ofdl_exe_path.get().strip()
-        if not ofdl_path or not os.path.exists(ofdl_path):
+        if not self._ofdl_path_exists(ofdl_path):
             messagebox.showwarning("OF-DL Not Found", "Please set the OF-DL.exe path first")
             return
         
@@ -3419,139 +3912,77 @@ Duplicate Detection:
             self._create_default_ofdl_config(config_path)
         
         # Open in notepad
-        import subprocess
-        subprocess.Popen(['notepad.exe', config_path])
-        self.log(f"Opened config.json in notepad: {config_path}")
+        self.log(f"Opening config.json in notepad: {config_path}")
+        self._launch_process(['notepad.exe', config_path], "notepad")
+    
+    def _onlyfans_settings(self):
+        """The onlyfans.* config section as a plain dict (one lookup instead of one per key)"""
+        section = self.config.get('onlyfans')
+        return section if isinstance(section, dict) else {}
+    
+    def _ofdl_gui_settings(self):
+        """OF-DL config.json values taken from the GUI's download path and onlyfans.* settings"""
+        of = self._onlyfans_settings()
+        values = {"DownloadPath": str(self.config.get('downloads.base_path', 'Downloads'))}
+        values.update({json_key: bool(of.get(key, default)) for json_key, key, default in _OFDL_OPTION_FIELDS})
+        return values
     
     def _create_default_ofdl_config(self, config_path):
         """Create default OF-DL config.json with GUI settings"""
-        import json
-        
-        config = {
-            "DownloadPath": str(self.config.get('downloads.base_path', 'Downloads')),
-            "DownloadPosts": bool(self.config.get('onlyfans.download_posts', True)),
-            "DownloadPaidPosts": bool(self.config.get('onlyfans.download_paid_posts', True)),
-            "DownloadMessages": bool(self.config.get('onlyfans.download_messages', True)),
-            "DownloadPaidMessages": bool(self.config.get('onlyfans.download_paid_messages', True)),
-            "DownloadStories": bool(self.config.get('onlyfans.download_stories', True)),
-            "DownloadHighlights": bool(self.config.get('onlyfans.download_highlights', True)),
-            "DownloadArchived": bool(self.config.get('onlyfans.download_archived', True)),
-            "DownloadStreams": bool(self.config.get('onlyfans.download_streams', True)),
-            "DownloadImages": bool(self.config.get('onlyfans.download_images', True)),
-            "DownloadVideos": bool(self.config.get('onlyfans.download_videos', True)),
-            "DownloadAudios": bool(self.config.get('onlyfans.download_audios', True)),
-            "DownloadAvatarHeaderPhoto": bool(self.config.get('onlyfans.download_avatar_header', True)),
-            "FolderPerPost": bool(self.config.get('onlyfans.folder_per_post', False)),
-            "FolderPerPaidPost": bool(self.config.get('onlyfans.folder_per_paid_post', False)),
-            "FolderPerMessage": bool(self.config.get('onlyfans.folder_per_message', False)),
-            "FolderPerPaidMessage": bool(self.config.get('onlyfans.folder_per_paid_message', False)),
-            "SkipAds": bool(self.config.get('onlyfans.skip_ads', False)),
-            "IgnoreOwnMessages": bool(self.config.get('onlyfans.ignore_own_messages', False)),
-            "IncludeExpiredSubscriptions": bool(self.config.get('onlyfans.include_expired', False)),
-            "IncludeRestrictedSubscriptions": bool(self.config.get('onlyfans.include_restricted', False)),
-            "DownloadDuplicatedMedia": bool(self.config.get('onlyfans.download_duplicates', False)),
-            "DownloadPostsIncrementally": bool(self.config.get('onlyfans.download_incrementally', False)),
-            "NonInteractiveMode": False,
-            "LoggingLevel": "Information"
-        }
         
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config = self._ofdl_gui_settings()
+        config.update(_OFDL_NEW_CONFIG_DEFAULTS)
+        
+        self._write_ofdl_config(config_path, json.dumps(config, indent=2))
         
         self.log(f"Created default config.json: {config_path}")
     
+    def _write_ofdl_config(self, config_path, payload):
+        """Atomically replace OF-DL's config.json with payload"""
+        tmp_path = config_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, config_path)
+    
     def _update_ofdl_config(self, config_path, custom_list=None, paid_only=False, expired_only=False):
         """Update OF-DL config.json with current GUI settings"""
-        import json
-        
-        # Load existing config or create new
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+        # Load existing config or create new; if the file is untouched since we
+        # last read/wrote it, reuse that dict instead of re-reading it
+        try:
+            st = os.stat(config_path)
+            stamp = (config_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        cached = self._ofdl_config_cache
+        if stamp is None:
+            existing = {}
+        elif cached is not None and cached[0] == stamp:
+            existing = cached[1]
         else:
-            config = {}
+            with open(config_path, 'r') as f:
+                existing = json.load(f)
+            self._ofdl_config_cache = (stamp, existing)
+        config = dict(existing)
         
-        # If expired_only mode, focus on expired/restricted subscriptions
+        # Start from the GUI settings, then apply the mode's fixed values
+        config.update(self._ofdl_gui_settings())
         if expired_only:
-            config["DownloadPath"] = str(self.config.get('downloads.base_path', 'Downloads'))
-            config["DownloadPosts"] = True
-            config["DownloadPaidPosts"] = True
-            config["DownloadMessages"] = True
-            config["DownloadPaidMessages"] = True
-            config["DownloadStories"] = True  # Get everything while accounts still accessible
-            config["DownloadHighlights"] = True
-            config["DownloadArchived"] = True
-            config["DownloadStreams"] = True
-            config["DownloadImages"] = True
-            config["DownloadVideos"] = True
-            config["DownloadAudios"] = True
-            config["DownloadAvatarHeaderPhoto"] = True
-            config["FolderPerPost"] = bool(self.config.get('onlyfans.folder_per_post', False))
-            config["FolderPerPaidPost"] = bool(self.config.get('onlyfans.folder_per_paid_post', False))
-            config["FolderPerMessage"] = bool(self.config.get('onlyfans.folder_per_message', False))
-            config["FolderPerPaidMessage"] = bool(self.config.get('onlyfans.folder_per_paid_message', False))
-            config["SkipAds"] = True
-            config["IgnoreOwnMessages"] = True
-            config["IncludeExpiredSubscriptions"] = True  # KEY: Include expired
-            config["IncludeRestrictedSubscriptions"] = True  # KEY: Include restricted/deleted
-            config["DownloadDuplicatedMedia"] = False
-            config["DownloadPostsIncrementally"] = False
+            config.update(_OFDL_EXPIRED_OVERRIDES)
             self.log("Config mode: EXPIRED/DELETED ACCOUNTS (includes expired + restricted)")
-        # If paid_only mode, prioritize paid content
         elif paid_only:
-            config["DownloadPath"] = str(self.config.get('downloads.base_path', 'Downloads'))
-            config["DownloadPosts"] = False  # Skip free posts
-            config["DownloadPaidPosts"] = True  # Download paid posts
-            config["DownloadMessages"] = False  # Skip free messages
-            config["DownloadPaidMessages"] = True  # Download paid messages
-            config["DownloadStories"] = False
-            config["DownloadHighlights"] = False
-            config["DownloadArchived"] = True  # May contain paid content
-            config["DownloadStreams"] = False
-            config["DownloadImages"] = True
-            config["DownloadVideos"] = True
-            config["DownloadAudios"] = True
-            config["DownloadAvatarHeaderPhoto"] = False
-            config["FolderPerPost"] = bool(self.config.get('onlyfans.folder_per_post', False))
-            config["FolderPerPaidPost"] = True  # Organize paid posts
-            config["FolderPerMessage"] = bool(self.config.get('onlyfans.folder_per_message', False))
-            config["FolderPerPaidMessage"] = True  # Organize paid messages
-            config["SkipAds"] = True
-            config["IgnoreOwnMessages"] = True
-            config["IncludeExpiredSubscriptions"] = True  # Include expired to get all paid content
-            config["IncludeRestrictedSubscriptions"] = True
-            config["DownloadDuplicatedMedia"] = False
-            config["DownloadPostsIncrementally"] = bool(self.config.get('onlyfans.download_incrementally', False))
+            config.update(_OFDL_PAID_OVERRIDES)
             self.log("Config mode: PAID CONTENT ONLY (paid posts + paid messages)")
-        else:
-            # Normal mode: use GUI settings
-            config["DownloadPath"] = str(self.config.get('downloads.base_path', 'Downloads'))
-            config["DownloadPosts"] = bool(self.config.get('onlyfans.download_posts', True))
-            config["DownloadPaidPosts"] = bool(self.config.get('onlyfans.download_paid_posts', True))
-            config["DownloadMessages"] = bool(self.config.get('onlyfans.download_messages', True))
-            config["DownloadPaidMessages"] = bool(self.config.get('onlyfans.download_paid_messages', True))
-            config["DownloadStories"] = bool(self.config.get('onlyfans.download_stories', True))
-            config["DownloadHighlights"] = bool(self.config.get('onlyfans.download_highlights', True))
-            config["DownloadArchived"] = bool(self.config.get('onlyfans.download_archived', True))
-            config["DownloadStreams"] = bool(self.config.get('onlyfans.download_streams', True))
-            config["DownloadImages"] = bool(self.config.get('onlyfans.download_images', True))
-            config["DownloadVideos"] = bool(self.config.get('onlyfans.download_videos', True))
-            config["DownloadAudios"] = bool(self.config.get('onlyfans.download_audios', True))
-            config["DownloadAvatarHeaderPhoto"] = bool(self.config.get('onlyfans.download_avatar_header', True))
-            config["FolderPerPost"] = bool(self.config.get('onlyfans.folder_per_post', False))
-            config["FolderPerPaidPost"] = bool(self.config.get('onlyfans.folder_per_paid_post', False))
-            config["FolderPerMessage"] = bool(self.config.get('onlyfans.folder_per_message', False))
-            config["FolderPerPaidMessage"] = bool(self.config.get('onlyfans.folder_per_paid_message', False))
-            config["SkipAds"] = bool(self.config.get('onlyfans.skip_ads', False))
-            config["IgnoreOwnMessages"] = bool(self.config.get('onlyfans.ignore_own_messages', False))
-            config["IncludeExpiredSubscriptions"] = bool(self.config.get('onlyfans.include_expired', False))
-            config["IncludeRestrictedSubscriptions"] = bool(self.config.get('onlyfans.include_restricted', False))
-            config["DownloadDuplicatedMedia"] = bool(self.config.get('onlyfans.download_duplicates', False))
-            config["DownloadPostsIncrementally"] = bool(self.config.get('onlyfans.download_incrementally', False))
-        
-        # Save
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        
+        # Save (skipped when nothing changed)
+        if stamp is not None and config == existing:
+            self.log(f"OF-DL config already up to date: {config_path}")
+            return
+        self._write_ofdl_config(config_path, json.dumps(config, indent=2))
+        try:
+            st = os.stat(config_path)
+            self._ofdl_config_cache = ((config_path, st.st_mtime_ns, st.st_size), config)
+        except OSError:
+            self._ofdl_config_cache = None
         
         self.log(f"Updated OF-DL config: {config_path}")
     
@@ -3563,10 +3994,68 @@ Duplicate Detection:
     # OnlyFans' anti-bot detection that immediately logs out API-based authentication attempts.
     
     # UI update methods
+    def _run_reddit_pool(self, names, unit, prefix, scrape_one):
+        """Run scrape_one(name) for each name on a small worker pool.
+        
+        Each gallery-dl run is its own subprocess, so a few can overlap; the
+        pool size (reddit.max_workers, default 3) keeps us polite to Reddit.
+        A name that raises is logged and counted as 0 files.
+        Returns the total number of files downloaded.
+        """
+        total = len(names)
+        try:
+            workers = int(self.config.get('reddit.max_workers', 3))
+        except (TypeError, ValueError):
+            workers = 3
+        workers = max(1, min(workers, 8, total))
+        
+        def run(name):
+            self.wait_if_paused()
+            self.root.after(0, self.reddit_current_op_var.set, f"Scraping {prefix}{name}...")
+            self.log(f"Starting scrape of {prefix}{name}")
+            return scrape_one(name)
+        
+        self.root.after(0, self._apply_reddit_progress, 0, total, unit,
+                        f"Scraping {total} {unit} ({workers} at a time)...")
+        total_downloaded = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, name): name for name in names}
+            for done, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    count = len(future.result())
+                except Exception as e:
+                    self.log(f"Failed {prefix}{name}: {e}")
+                    count = 0
+                else:
+                    self.log(f"Downloaded {count} files from {prefix}{name}")
+                total_downloaded += count
+                self.root.after(0, self._apply_reddit_progress, done, total, unit,
+                                None, f"Total files downloaded: {total_downloaded}")
+        return total_downloaded
+    
+    def _apply_reddit_progress(self, done, total, unit, current_op=None, details=None):
+        """Apply one Reddit-tab progress snapshot on the Tk thread (scheduled with root.after).
+        A snapshot without current_op marks an item as finished and advances the status-bar progress."""
+        if current_op is not None:
+            self.status_var.set(current_op)
+            self.reddit_current_op_var.set(current_op)
+        else:
+            self.update_progress(done)
+        # Item-start and final snapshots often repeat the last count; skip those
+        key = (done, total, unit)
+        if key != self._reddit_progress_key:
+            self._reddit_progress_key = key
+            self.reddit_progress_var.set(done)
+            percentage = done * 100.0 / total if total else 0
+            self.reddit_progress_text_var.set(f"{done} / {total} {unit} ({percentage:.1f}%)")
+        if details is not None:
+            self.reddit_details_var.set(details)
+    
     def update_status(self, message):
         """Update status bar"""
         self.status_var.set(message)
-        self.root.update_idletasks()
+        self._idle_dirty = True
     
     def start_progress(self, total):
         """Initialize progress bar for download operation"""
@@ -3578,12 +4067,18 @@ Duplicate Detection:
         self.update_progress_status()
     
     def update_progress(self, current=None):
-        """Update progress bar and status text"""
+        """Update progress count; the bar and status text are redrawn at most ~20 times a second"""
         if current is not None:
             self.current_progress = current
         else:
             self.current_progress += 1
         
+        if self._progress_commit_id is None:
+            self._progress_commit_id = self.root.after(50, self._commit_progress)
+    
+    def _commit_progress(self):
+        """Draw the latest progress count (scheduled by update_progress)"""
+        self._progress_commit_id = None
         self.progress_bar['value'] = self.current_progress
         self.update_progress_status()
     
@@ -3592,10 +4087,26 @@ Duplicate Detection:
         if self.total_items > 0:
             percentage = (self.current_progress / self.total_items) * 100
             self.status_var.set(f"Downloading {self.current_progress}/{self.total_items} ({percentage:.1f}%)")
-        self.root.update_idletasks()
+        self._idle_dirty = True
+    
+    def _idle_pulse(self):
+        """Redraw pending status/progress changes at most every 50 ms"""
+        if self._idle_dirty:
+            self._idle_dirty = False
+            try:
+                self.root.update_idletasks()
+            except Exception:
+                pass
+        self.root.after(50, self._idle_pulse)
     
     def end_progress(self):
         """Hide progress bar after completion"""
+        if self._progress_commit_id is not None:
+            try:
+                self.root.after_cancel(self._progress_commit_id)
+            except Exception:
+                pass
+            self._progress_commit_id = None
         self.progress_bar.pack_forget()
         self.current_progress = 0
         self.total_items = 0
@@ -3605,10 +4116,9 @@ Duplicate Detection:
         try:
             if total and hasattr(self, 'dup_progress_bar'):
                 self.dup_progress_bar['maximum'] = max(1, total)
-                self.dup_progress_bar['value'] = 0
                 self.dup_progress_bar.pack(fill='x', pady=(6,0))
-                if hasattr(self, 'dup_progress_var'):
-                    self.dup_progress_var.set(f"Preparing... 0/{total} (0%)")
+                self.dup_progress_bar['value'] = 0
+                self.dup_progress_var.set(f"Preparing... 0/{total} (0%)")
             # Mirror to global status bar progress
             if total:
                 self.start_progress(total)
@@ -3621,14 +4131,44 @@ Duplicate Detection:
             self._mini_progress_show(total)
         except Exception:
             pass
+        # Draw progress posted by the worker every 100 ms until _dup_progress_finish.
+        # Drop any tuple left by a sweep that failed before finishing.
+        self._dup_update_pending = None
+        self._dup_update_drawn = None
+        self._stop_dup_progress_tick()
+        self._dup_update_id = self.root.after(100, self._dup_progress_tick)
 
     def _dup_progress_update(self, current: int, total: int):
+        """Record scan progress. Safe to call from the worker thread: it only stores
+        the numbers, _dup_progress_tick draws the latest ones on the Tk thread."""
+        self._dup_update_pending = (current, total)
+
+    def _dup_progress_tick(self):
+        self._dup_update_id = self.root.after(100, self._dup_progress_tick)
+        self._apply_dup_progress_update()
+
+    def _stop_dup_progress_tick(self):
+        if self._dup_update_id is not None:
+            try:
+                self.root.after_cancel(self._dup_update_id)
+            except Exception:
+                pass
+            self._dup_update_id = None
+
+    def _apply_dup_progress_update(self):
+        # Read the worker's slot once and never clear it, so a write landing meanwhile isn't lost
+        pending = self._dup_update_pending
+        if pending is None or pending == self._dup_update_drawn:
+            return
+        self._dup_update_drawn = pending
+        current, total = pending
         try:
+            pct = (current / total * 100) if total else 0
             if hasattr(self, 'dup_progress_bar'):
+                if total:
+                    self.dup_progress_bar['maximum'] = max(1, total)
                 self.dup_progress_bar['value'] = min(current, max(1, total))
-                pct = (current / total * 100) if total else 0
-                if hasattr(self, 'dup_progress_var'):
-                    self.dup_progress_var.set(f"Scanning {current}/{total} ({pct:.1f}%)")
+                self.dup_progress_var.set(f"Scanning {current}/{total} ({pct:.1f}%)")
             # Mirror to global status bar
             if total:
                 self.progress_bar['maximum'] = max(1, total)
@@ -3644,6 +4184,9 @@ Duplicate Detection:
             pass
 
     def _dup_progress_finish(self):
+        self._stop_dup_progress_tick()
+        self._dup_update_pending = None
+        self._dup_update_drawn = None
         try:
             if hasattr(self, 'dup_progress_var'):
                 self.dup_progress_var.set("Done")
@@ -3665,6 +4208,16 @@ Duplicate Detection:
             # reset flags
             self.dup_pause_flag = False
             self.dup_cancel_flag = False
+            # Reuse the window from a previous scan (hidden by _mini_progress_finish)
+            win = getattr(self, 'mini_prog_win', None)
+            if win is not None and win.winfo_exists():
+                win.title("Scanning… 0%")
+                self.mini_prog_var.set("Preparing…")
+                self.mini_prog_bar.configure(maximum=max(1, total), value=0)
+                self.mini_pause_btn.configure(text="Pause")
+                win.deiconify()
+                win.lift()
+                return
             # create window
             self.mini_prog_win = tk.Toplevel(self.root)
             self.mini_prog_win.title("Scanning… 0%")
@@ -3705,8 +4258,7 @@ Duplicate Detection:
     def _mini_progress_finish(self):
         try:
             if hasattr(self, 'mini_prog_win') and self.mini_prog_win:
-                self.mini_prog_win.destroy()
-                self.mini_prog_win = None
+                self.mini_prog_win.withdraw()
         except Exception:
             pass
 
@@ -3730,68 +4282,83 @@ Duplicate Detection:
 
     # Toggle maximize of Duplicates tab log section
     def toggle_dup_log_maximize(self):
+        """Show only the Duplicates activity log, or restore the full tab layout"""
+        self.dup_log_max = not self.dup_log_max
         try:
-            self.dup_log_max = not getattr(self, 'dup_log_max', False)
-            frames = [
-                getattr(self, 'dup_info_frame', None),
-                getattr(self, 'dup_quick_frame', None),
-                getattr(self, 'dup_filters_frame', None),
-                getattr(self, 'dup_manage_frame', None),
-                getattr(self, 'dup_stats_frame', None),
-                getattr(self, 'dup_prog_frame', None),
-            ]
-            if self.dup_log_max:
-                # Hide all but progress+log; expand log
-                for f in frames:
-                    try:
-                        if f: f.pack_forget()
-                    except Exception:
-                        pass
-                try:
-                    self.dup_log_frame.pack_forget()
-                    self.dup_log_frame.pack(fill='both', expand=True, padx=10, pady=5)
-                except Exception:
-                    pass
-            else:
-                # Restore layout by repacking frames in order
-                try:
-                    if self.dup_info_frame: self.dup_info_frame.pack(fill='x', padx=10, pady=5)
-                    if self.dup_quick_frame: self.dup_quick_frame.pack(fill='x', padx=10, pady=5)
-                    if self.dup_filters_frame: self.dup_filters_frame.pack(fill='x', padx=10, pady=5)
-                    if self.dup_manage_frame: self.dup_manage_frame.pack(fill='x', padx=10, pady=5)
-                    if self.dup_stats_frame: self.dup_stats_frame.pack(fill='x', padx=10, pady=5)
-                    if self.dup_prog_frame: self.dup_prog_frame.pack(fill='x', padx=10, pady=5)
-                    self.dup_log_frame.pack_forget()
-                    self.dup_log_frame.pack(fill='both', expand=True, padx=10, pady=5)
-                except Exception:
-                    pass
+            for frame in self._dup_collapsible_frames:
+                if self.dup_log_max:
+                    frame.pack_forget()
+                else:
+                    frame.pack(fill='x', padx=10, pady=5)
+            # Re-pack the log last so it sits below any restored frames
+            self.dup_log_frame.pack_forget()
+            self.dup_log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         except Exception:
             pass
     
+    def _append_log(self, widget, message):
+        """Append a line to a log widget, autoscrolling only if it was already at the bottom."""
+        at_bottom = widget.yview()[1] >= 0.999
+        widget.insert(tk.END, message + '\n')
+        if at_bottom:
+            widget.see(tk.END)
+
     def log(self, message):
-        """Add message to log"""
+        """Add message to log. Safe from any thread: it only queues the line,
+        _poll_log writes it out on the Tk thread."""
+        self._log_queue.append(message)
+    
+    def _poll_log(self):
+        """Flush queued log lines every 50 ms"""
+        if self._log_queue:
+            self._flush_log()
+        self.root.after(50, self._poll_log)
+    
+    def _flush_log(self):
+        """Write all queued log lines to the log widgets with one insert each"""
+        if not self._log_queue:
+            return
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
         # Main log (Settings tab)
         try:
-            self.log_text.insert(tk.END, message + '\n')
-            self.log_text.see(tk.END)
+            self._append_log(self.log_text, '\n'.join(lines))
         except Exception:
             pass
         # Duplicates tab log (if present)
         if hasattr(self, 'dup_log_text'):
             try:
-                self.dup_log_text.insert(tk.END, message + '\n')
-                self.dup_log_text.see(tk.END)
+                self._mirror_log(self.dup_log_text, lines,
+                                 lambda text: self._append_log(self.dup_log_text, text))
             except Exception:
                 pass
         # Floating log window (if open)
         if hasattr(self, 'floating_log_text') and self.floating_log_text:
             try:
-                self.floating_log_text.insert(tk.END, message + '\n')
-                if not getattr(self, 'floating_log_paused', False):
-                    self.floating_log_text.see(tk.END)
+                self._mirror_log(self.floating_log_text, lines, self._write_floating_log)
             except Exception:
                 pass
-        self.root.update_idletasks()
+    
+    def _mirror_log(self, widget, lines, write):
+        """Pass lines to write() if widget is on screen, otherwise keep the most
+        recent ones until its <Map> event calls this again with no new lines."""
+        key = str(widget)
+        if not widget.winfo_ismapped():
+            if lines:
+                self._log_backlog.setdefault(key, deque(maxlen=5000)).extend(lines)
+            return
+        backlog = self._log_backlog.pop(key, None)
+        if backlog:
+            backlog.extend(lines)
+            lines = backlog
+        if lines:
+            write('\n'.join(lines))
+    
+    def _write_floating_log(self, text):
+        self.floating_log_text.insert(tk.END, text + '\n')
+        if not getattr(self, 'floating_log_paused', False):
+            self.floating_log_text.see(tk.END)
 
     # Floating log window for visibility when main window is minimized
     def open_floating_log(self):
@@ -3828,11 +4395,13 @@ Duplicate Detection:
             ttk.Button(header, text="Clear", command=lambda: self.floating_log_text.delete('1.0', tk.END)).pack(side=tk.LEFT)
             body = ttk.Frame(frm)
             body.pack(fill='both', expand=True)
-            self.floating_log_text = tk.Text(body, wrap='word')
+            self.floating_log_text = tk.Text(body, wrap='word', font=self.log_font, tabs=self.log_tabs)
             fl_scroll = ttk.Scrollbar(body, orient='vertical', command=self.floating_log_text.yview)
             self.floating_log_text.configure(yscrollcommand=fl_scroll.set)
             self.floating_log_text.pack(side=tk.LEFT, fill='both', expand=True)
             fl_scroll.pack(side=tk.RIGHT, fill='y')
+            self.floating_log_text.bind('<Map>', lambda e: self._mirror_log(
+                self.floating_log_text, (), self._write_floating_log))
         except Exception:
             pass
     
@@ -3842,24 +4411,7 @@ Duplicate Detection:
         history_stats = self.download_history.get_statistics()
         file_stats = self.duplicate_checker.get_statistics()
         
-        msg = "Download History Statistics:\n\n"
-        msg += f"Reddit:\n"
-        msg += f"  - {history_stats['total_reddit_sources']} sources tracked\n"
-        msg += f"  - {history_stats['total_reddit_posts']} posts seen\n\n"
-        msg += f"Twitter:\n"
-        msg += f"  - {history_stats['total_twitter_sources']} users tracked\n"
-        msg += f"  - {history_stats['total_twitter_tweets']} tweets seen\n\n"
-        msg += f"Websites:\n"
-        msg += f"  - {history_stats['total_websites']} websites tracked\n"
-        msg += f"  - {history_stats['total_website_urls']} URLs seen\n\n"
-        
-        msg += "="*40 + "\n\n"
-        msg += f"Downloaded Files:\n"
-        msg += f"  - {file_stats['video_count']} videos\n"
-        msg += f"  - {file_stats['image_count']} images\n"
-        msg += f"  - {file_stats['other_count']} other files\n"
-        msg += f"  - {file_stats['total_files']} total files\n\n"
-        msg += f"Total Size: {file_stats['total_size_gb']:.2f} GB ({file_stats['total_size_mb']:.2f} MB)\n"
+        msg = _HISTORY_STATS_TEMPLATE.format_map({**history_stats, **file_stats})
         
         messagebox.showinfo("Download History Statistics", msg)
         self.log("Displayed history statistics")
@@ -3883,7 +4435,6 @@ Duplicate Detection:
         base_path = str(self.config.get('downloads.base_path', 'Downloads'))
         
         # Let user choose the root folder (e.g., Downloads\OnlyFans)
-        from tkinter import filedialog
         root_dir = filedialog.askdirectory(
             title="Select root folder (e.g., Downloads\\OnlyFans) - will flatten each username subfolder",
             initialdir=base_path
@@ -3894,7 +4445,8 @@ Duplicate Detection:
         
         # Find all immediate subdirectories (usernames)
         try:
-            subdirs = [d for d in os.listdir(root_dir) if os.path.isdir(os.path.join(root_dir, d))]
+            with os.scandir(root_dir) as it:
+                subdirs = [entry.name for entry in it if entry.is_dir()]
         except Exception as e:
             messagebox.showerror("Error", f"Cannot read directory:\n\n{e}")
             return
@@ -3973,54 +4525,57 @@ Duplicate Detection:
         """Flatten a single folder structure and return counts (moved, removed_dirs, errors)"""
         moved_count = 0
         error_count = 0
+        # Names taken in root (normcase'd), so collisions are resolved without probing the disk
+        try:
+            root_names = {os.path.normcase(name) for name in os.listdir(root_dir)}
+        except OSError:
+            root_names = set()
         
-        # Walk through all subdirectories
-        for dirpath, dirnames, filenames in os.walk(root_dir, topdown=False):
+        # Walk through all subdirectories (root itself is listed first, before any moves)
+        for dirpath, entries in _scan_tree(root_dir):
             # Skip the root directory itself
             if dirpath == root_dir:
                 continue
             
-            for filename in filenames:
-                source_path = os.path.join(dirpath, filename)
+            for entry in entries:
+                filename = entry.name
+                source_path = entry.path
+                dest_name = filename
                 dest_path = os.path.join(root_dir, filename)
                 
                 try:
                     # If file already exists in root, handle conflict
-                    if os.path.exists(dest_path):
+                    if os.path.normcase(dest_name) in root_names:
                         # Check if they're the same file
-                        if os.path.samefile(source_path, dest_path):
+                        if os.path.exists(dest_path) and os.path.samefile(source_path, dest_path):
                             continue
                         
                         # Handle naming conflict - add number suffix
                         base, ext = os.path.splitext(filename)
                         counter = 1
-                        while os.path.exists(dest_path):
-                            dest_path = os.path.join(root_dir, f"{base}_{counter}{ext}")
+                        while os.path.normcase(dest_name) in root_names:
+                            dest_name = f"{base}_{counter}{ext}"
                             counter += 1
+                        dest_path = os.path.join(root_dir, dest_name)
                     
                     # Move file to root
-                    import shutil
-                    shutil.move(source_path, dest_path)
+                    _fast_move(source_path, dest_path)
+                    root_names.add(os.path.normcase(dest_name))
                     moved_count += 1
                 
                 except Exception as e:
                     error_count += 1
         
-        # Remove empty directories (call multiple times to catch nested empties)
+        # Remove empty directories (nested empties go in the same pass)
         self.log(f"  Removing empty folders from: {root_dir}")
-        empty_dirs_removed = 0
-        for _ in range(3):  # Run multiple passes to catch nested empty folders
-            removed = self._delete_empty_folders(root_dir)
-            empty_dirs_removed += removed
-            if removed == 0:
-                break
+        empty_dirs_removed = self._delete_empty_folders(root_dir)
         
         return moved_count, empty_dirs_removed, error_count
     
     # Duplicate detection and migration
     def scan_existing_files(self):
         """Scan existing Downloads folder and add files to hash database"""
-        if self.is_downloading:
+        if self._is_busy():
             messagebox.showwarning("Warning", "Please wait for current operation to complete")
             return
         
@@ -4060,7 +4615,7 @@ Duplicate Detection:
     def scan_and_move_duplicates(self):
         """Advanced: Choose source drive to scan, find duplicates (including matches
         against tracked database), then choose where to move them."""
-        if self.is_downloading:
+        if self._is_busy():
             messagebox.showwarning("Warning", "Please wait for current operation to complete")
             return
         
@@ -4075,30 +4630,23 @@ Duplicate Detection:
             return
         
         self.log(f"Advanced scan: Source={source_dir}, Destination={dest_dir}")
+        threads = self._hash_thread_count()
         
         def _worker():
             try:
-                # Phase 1: group by file size
-                size_map = {}
-                for r, dnames, fnames in os.walk(source_dir):
-                    for fn in fnames:
-                        fp = os.path.join(r, fn)
-                        try:
-                            size = os.path.getsize(fp)
-                        except Exception:
-                            continue
-                        size_map.setdefault(size, []).append(fp)
-                
-                # Phase 2: hash files and build source hash groups
+                # Phase 1+2: group by file size (streamed), hash and build source hash groups
                 source_hash_groups = {}
-                for size, paths in size_map.items():
-                    # Hash all files for this size bucket (even if only one) so we can
-                    # also detect duplicates against the tracked database.
-                    for fp in paths:
-                        h = self.duplicate_checker.calculate_file_hash(fp)
-                        if not h:
-                            continue
-                        source_hash_groups.setdefault(h, []).append(fp)
+                new_hashes = []
+                # A file can only be a duplicate if another source file or a tracked
+                # database entry has the same size; hash just those.
+                has_size = self.duplicate_checker.has_size
+                jobs = (item for size, paths in _size_buckets(_sized_files(source_dir))
+                        if len(paths) > 1 or has_size(size) for item in _with_stat(paths))
+                for fp, _, h in self._hash_in_parallel(jobs, new_hashes, threads):
+                    if not h:
+                        continue
+                    source_hash_groups.setdefault(h, []).append(fp)
+                self.duplicate_checker.hash_cache.put_many(new_hashes)
 
                 # Phase 3: merge with tracked database so duplicates across locations are found
                 duplicates = {}
@@ -4127,40 +4675,46 @@ Duplicate Detection:
     
     def scan_drive_for_duplicates(self):
         """Choose a folder/drive and scan for duplicate files with selection dialog."""
-        if self.is_downloading:
+        if self._is_busy():
             messagebox.showwarning("Warning", "Please wait for current operation to complete")
             return
         root_dir = filedialog.askdirectory(title="Choose folder/drive to scan")
         if not root_dir:
             return
         self.log(f"Scanning for duplicates under: {root_dir}")
+        threads = self._hash_thread_count()
 
         def _worker():
             try:
-                # Phase 1: group by file size to reduce hashing
-                size_map = {}
-                for r, dnames, fnames in os.walk(root_dir):
-                    for fn in fnames:
-                        fp = os.path.join(r, fn)
-                        try:
-                            size = os.path.getsize(fp)
-                        except Exception:
-                            continue
-                        size_map.setdefault(size, []).append(fp)
-                # Phase 2: hash only files with same size
+                # Phase 1+2: group by file size (streamed), then head-hash
+                # (first 64 KiB) only files with same size
                 duplicates = {}
-                for size, paths in size_map.items():
-                    if len(paths) < 2:
+                new_hashes = []
+                head_groups = {}
+                jobs = (item for size, paths in _size_buckets(_sized_files(root_dir))
+                        if len(paths) > 1 for item in _with_stat(paths))
+                for fp, st, head in self._hash_in_parallel(jobs, new_hashes, threads,
+                                                           self.duplicate_checker.cached_head_hash):
+                    if head:
+                        head_groups.setdefault((st.st_size, head), []).append((fp, st))
+                # Phase 3: full hash only files whose size and head both match.
+                # A head hash already covers the whole of a small file.
+                hash_groups = {}
+                jobs = []
+                for (size, head), items in head_groups.items():
+                    if len(items) < 2:
                         continue
-                    hash_groups = {}
-                    for fp in paths:
-                        h = self.duplicate_checker.calculate_file_hash(fp)
-                        if not h:
-                            continue
+                    if size <= HEAD_BYTES:
+                        hash_groups[head] = [fp for fp, _ in items]
+                    else:
+                        jobs.extend(items)
+                for fp, _, h in self._hash_in_parallel(jobs, new_hashes, threads):
+                    if h:
                         hash_groups.setdefault(h, []).append(fp)
-                    for h, files in hash_groups.items():
-                        if len(files) > 1:
-                            duplicates[h] = files
+                for h, files in hash_groups.items():
+                    if len(files) > 1:
+                        duplicates[h] = files
+                self.duplicate_checker.hash_cache.put_many(new_hashes)
                 self.root.after(0, lambda: self._show_duplicate_dialog(duplicates, root_for_cleanup=root_dir))
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Scan Error", str(e)))
@@ -4168,11 +4722,50 @@ Duplicate Detection:
         t.daemon = True
         t.start()
 
+    def _hash_in_parallel(self, jobs, new_hashes, threads, hash_func=None):
+        """Hash (path, stat) pairs from jobs on a thread pool, yielding (path, stat, hash or None)
+        in job order. Only a few jobs per thread are in flight at once, so a generator
+        feeding this can still pause or stop the scan between files.
+        hash_func defaults to duplicate_checker.cached_file_hash."""
+        hash_func = hash_func or self.duplicate_checker.cached_file_hash
+        window = deque()
+        # Hard links share one inode, so one read gives the hash for all of them
+        linked = {}
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for fp, st in jobs:
+                future = key = None
+                if st is not None and st.st_nlink > 1 and st.st_ino:
+                    key = (st.st_dev, st.st_ino)
+                    future = linked.get(key)
+                if future is None:
+                    future = pool.submit(hash_func, fp, st, new_hashes)
+                    if key:
+                        linked[key] = future
+                window.append((fp, st, future))
+                if len(window) >= threads * 4:
+                    yield self._hash_result(*window.popleft())
+            while window:
+                yield self._hash_result(*window.popleft())
+
+    @staticmethod
+    def _hash_result(fp, st, future):
+        try:
+            return fp, st, future.result()
+        except Exception:
+            return fp, st, None
+
+    def _hash_thread_count(self):
+        """Number of files hashed at once by the duplicate scans (Filters > Hash threads)"""
+        try:
+            return max(1, min(32, int(self.filter_hash_threads.get())))
+        except Exception:
+            return 4
+
     def _run_preserve_duplicates(self, source_dir: str, dest_dir: str):
         """Generic runner: scan source, move duplicates to dest preserving structure, clean empty folders.
         Now merges with global hash DB to detect cross-folder duplicates.
         Honors filter settings from the Filters section."""
-        if self.is_downloading:
+        if self._is_busy():
             messagebox.showwarning("Busy", "Please wait for current operation to complete")
             return
 
@@ -4180,120 +4773,139 @@ Duplicate Detection:
         filters = self._get_filters()
 
         self.is_downloading = True
+        # A Cancel from an earlier run must not stop this one before its progress window is up
+        self.dup_pause_flag = False
+        self.dup_cancel_flag = False
         self.update_status(f"Scanning {source_dir} for duplicates...")
         self.log(f"Run: scanning {source_dir} and moving duplicates to {dest_dir} (preserve structure + global DB)")
 
         def _worker():
-            import shutil
             try:
                 dest_abs = os.path.abspath(dest_dir).lower()
+                # Walk from an absolute, normalized root so every entry.path is already absolute
                 source_abs = os.path.abspath(source_dir)
-                # Phase 0: pre-count eligible files for progress
+                exclude_re = filters['exclude_re']
+                
+                def keep_dir(entry):
+                    # prune the destination folder and excluded folders
+                    return (entry.path.lower() != dest_abs
+                            and not (exclude_re and exclude_re.search(entry.path)))
+                
+                passes = _compile_file_filter(
+                    dest_abs, exclude_re, filters['include_exts'], filters['min_size_bytes'],
+                    self._is_hidden_or_system_win if filters['ignore_hidden_system'] else None)
+                
+                # Phase 0: walk once, keeping the eligible files (their count drives the progress bar)
                 self.log("📊 Phase 1/3: Counting eligible files...")
-                total_candidates = 0
+                candidates = []
                 folders_counted = 0
-                import time
                 count_start = time.time()
-                for r, dnames, fnames in os.walk(source_abs):
-                    dnames[:] = [d for d in dnames
-                                 if os.path.abspath(os.path.join(r, d)).lower() != dest_abs
-                                 and not any(tok in os.path.abspath(os.path.join(r, d)).lower() for tok in filters['exclude_tokens'])]
+                for r, entries in _scan_tree(source_abs, keep_dir):
                     folders_counted += 1
                     if folders_counted % 100 == 0:
-                        self.log(f"  Counting... {folders_counted} folders checked, {total_candidates} files found")
-                    for fn in fnames:
-                        fp = os.path.join(r, fn)
-                        abspath_lower = os.path.abspath(fp).lower()
-                        if abspath_lower.startswith(dest_abs):
-                            continue
-                        if any(tok in abspath_lower for tok in filters['exclude_tokens']):
-                            continue
-                        ext = os.path.splitext(fp)[1].lower()
-                        if filters['include_exts'] and ext not in filters['include_exts']:
-                            continue
-                        try:
-                            if os.path.getsize(fp) < filters['min_size_bytes']:
-                                continue
-                        except Exception:
-                            continue
-                        if filters['ignore_hidden_system'] and self._is_hidden_or_system_win(fp):
-                            continue
-                        total_candidates += 1
+                        self.log(f"  Counting... {folders_counted} folders checked, {len(candidates)} files found")
+                    for entry in entries:
+                        st = passes(entry)
+                        if st is not None:
+                            candidates.append((entry.path, st))
                 count_elapsed = time.time() - count_start
-                self.log(f"✓ Found {total_candidates} eligible files in {folders_counted} folders ({count_elapsed:.1f}s)")
-
-                # Prime the duplicates progress bar in UI thread
-                self.root.after(0, lambda: self._dup_progress_start(total_candidates))
-
-                # Phase 1: hash all files under source (excluding dest_dir)
+                self.log(f"✓ Found {len(candidates)} eligible files in {folders_counted} folders ({count_elapsed:.1f}s)")
+                # A file whose size matches no other candidate and no tracked file can't be a duplicate
+                size_counts = Counter(st.st_size for _, st in candidates)
+                has_size = self.duplicate_checker.has_size
+                new_hashes = []
+                unique_sized = len(candidates)
+                candidates = [(fp, st) for fp, st in candidates
+                              if size_counts[st.st_size] > 1 or has_size(st.st_size)]
+                unique_sized -= len(candidates)
+                if unique_sized:
+                    self.log(f"  Skipping {unique_sized} files with a unique size (no possible duplicate)")
+                canceled = False
+                # Only sizes the global DB doesn't track can be ruled out by their first 64 KiB;
+                # a head hash of a small file costs as much as its full hash
+                head_candidates = [(fp, st) for fp, st in candidates
+                                   if st.st_size > HEAD_BYTES and not has_size(st.st_size)]
+                head_total = len(head_candidates)
+
+                # Prime the duplicates progress bar (and its Pause/Cancel window) in UI thread
+                progress_total = head_total or len(candidates)
+                self.root.after(0, lambda: self._dup_progress_start(progress_total))
+
+                def head_jobs():
+                    # Feed the head-hash pool, with cancel/pause checks between files
+                    nonlocal canceled
+                    for item in head_candidates:
+                        if getattr(self, 'dup_cancel_flag', False):
+                            canceled = True
+                            return
+                        while getattr(self, 'dup_pause_flag', False):
+                            time.sleep(0.2)
+                        yield item
+
+                head_groups = {}
+                head_checked = set()
+                if head_total:
+                    self.log(f"  Comparing the first 64 KiB of {head_total} files...")
+                for fp, st, head in self._hash_in_parallel(head_jobs(), new_hashes, filters['hash_threads'],
+                                                           self.duplicate_checker.cached_head_hash):
+                    head_checked.add(fp)
+                    self._dup_progress_update(len(head_checked), head_total)
+                    if head:
+                        head_groups.setdefault((st.st_size, head), []).append(fp)
+                if head_checked and not canceled:
+                    head_matched = {fp for paths in head_groups.values() if len(paths) > 1 for fp in paths}
+                    candidates = [(fp, st) for fp, st in candidates
+                                  if fp not in head_checked or fp in head_matched]
+                    if len(head_checked) > len(head_matched):
+                        self.log(f"  Skipping {len(head_checked) - len(head_matched)} more files whose first 64 KiB match no other file")
+                total_candidates = len(candidates)
+                if head_total and not canceled:
+                    # Same progress window, now counting full hashes
+                    self._dup_progress_update(0, total_candidates)
+
+                # Phase 1: hash the files found above
                 self.log("🔍 Phase 2/3: Scanning and hashing files...")
                 hash_groups = {}
-                folders_scanned = 0
                 files_hashed = 0
-                files_skipped = 0
-                canceled = False
                 hash_start = time.time()
                 last_log_time = hash_start
-                for r, dnames, fnames in os.walk(source_abs):
-                    # prune destination folder to avoid scanning it
-                    dnames[:] = [d for d in dnames
-                                 if os.path.abspath(os.path.join(r, d)).lower() != dest_abs
-                                 and not any(tok in os.path.abspath(os.path.join(r, d)).lower() for tok in filters['exclude_tokens'])]
-                    folders_scanned += 1
-                    current_time = time.time()
-                    # Log every 3 seconds or every 100 folders
-                    if current_time - last_log_time >= 3.0 or folders_scanned % 100 == 0:
-                        elapsed = current_time - hash_start
-                        rate = files_hashed / elapsed if elapsed > 0 else 0
-                        rel_folder = os.path.relpath(r, source_abs)
-                        if len(rel_folder) > 60:
-                            rel_folder = rel_folder[:57] + "..."
-                        self.log(f"  📁 {rel_folder}")
-                        self.log(f"     {files_hashed}/{total_candidates} hashed ({rate:.1f} files/sec) | {folders_scanned} folders")
-                        last_log_time = current_time
-                    for fn in fnames:
-                        # cancel/pause checks
+                
+                def candidate_files():
+                    # Feed the hash pool, with cancel/pause checks between files
+                    nonlocal canceled, last_log_time
+                    for fp, st in candidates:
                         if getattr(self, 'dup_cancel_flag', False):
                             canceled = True
-                            break
+                            return
                         while getattr(self, 'dup_pause_flag', False):
                             time.sleep(0.2)
-                        fp = os.path.join(r, fn)
-                        try:
-                            # skip any files inside dest (extra safety)
-                            if os.path.abspath(fp).lower().startswith(dest_abs):
-                                continue
-                            abspath_lower = os.path.abspath(fp).lower()
-                            if any(tok in abspath_lower for tok in filters['exclude_tokens']):
-                                continue
-                            # type filter
-                            ext = os.path.splitext(fp)[1].lower()
-                            if filters['include_exts'] and ext not in filters['include_exts']:
-                                continue
-                            # size filter
-                            try:
-                                if os.path.getsize(fp) < filters['min_size_bytes']:
-                                    continue
-                            except Exception:
-                                continue
-                            # hidden/system
-                            if filters['ignore_hidden_system'] and self._is_hidden_or_system_win(fp):
-                                continue
-                            h = self.duplicate_checker.calculate_file_hash(fp)
-                        except Exception:
-                            h = None
-                        if not h:
-                            continue
-                        hash_groups.setdefault(h, []).append(fp)
-                        files_hashed += 1
-                        # update progress
-                        if total_candidates:
-                            curr = files_hashed if files_hashed <= total_candidates else total_candidates
-                            self.root.after(0, lambda c=curr, t=total_candidates: self._dup_progress_update(c, t))
-
+                        current_time = time.time()
+                        # Log every 3 seconds
+                        if current_time - last_log_time >= 3.0:
+                            elapsed = current_time - hash_start
+                            rate = files_hashed / elapsed if elapsed > 0 else 0
+                            rel_folder = os.path.relpath(os.path.dirname(fp), source_abs)
+                            if len(rel_folder) > 60:
+                                rel_folder = rel_folder[:57] + "..."
+                            self.log(f"  📁 {rel_folder}")
+                            self.log(f"     {files_hashed}/{total_candidates} hashed ({rate:.1f} files/sec)")
+                            last_log_time = current_time
+                        yield fp, st
+                
+                for fp, _, h in self._hash_in_parallel(candidate_files(), new_hashes, filters['hash_threads']):
+                    if not h:
+                        continue
+                    hash_groups.setdefault(h, []).append(fp)
+                    files_hashed += 1
+                    # update progress (drawn by the Tk-thread ticker)
+                    if total_candidates:
+                        self._dup_progress_update(min(files_hashed, total_candidates), total_candidates)
+
+                # Cache even a canceled run's hashes; they stay valid for the next scan
+                self.duplicate_checker.hash_cache.put_many(new_hashes)
                 hash_elapsed = time.time() - hash_start
                 avg_rate = files_hashed / hash_elapsed if hash_elapsed > 0 else 0
-                self.log(f"✓ Hashing complete: {files_hashed} files in {folders_scanned} folders ({hash_elapsed:.1f}s, avg {avg_rate:.1f} files/sec)")
+                self.log(f"✓ Hashing complete: {files_hashed} files in {folders_counted} folders ({hash_elapsed:.1f}s, avg {avg_rate:.1f} files/sec)")
                 
                 if canceled:
                     self.log("❌ Scan canceled by user")
@@ -4330,7 +4942,7 @@ Duplicate Detection:
                         for p in final_paths:
                             rel = os.path.relpath(p, start=source_abs)
                             dest_path = os.path.join(dest_dir, rel)
-                            to_move.append((p, dest_path))
+                            to_move.append((p, dest_path, h))
                         dup_groups += 1
                     elif len(final_paths) > 1:
                         # Internal duplicates within source (keep first)
@@ -4338,7 +4950,7 @@ Duplicate Detection:
                         for p in final_paths[1:]:
                             rel = os.path.relpath(p, start=source_abs)
                             dest_path = os.path.join(dest_dir, rel)
-                            to_move.append((p, dest_path))
+                            to_move.append((p, dest_path, h))
                 
                 self.log(f"✓ Found {dup_groups} duplicate groups ({cross_folder_matches} cross-folder) with {len(to_move)} files to move")
                 if len(to_move) == 0:
@@ -4351,26 +4963,33 @@ Duplicate Detection:
                 failed = 0
                 move_start = time.time()
                 last_move_log = time.time()
-                for idx, (src, dst) in enumerate(to_move, 1):
+                # Destination folder -> names already in it (normcase'd), listed once on first use
+                dest_names = {}
+                for idx, (src, dst, h) in enumerate(to_move, 1):
                     if getattr(self, 'dup_cancel_flag', False):
                         canceled = True
                         break
                     while getattr(self, 'dup_pause_flag', False):
                         time.sleep(0.2)
                     try:
-                        os.makedirs(os.path.dirname(dst), exist_ok=True)
-                        # handle collisions at destination
-                        base, ext = os.path.splitext(os.path.basename(dst))
                         dst_dirname = os.path.dirname(dst)
-                        candidate = dst
+                        names = dest_names.get(dst_dirname)
+                        if names is None:
+                            os.makedirs(dst_dirname, exist_ok=True)
+                            names = dest_names[dst_dirname] = {os.path.normcase(n) for n in os.listdir(dst_dirname)}
+                        # handle collisions at destination
+                        name = os.path.basename(dst)
+                        base, ext = os.path.splitext(name)
                         counter = 1
-                        while os.path.exists(candidate):
-                            candidate = os.path.join(dst_dirname, f"{base} ({counter}){ext}")
+                        while os.path.normcase(name) in names:
+                            name = f"{base} ({counter}){ext}"
                             counter += 1
-                        shutil.move(src, candidate)
+                        candidate = os.path.join(dst_dirname, name)
+                        _fast_move(src, candidate)
+                        names.add(os.path.normcase(name))
                         try:
                             self.duplicate_checker.remove_file(src)
-                            self.duplicate_checker.add_file(candidate)
+                            self.duplicate_checker.add_file(candidate, file_hash=h)
                         except Exception:
                             pass
                         moved += 1
@@ -4403,7 +5022,7 @@ Duplicate Detection:
                     self.log("✅ DUPLICATE SCAN COMPLETE")
                 self.log(f"  Source: {source_dir}")
                 self.log(f"  Destination: {dest_dir}")
-                self.log(f"  Files scanned: {files_hashed} in {folders_scanned} folders")
+                self.log(f"  Files scanned: {files_hashed} in {folders_counted} folders")
                 self.log(f"  Duplicate groups: {dup_groups if not canceled else '(partial)'}")
                 self.log(f"  Files moved: {moved}")
                 self.log(f"  Failed: {failed}")
@@ -4412,7 +5031,7 @@ Duplicate Detection:
                 self.log("="*60)
                 
                 summary_msg = (
-                    f"Visited {folders_scanned} folders\nHashed {files_hashed} files\n"
+                    f"Visited {folders_counted} folders\nHashed {files_hashed} files\n"
                     f"Moved {moved} file(s) to {dest_dir}\nFailed: {failed}\nRemoved empty folders: {removed}"
                 )
                 if canceled:
@@ -4420,6 +5039,8 @@ Duplicate Detection:
                 self.root.after(0, lambda m=summary_msg: messagebox.showinfo("Sweep Complete", m))
                 self.root.after(0, self._dup_progress_finish)
             finally:
+                # Stop the progress ticker even if the worker failed before finishing
+                self.root.after(0, self._stop_dup_progress_tick)
                 self.is_downloading = False
                 self.update_status("Idle")
 
@@ -4472,6 +5093,7 @@ Duplicate Detection:
             raw = self.filter_exclude_paths.get()
             if raw:
                 exclude_tokens = [t.strip().lower() for t in raw.split(';') if t.strip()]
+        exclude_re = self._compile_exclude_filter(exclude_tokens)
 
         ignore_hidden_system = False
         if getattr(self, 'filter_ignore_hidden_system', None):
@@ -4484,18 +5106,38 @@ Duplicate Detection:
             'include_exts': include,
             'min_size_bytes': min_size_bytes,
             'exclude_tokens': exclude_tokens,
+            'exclude_re': exclude_re,
             'ignore_hidden_system': ignore_hidden_system,
+            'hash_threads': self._hash_thread_count(),
         }
 
-    def _is_hidden_or_system_win(self, path: str) -> bool:
-        """Return True if file is hidden or system on Windows; else False."""
+    def _compile_exclude_filter(self, exclude_tokens=None):
+        """Compile the exclude-path tokens into one case-insensitive regex.
+        A single search per path replaces a Python loop over every token.
+        Returns None (and stores it on self._exclude_re) when nothing is excluded."""
+        if exclude_tokens is None:
+            raw = self.filter_exclude_paths.get() if getattr(self, 'filter_exclude_paths', None) else ''
+            exclude_tokens = [t.strip().lower() for t in raw.split(';') if t.strip()]
+        if exclude_tokens:
+            self._exclude_re = re.compile('|'.join(re.escape(t) for t in exclude_tokens), re.IGNORECASE)
+        else:
+            self._exclude_re = None
+        return self._exclude_re
+
+    def _is_hidden_or_system_win(self, path: str, stat_result=None) -> bool:
+        """Return True if file is hidden or system on Windows; else False.
+        Pass a stat_result (e.g. DirEntry.stat()) to reuse its st_file_attributes
+        instead of asking the OS again."""
+        FILE_ATTRIBUTE_HIDDEN = 0x2
+        FILE_ATTRIBUTE_SYSTEM = 0x4
+        attrs = getattr(stat_result, 'st_file_attributes', None)
+        if attrs is not None:
+            return bool(attrs & (FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM))
         try:
             import ctypes
             attrs = ctypes.windll.kernel32.GetFileAttributesW(ctypes.c_wchar_p(path))
             if attrs == -1:
                 return False
-            FILE_ATTRIBUTE_HIDDEN = 0x2
-            FILE_ATTRIBUTE_SYSTEM = 0x4
             return bool(attrs & (FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM))
         except Exception:
             return False
@@ -4526,7 +5168,7 @@ Duplicate Detection:
         self._run_preserve_duplicates(source_dir, dest_dir)
 
     def refresh_drive_list(self):
-        """Populate drive selection combobox with available Windows drives."""
+        """Populate the drive list with available Windows drives and their free/total space."""
         drives = []
         for code in range(ord('A'), ord('Z') + 1):
             letter = chr(code)
@@ -4536,9 +5178,41 @@ Duplicate Detection:
                     drives.append(root[:-1])  # store like 'C:'
             except Exception:
                 pass
-        self.drive_select_combo['values'] = drives
-        if drives and not self.drive_select_var.get():
-            self.drive_select_var.set(drives[0])
+        self.drive_tv.delete(*self.drive_tv.get_children())
+        for drive in drives:
+            self.drive_tv.insert('', 'end', iid=drive, values=(drive, "…", "…"))
+        # Slow network shares and empty removable drives can stall disk_usage for seconds
+        self._run_bg(self._load_drive_usage, drives)
+        if drives:
+            current = self.drive_select_var.get()
+            selected = current if current in drives else drives[0]
+            self.drive_tv.selection_set(selected)
+            self.drive_select_var.set(selected)
+        else:
+            self.drive_select_var.set("")
+
+    def _load_drive_usage(self, drives):
+        """Read free/total space per drive off the Tk thread and fill in the drive list rows."""
+        for drive in drives:
+            try:
+                usage = shutil.disk_usage(f"{drive}\\")
+                free = f"{usage.free / (1024 ** 3):.1f} GB"
+                total = f"{usage.total / (1024 ** 3):.1f} GB"
+            except Exception:
+                free = total = "?"
+            self.root.after(0, self._set_drive_usage, drive, free, total)
+
+    def _set_drive_usage(self, drive, free, total):
+        """Fill one drive row's Free/Total cells, unless a later refresh removed the row."""
+        if self.drive_tv.exists(drive):
+            self.drive_tv.set(drive, 'free', free)
+            self.drive_tv.set(drive, 'total', total)
+
+    def _on_drive_select(self, event=None):
+        """Keep drive_select_var in sync with the highlighted drive row."""
+        selection = self.drive_tv.selection()
+        if selection:
+            self.drive_select_var.set(selection[0])
 
     def run_global_sweep(self):
         """One-click global sweep of entire Downloads folder for duplicates"""
@@ -4567,21 +5241,18 @@ Duplicate Detection:
     
     def browse_dup_folder(self):
         """Browse for a folder to scan for duplicates"""
-        from tkinter import filedialog
         folder = filedialog.askdirectory(title="Select folder to scan for duplicates")
         if folder:
             self.dup_folder_var.set(folder)
     
     def browse_organizer_source(self):
         """Browse for source directory to organize"""
-        from tkinter import filedialog
         folder = filedialog.askdirectory(title="Select source directory to search for media files")
         if folder:
             self.organizer_source_var.set(folder)
     
     def browse_organizer_dest(self):
         """Browse for destination directory"""
-        from tkinter import filedialog
         folder = filedialog.askdirectory(title="Select destination folder to move files to")
         if folder:
             self.organizer_dest_var.set(folder)
@@ -4628,7 +5299,7 @@ Duplicate Detection:
                         found_files.append(filepath)
             
             # Calculate total size
-            total_size = sum(os.path.getsize(f) for f in found_files if os.path.exists(f))
+            total_size = _total_size_bytes(found_files)
             size_mb = total_size / (1024 * 1024)
             size_gb = size_mb / 1024
             
@@ -4659,6 +5330,9 @@ Duplicate Detection:
     
     def organizer_move_files(self):
         """Move the scanned files to destination"""
+        if self._is_busy():
+            messagebox.showwarning("Busy", "Please wait for current operation to complete")
+            return
         source = self.organizer_source_var.get().strip()
         dest = self.organizer_dest_var.get().strip()
         
@@ -4701,6 +5375,7 @@ Duplicate Detection:
         error_count = 0
         skip_duplicates = self.org_skip_duplicates.get()
         seen_hashes = set()
+        new_hashes = []
         
         for i, filepath in enumerate(self._organizer_found_files, 1):
             try:
@@ -4709,11 +5384,14 @@ Duplicate Detection:
                     continue
                 
                 # Check for duplicates if enabled
+                pending = []
                 if skip_duplicates:
-                    import hashlib
-                    with open(filepath, 'rb') as f:
-                        file_hash = hashlib.sha256(f.read()).hexdigest()
+                    file_hash = self.duplicate_checker.cached_file_hash(filepath, pending=pending)
+                    if not file_hash:
+                        raise OSError("could not read file")
                     if file_hash in seen_hashes:
+                        # Stays where it is, so its cache row does too
+                        new_hashes.extend(pending)
                         skipped_count += 1
                         continue
                     seen_hashes.add(file_hash)
@@ -4730,8 +5408,9 @@ Duplicate Detection:
                     counter += 1
                 
                 # Move file
-                import shutil
                 shutil.move(filepath, dest_path)
+                # A move keeps size and mtime, so the hash is cached under the new path
+                new_hashes.extend((dest_path,) + row[1:] for row in pending)
                 moved_count += 1
                 
                 # Update progress every 10 files
@@ -4743,6 +5422,9 @@ Duplicate Detection:
                 error_count += 1
                 self.dup_log_text.insert(tk.END, f"❌ Error moving {os.path.basename(filepath)}: {str(e)}\n")
         
+        # Store the hashes computed above in one transaction
+        self.duplicate_checker.hash_cache.put_many(new_hashes)
+        
         # Show results
         result = f"\n✅ Move operation complete!\n"
         result += f"Moved: {moved_count} files\n"
@@ -4782,7 +5464,7 @@ Duplicate Detection:
         self._run_preserve_duplicates(folder, dest_dir)
     
     def run_selected_drive_preserve_duplicates(self):
-        """Run preserving structure using the drive selected in the combobox and a destination name."""
+        """Run preserving structure using the drive selected in the drive list and a destination name."""
         drive = self.drive_select_var.get()
         if not drive:
             messagebox.showwarning("No Drive Selected", "Please select a drive from the list.")
@@ -4864,7 +5546,7 @@ Duplicate Detection:
         
         total_duplicates = sum(len(files) - 1 for files in duplicates.values())
         ttk.Label(info_frame, text=f"Found {len(duplicates)} groups of duplicates ({total_duplicates} duplicate files)", 
-                 font=('TkDefaultFont', 10, 'bold')).pack(anchor='w')
+                 font=self.subheading_font).pack(anchor='w')
         ttk.Label(info_frame, text="Select files to delete (keeps first file in each group):", 
                  foreground="gray").pack(anchor='w', pady=(5, 0))
         
@@ -4891,6 +5573,7 @@ Duplicate Detection:
         canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         selected_files = []
+        existing = _existing_paths(fp for files in duplicates.values() for fp in files)
         
         # Display each group of duplicates
         for idx, (file_hash, files) in enumerate(duplicates.items(), 1):
@@ -4898,14 +5581,14 @@ Duplicate Detection:
             group_frame.pack(fill='x', padx=10, pady=5)
             
             for i, file_path in enumerate(files):
-                file_exists = os.path.exists(file_path)
+                file_exists = file_path in existing
                 status = "✓" if file_exists else "✗ Missing"
                 
                 file_frame = ttk.Frame(group_frame)
                 file_frame.pack(fill='x', pady=2)
                 
                 var = tk.BooleanVar(value=(i > 0 and file_exists))  # Auto-select all except first
-                selected_files.append((var, file_path))
+                selected_files.append((var, file_path, file_hash))
                 
                 cb = ttk.Checkbutton(file_frame, variable=var, 
                                     text=f"{status} {file_path}" if i > 0 else f"KEEP: {file_path}",
@@ -4920,7 +5603,7 @@ Duplicate Detection:
         btn_frame.pack(fill='x', side='bottom')
         
         def delete_selected():
-            to_delete = [path for var, path in selected_files if var.get()]
+            to_delete = [path for var, path, _ in selected_files if var.get()]
             if not to_delete:
                 messagebox.showinfo("No Selection", "No files selected for deletion")
                 return
@@ -4936,11 +5619,12 @@ Duplicate Detection:
                 failed = 0
                 for file_path in to_delete:
                     try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                            self.duplicate_checker.remove_file(file_path)
-                            deleted += 1
-                            self.log(f"Deleted duplicate: {file_path}")
+                        os.remove(file_path)
+                        self.duplicate_checker.remove_file(file_path)
+                        deleted += 1
+                        self.log(f"Deleted duplicate: {file_path}")
+                    except FileNotFoundError:
+                        continue
                     except Exception as e:
                         failed += 1
                         self.log(f"Failed to delete {file_path}: {e}")
@@ -4958,7 +5642,7 @@ Duplicate Detection:
                 self.log(f"Deleted {deleted} duplicate files")
         
         def move_selected():
-            to_move = [path for var, path in selected_files if var.get()]
+            to_move = [(path, file_hash) for var, path, file_hash in selected_files if var.get()]
             if not to_move:
                 messagebox.showinfo("No Selection", "No files selected to move")
                 return
@@ -4969,27 +5653,30 @@ Duplicate Detection:
             
             moved = 0
             failed = 0
-            import shutil
-            for file_path in to_move:
+            # Names already in the destination (normcase'd), listed once
+            dest_names = {os.path.normcase(n) for n in os.listdir(dest_folder)}
+            for file_path, file_hash in to_move:
                 try:
-                    if os.path.exists(file_path):
-                        fname = os.path.basename(file_path)
-                        dest = os.path.join(dest_folder, fname)
-                        # Handle name collisions
-                        base, ext = os.path.splitext(fname)
-                        counter = 1
-                        while os.path.exists(dest):
-                            dest = os.path.join(dest_folder, f"{base} ({counter}){ext}")
-                            counter += 1
-                        shutil.move(file_path, dest)
-                        # Update duplicate tracker
-                        try:
-                            self.duplicate_checker.remove_file(file_path)
-                            self.duplicate_checker.add_file(dest)
-                        except Exception:
-                            pass
-                        moved += 1
-                        self.log(f"Moved duplicate: {file_path} → {dest}")
+                    fname = os.path.basename(file_path)
+                    # Handle name collisions
+                    base, ext = os.path.splitext(fname)
+                    counter = 1
+                    while os.path.normcase(fname) in dest_names:
+                        fname = f"{base} ({counter}){ext}"
+                        counter += 1
+                    dest = os.path.join(dest_folder, fname)
+                    shutil.move(file_path, dest)
+                    dest_names.add(os.path.normcase(fname))
+                    # Update duplicate tracker
+                    try:
+                        self.duplicate_checker.remove_file(file_path)
+                        self.duplicate_checker.add_file(dest, file_hash=file_hash)
+                    except Exception:
+                        pass
+                    moved += 1
+                    self.log(f"Moved duplicate: {file_path} → {dest}")
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     failed += 1
                     self.log(f"Failed to move {file_path}: {e}")
@@ -5030,9 +5717,9 @@ Duplicate Detection:
         
         total_duplicates = sum(len(files) - 1 for files in duplicates.values())
         ttk.Label(info_frame, text=f"Found {len(duplicates)} groups ({total_duplicates} duplicates)", 
-                 font=('TkDefaultFont', 10, 'bold')).pack(anchor='w')
+                 font=self.subheading_font).pack(anchor='w')
         ttk.Label(info_frame, text=f"Source: {source_dir}", foreground="gray").pack(anchor='w', pady=(2, 0))
-        ttk.Label(info_frame, text=f"Destination: {dest_dir}", foreground="blue", font=('TkDefaultFont', 9, 'bold')).pack(anchor='w', pady=(2, 0))
+        ttk.Label(info_frame, text=f"Destination: {dest_dir}", foreground="blue", font=self.bold_font).pack(anchor='w', pady=(2, 0))
         ttk.Label(info_frame, text="Select duplicates to move (keeps the first listed file):", foreground="gray").pack(anchor='w', pady=(5, 0))
         
         delete_empty = tk.BooleanVar(value=True)
@@ -5057,20 +5744,21 @@ Duplicate Detection:
         canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         selected_files = []
+        existing = _existing_paths(fp for files in duplicates.values() for fp in files)
         
         for idx, (file_hash, files) in enumerate(duplicates.items(), 1):
             group_frame = ttk.LabelFrame(scrollable, text=f"Duplicate Group {idx}", padding=10)
             group_frame.pack(fill='x', padx=10, pady=5)
             
             for i, file_path in enumerate(files):
-                file_exists = os.path.exists(file_path)
+                file_exists = file_path in existing
                 status = "✓" if file_exists else "✗ Missing"
                 
                 file_frame = ttk.Frame(group_frame)
                 file_frame.pack(fill='x', pady=2)
                 
                 var = tk.BooleanVar(value=(i > 0 and file_exists))
-                selected_files.append((var, file_path))
+                selected_files.append((var, file_path, file_hash))
                 
                 cb = ttk.Checkbutton(file_frame, variable=var,
                                     text=f"{status} {file_path}" if i > 0 else f"KEEP: {file_path}",
@@ -5085,7 +5773,7 @@ Duplicate Detection:
         btn_frame.pack(fill='x', side='bottom')
         
         def move_to_destination():
-            to_move = [path for var, path in selected_files if var.get()]
+            to_move = [(path, file_hash) for var, path, file_hash in selected_files if var.get()]
             if not to_move:
                 messagebox.showinfo("No Selection", "No files selected to move")
                 return
@@ -5101,28 +5789,32 @@ Duplicate Detection:
             
             moved = 0
             failed = 0
-            import shutil
+            os.makedirs(dest_dir, exist_ok=True)
+            # Names already in the destination (normcase'd), listed once
+            dest_names = {os.path.normcase(n) for n in os.listdir(dest_dir)}
             
-            for file_path in to_move:
+            for file_path, file_hash in to_move:
                 try:
-                    if os.path.exists(file_path):
-                        fname = os.path.basename(file_path)
-                        dest = os.path.join(dest_dir, fname)
-                        # Handle collisions
-                        base, ext = os.path.splitext(fname)
-                        counter = 1
-                        while os.path.exists(dest):
-                            dest = os.path.join(dest_dir, f"{base} ({counter}){ext}")
-                            counter += 1
-                        shutil.move(file_path, dest)
-                        # Update tracker
-                        try:
-                            self.duplicate_checker.remove_file(file_path)
-                            self.duplicate_checker.add_file(dest)
-                        except Exception:
-                            pass
-                        moved += 1
-                        self.log(f"Moved: {file_path} → {dest}")
+                    fname = os.path.basename(file_path)
+                    # Handle collisions
+                    base, ext = os.path.splitext(fname)
+                    counter = 1
+                    while os.path.normcase(fname) in dest_names:
+                        fname = f"{base} ({counter}){ext}"
+                        counter += 1
+                    dest = os.path.join(dest_dir, fname)
+                    shutil.move(file_path, dest)
+                    dest_names.add(os.path.normcase(fname))
+                    # Update tracker
+                    try:
+                        self.duplicate_checker.remove_file(file_path)
+                        self.duplicate_checker.add_file(dest, file_hash=file_hash)
+                    except Exception:
+                        pass
+                    moved += 1
+                    self.log(f"Moved: {file_path} → {dest}")
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     failed += 1
                     self.log(f"Failed to move {file_path}: {e}")
@@ -5144,56 +5836,66 @@ Duplicate Detection:
         self.log(f"Showing {len(duplicates)} duplicate groups with destination: {dest_dir}")
     
     def _delete_empty_folders(self, root_dir: str) -> int:
-        """Delete empty folders, including those with only hidden/system files"""
-        import shutil
-        removed = 0
-        folders_to_remove = []
-        
-        # First pass: collect all directories and clean up junk files
-        for r, dnames, fnames in os.walk(root_dir, topdown=False):
-            # Skip the root directory itself
-            if r == root_dir:
-                continue
-            
-            try:
-                # Remove junk files first
-                for fname in fnames:
-                    fpath = os.path.join(r, fname)
-                    if fname.lower() in ['.ds_store', 'thumbs.db', 'desktop.ini', '.gitkeep', 'desktop.ini']:
-                        try:
-                            os.remove(fpath)
-                        except:
-                            pass
-                
-                # Re-check contents after junk removal
-                try:
-                    contents = os.listdir(r)
-                except:
-                    contents = []
-                
-                # If empty now, mark for removal
-                if not contents:
-                    folders_to_remove.append(r)
-            except Exception:
-                pass
-        
-        # Second pass: remove empty directories
-        for folder in folders_to_remove:
+        """Delete empty folders, including those with only hidden/system files.
+        Subfolders are swept before their parent, so one pass also removes
+        folders that only contained empty folders. When the root has more than
+        a handful of subfolders, they are swept on a thread pool."""
+        junk_files = {'.ds_store', 'thumbs.db', 'desktop.ini', '.gitkeep'}
+        
+        def sweep(path, pool=None, is_root=False):
+            # Returns (folders removed below path, whether path is now empty)
+            removed = 0
+            empty = True
             try:
-                os.rmdir(folder)
-                removed += 1
-            except:
-                # If rmdir fails, try force remove
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                return 0, False
+            subdirs = []
+            files = []
+            for entry in entries:
                 try:
-                    shutil.rmtree(folder, ignore_errors=True)
-                    removed += 1
-                except:
-                    pass
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                (subdirs if is_dir else files).append(entry)
+            # Small folders aren't worth the thread overhead
+            if pool is not None and len(subdirs) > 4:
+                results = pool.map(sweep, [entry.path for entry in subdirs])
+            else:
+                results = (sweep(entry.path) for entry in subdirs)
+            for entry, (sub_removed, sub_empty) in zip(subdirs, results):
+                removed += sub_removed
+                if sub_empty:
+                    try:
+                        os.rmdir(entry.path)
+                    except OSError:
+                        # If rmdir fails, try force remove
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    if not os.path.lexists(entry.path):
+                        removed += 1
+                        continue
+                empty = False
+            for entry in files:
+                # Junk files are only cleared from subfolders, never from the chosen root itself
+                if not is_root and entry.name.lower() in junk_files:
+                    # Remove junk files first
+                    try:
+                        os.remove(entry.path)
+                        continue
+                    except OSError:
+                        pass
+                empty = False
+            return removed, empty
         
-        return removed
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            return sweep(root_dir, pool, is_root=True)[0]
     
     def delete_all_duplicates(self):
         """Automatically delete all duplicate files, keeping only one from each group"""
+        if self._is_busy():
+            messagebox.showwarning("Busy", "Please wait for current operation to complete")
+            return
         self.log("Finding duplicate files for automatic deletion...")
         duplicates = self.duplicate_checker.find_duplicates()
         
@@ -5223,13 +5925,12 @@ Duplicate Detection:
             # Keep the first file, delete the rest
             for file_path in files[1:]:
                 try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        self.duplicate_checker.remove_file(file_path)
-                        deleted += 1
-                        self.log(f"Deleted duplicate: {file_path}")
-                    else:
-                        self.log(f"File already missing: {file_path}")
+                    os.remove(file_path)
+                    self.duplicate_checker.remove_file(file_path)
+                    deleted += 1
+                    self.log(f"Deleted duplicate: {file_path}")
+                except FileNotFoundError:
+                    self.log(f"File already missing: {file_path}")
                 except Exception as e:
                     failed += 1
                     self.log(f"Failed to delete {file_path}: {e}")
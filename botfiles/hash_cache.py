@@ -0,0 +1,76 @@
+"""
+Persistent cache of file content hashes keyed by (path, size, mtime)
+Lets duplicate scans skip re-reading files that have not changed since the last run.
+Each row holds the full-file hash and/or the head hash (first HEAD_BYTES bytes).
+"""
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional, Tuple
+
+
+class HashCache:
+    """SQLite-backed path -> hash cache, safe to share between threads."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # One connection shared by the hashing threads; sqlite3 calls are serialized here.
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT, head_hash TEXT)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(hashes)")}
+            if 'head_hash' not in columns:
+                conn.execute("ALTER TABLE hashes ADD COLUMN head_hash TEXT")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, path: str, size: int, mtime_ns: int, column: str = 'hash') -> Optional[str]:
+        """Return the cached hash ('hash' or 'head_hash'), or None if unknown or the file changed."""
+        if column not in ('hash', 'head_hash'):
+            raise ValueError(f"Unknown hash column: {column}")
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {column} FROM hashes WHERE path=? AND size=? AND mtime_ns=?",
+                (path, size, mtime_ns),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, rows: Iterable[Tuple[str, int, int, Optional[str], Optional[str]]]) -> None:
+        """Store (path, size, mtime_ns, hash, head_hash) rows in a single transaction.
+        A None hash keeps the stored one as long as size and mtime are unchanged."""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO hashes (path, size, mtime_ns, hash, head_hash) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(path) DO UPDATE SET "
+                    "hash = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                    "THEN COALESCE(excluded.hash, hash) ELSE excluded.hash END, "
+                    "head_hash = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                    "THEN COALESCE(excluded.head_hash, head_hash) ELSE excluded.head_hash END, "
+                    "size = excluded.size, mtime_ns = excluded.mtime_ns",
+                    rows,
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM hashes")
+            conn.execute("VACUUM")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
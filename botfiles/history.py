@@ -3,6 +3,7 @@ History tracking module for downloaded content
 """
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +14,10 @@ class DownloadHistory:
     def __init__(self, history_file='download_history.json'):
         self.history_file = history_file
         self.history = self.load_history()
+        # website -> set of recorded media URLs, built per site on first lookup
+        self._website_url_index = {}
+        # Download threads look up and add URLs concurrently; a site's set is built once under it
+        self._website_url_index_lock = threading.Lock()
     
     def load_history(self):
         """Load download history from JSON file"""
@@ -78,20 +83,30 @@ class DownloadHistory:
         return self.history['twitter_tweets'].get(username, [])
     
     # Website methods
+    def _website_urls(self, website):
+        """Set of media URLs recorded for a website (kept in sync by the add methods)"""
+        urls = self._website_url_index.get(website)
+        if urls is not None:
+            return urls
+        with self._website_url_index_lock:
+            # Another thread may have built (and added to) it while we waited
+            urls = self._website_url_index.get(website)
+            if urls is None:
+                urls = set()
+                # Support legacy list-of-strings and new list-of-dicts
+                for e in self.history['websites'].get(website, []):
+                    if isinstance(e, str):
+                        urls.add(e)
+                    elif isinstance(e, dict):
+                        urls.add(e.get('media_url'))
+                self._website_url_index[website] = urls
+        return urls
+    
     def is_website_url_downloaded(self, website, media_url):
         """Check if a media URL from a website has been downloaded"""
         if website not in self.history['websites']:
             return False
-        entries = self.history['websites'][website]
-        # Support legacy list-of-strings and new list-of-dicts
-        for e in entries:
-            if isinstance(e, str):
-                if e == media_url:
-                    return True
-            elif isinstance(e, dict):
-                if e.get('media_url') == media_url:
-                    return True
-        return False
+        return media_url in self._website_urls(website)
     
     def add_website_url(self, website, media_url):
         """Mark a media URL from a website as downloaded"""
@@ -99,13 +114,11 @@ class DownloadHistory:
         if website not in self.history['websites']:
             self.history['websites'][website] = []
         # avoid duplicate strings
-        entries = self.history['websites'][website]
-        for e in entries:
-            if isinstance(e, str) and e == media_url:
-                return
-            if isinstance(e, dict) and e.get('media_url') == media_url:
-                return
+        urls = self._website_urls(website)
+        if media_url in urls:
+            return
         self.history['websites'][website].append(media_url)
+        urls.add(media_url)
         self._update_timestamp(f"website:{website}")
 
     def add_website_entry(self, website, media_url, filename=None, sha256=None, filepath=None):
@@ -113,8 +126,9 @@ class DownloadHistory:
         if website not in self.history['websites']:
             self.history['websites'][website] = []
         entries = self.history['websites'][website]
-        # Avoid duplicates by media_url
-        for e in entries:
+        urls = self._website_urls(website)
+        # Avoid duplicates by media_url (only scan when it is already recorded)
+        for e in (entries if media_url in urls else ()):
             if isinstance(e, dict) and e.get('media_url') == media_url:
                 # update fields if missing
                 if filename:
@@ -146,6 +160,7 @@ class DownloadHistory:
         if filepath:
             entry['filepath'] = filepath
         entries.append(entry)
+        urls.add(media_url)
         self._update_timestamp(f"website:{website}")
 
     def is_sha_downloaded(self, sha256):
@@ -205,6 +220,7 @@ class DownloadHistory:
         elif source_type == 'website':
             if source_name in self.history['websites']:
                 del self.history['websites'][source_name]
+            self._website_url_index.pop(source_name, None)
         
         key = f"{source_type}:{source_name}"
         if key in self.history['last_updated']:
@@ -215,4 +231,5 @@ class DownloadHistory:
     def clear_all_history(self):
         """Clear all download history"""
         self.history = self._create_empty_history()
+        self._website_url_index = {}
         self.save_history()
@@ -5,6 +5,7 @@ import subprocess
 import os
 import json
 import sys
+import threading
 import time
 from pathlib import Path
 from .utils import ensure_download_directory, sanitize_filename
@@ -23,6 +24,8 @@ class RedditScraper:
         self.history = history if history else DownloadHistory()
         self.duplicate_checker = duplicate_checker
         self._gallerydl_available = None
+        # gallery-dl runs may overlap; history/duplicate bookkeeping must not
+        self._post_lock = threading.Lock()
     
     def _is_gallerydl_available(self):
         """Check if gallery-dl is available"""
@@ -159,70 +162,73 @@ class RedditScraper:
                         progress_callback(f" {source_name}: gallery-dl error: {result.stderr[:100]}")
                 return downloaded
             
-            # Get list of files after download
-            files_after = set(os.listdir(download_path)) if os.path.exists(download_path) else set()
-            new_files = files_after - files_before
-            
-            # Process downloaded files
-            for filename in new_files:
-                filepath = os.path.join(download_path, filename)
-                
-                # Skip if duplicate
-                if self.duplicate_checker:
-                    if self.duplicate_checker.is_duplicate_file(filepath):
-                        if progress_callback:
-                            progress_callback(f" Skipped duplicate: {filename}")
-                        try:
-                            os.remove(filepath)
-                        except:
-                            pass
-                        continue
-                    # Add to duplicate tracker
-                    self.duplicate_checker.add_file(filepath)
-                
-                # Organize by media type: pictures/videos/gifs
-                import shutil
-                ext = os.path.splitext(filename)[1].lower()
-                
-                if ext == '.gif':
-                    media_folder = 'gifs'
-                elif ext in ['.mp4', '.webm', '.mov', '.avi', '.mkv', '.flv', '.wmv', '.m4v']:
-                    media_folder = 'videos'
-                elif ext in ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.avif', '.heic']:
-                    media_folder = 'pictures'
-                else:
-                    media_folder = 'other'
+            # Sort/record the new files one source at a time. The lock deliberately
+            # covers the whole loop, duplicate hashing included, so post-processing is serialized.
+            with self._post_lock:
+                # Get list of files after download
+                files_after = set(os.listdir(download_path)) if os.path.exists(download_path) else set()
+                new_files = files_after - files_before
                 
-                # Create media type subfolder and move file
-                media_path = os.path.join(download_path, media_folder)
-                os.makedirs(media_path, exist_ok=True)
-                new_filepath = os.path.join(media_path, filename)
+                # Process downloaded files
+                for filename in new_files:
+                    filepath = os.path.join(download_path, filename)
+                    
+                    # Skip if duplicate
+                    if self.duplicate_checker:
+                        if self.duplicate_checker.is_duplicate_file(filepath):
+                            if progress_callback:
+                                progress_callback(f" Skipped duplicate: {filename}")
+                            try:
+                                os.remove(filepath)
+                            except:
+                                pass
+                            continue
+                        # Add to duplicate tracker
+                        self.duplicate_checker.add_file(filepath)
+                    
+                    # Organize by media type: pictures/videos/gifs
+                    import shutil
+                    ext = os.path.splitext(filename)[1].lower()
+                    
+                    if ext == '.gif':
+                        media_folder = 'gifs'
+                    elif ext in ['.mp4', '.webm', '.mov', '.avi', '.mkv', '.flv', '.wmv', '.m4v']:
+                        media_folder = 'videos'
+                    elif ext in ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.avif', '.heic']:
+                        media_folder = 'pictures'
+                    else:
+                        media_folder = 'other'
+                    
+                    # Create media type subfolder and move file
+                    media_path = os.path.join(download_path, media_folder)
+                    os.makedirs(media_path, exist_ok=True)
+                    new_filepath = os.path.join(media_path, filename)
+                    
+                    # Handle filename conflicts
+                    counter = 1
+                    base, extension = os.path.splitext(filename)
+                    while os.path.exists(new_filepath):
+                        filename_new = f"{base}_{counter}{extension}"
+                        new_filepath = os.path.join(media_path, filename_new)
+                        counter += 1
+                    
+                    shutil.move(filepath, new_filepath)
+                    downloaded.append(new_filepath)
+                    
+                    # Extract post ID from filename (format: reddit_POSTID_01.ext)
+                    try:
+                        parts = filename.split('_')
+                        if len(parts) >= 2:
+                            post_id = parts[1]
+                            # Extract source from the URL or use source_name
+                            source = source_name.replace('r/', '').replace('u/', '')
+                            self.history.add_reddit_post(source, post_id)
+                    except Exception:
+                        pass  # Skip history tracking if we can't parse the ID
                 
-                # Handle filename conflicts
-                counter = 1
-                base, extension = os.path.splitext(filename)
-                while os.path.exists(new_filepath):
-                    filename_new = f"{base}_{counter}{extension}"
-                    new_filepath = os.path.join(media_path, filename_new)
-                    counter += 1
-                
-                shutil.move(filepath, new_filepath)
-                downloaded.append(new_filepath)
-                
-                # Extract post ID from filename (format: reddit_POSTID_01.ext)
-                try:
-                    parts = filename.split('_')
-                    if len(parts) >= 2:
-                        post_id = parts[1]
-                        # Extract source from the URL or use source_name
-                        source = source_name.replace('r/', '').replace('u/', '')
-                        self.history.add_reddit_post(source, post_id)
-                except Exception:
-                    pass  # Skip history tracking if we can't parse the ID
-            
-            # Save history
-            if downloaded:
-                self.history.save_history()
+                # Save history
+                if downloaded:
+                    self.history.save_history()
             
             if progress_callback:
                 if downloaded:
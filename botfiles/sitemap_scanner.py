@@ -8,13 +8,17 @@ from bs4 import BeautifulSoup
 import subprocess
 import os
 import json
+from .utils import strip_www
 
 
 class SitemapScanner:
     """Scans sitemaps and websites to preview available media"""
     
-    def __init__(self):
+    def __init__(self, http_adapter=None):
         self.session = requests.Session()
+        if http_adapter:
+            self.session.mount('http://', http_adapter)
+            self.session.mount('https://', http_adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -178,7 +182,7 @@ class SitemapScanner:
             
             if result.returncode == 0:
                 # Parse the domain from URL
-                domain = urlparse(url).netloc.replace('www.', '')
+                domain = strip_www(urlparse(url).netloc)
                 # Check if domain is in supported extractors
                 return domain in result.stdout.lower()
         except:
@@ -14,7 +14,8 @@ class TwitterScraper:
     """Scraper for Twitter/X content"""
     
     def __init__(self, bearer_token=None, api_key=None, api_secret=None, 
-                 access_token=None, access_token_secret=None, history=None, duplicate_checker=None):
+                 access_token=None, access_token_secret=None, history=None, duplicate_checker=None,
+                 http_adapter=None):
         """Initialize Twitter scraper with API credentials"""
         
         # Try to use API v2 with bearer token
@@ -32,6 +33,9 @@ class TwitterScraper:
             raise ValueError("Twitter API credentials are required")
         
         self.session = requests.Session()
+        if http_adapter:
+            self.session.mount('http://', http_adapter)
+            self.session.mount('https://', http_adapter)
         self.history = history if history else DownloadHistory()
         self.duplicate_checker = duplicate_checker
     
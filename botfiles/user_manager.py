@@ -15,6 +15,8 @@ class UserManager:
     def __init__(self, file_path='botfiles/users_status.json'):
         self.file_path = file_path
         self.data = self._load_data()
+        # Bumped on every save so callers can cache derived data
+        self.revision = 0
     
     def _load_data(self):
         """Load user status data from disk"""
@@ -53,9 +55,12 @@ class UserManager:
     
     def _save_data(self):
         """Save user status data to disk"""
+        self.revision += 1
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        with open(self.file_path, 'w', encoding='utf-8') as f:
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.file_path)
     
     def add_user(self, platform, username, active=True):
         """
@@ -108,6 +113,30 @@ class UserManager:
         
         return removed
     
+    def replace_users(self, platform, usernames, active=True):
+        """
+        Replace the whole active (or inactive) list in one save
+        
+        Args:
+            platform: 'reddit', 'twitter', 'subreddits', or 'websites'
+            usernames: New contents of the list
+            active: Whether to replace the active (True) or inactive (False) list
+        """
+        if platform not in self.data:
+            return False
+        
+        status = 'active' if active else 'inactive'
+        opposite_status = 'inactive' if active else 'active'
+        
+        new_list = list(dict.fromkeys(usernames))
+        keep = set(new_list)
+        self.data[platform][status] = new_list
+        self.data[platform][opposite_status] = [
+            u for u in self.data[platform][opposite_status] if u not in keep
+        ]
+        self._save_data()
+        return True
+    
     def move_to_active(self, platform, username):
         """Move a user from inactive to active"""
         return self.add_user(platform, username, active=True)
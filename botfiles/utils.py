@@ -3,9 +3,15 @@ Utility module for managing configuration and text files
 """
 import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 
+# Default for get() that can never equal a stored value
+_MISSING = object()
+
+
 class ConfigManager:
     """Manages application configuration"""
     
@@ -13,6 +19,13 @@ class ConfigManager:
         self.config_path = config_path
         self._ensure_config_exists()
         self.config = self.load_config()
+        # Write batching state (see batch())
+        self._batch_depth = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
     
     def _ensure_config_exists(self):
         """Create config from template if it doesn't exist"""
@@ -34,8 +47,58 @@ class ConfigManager:
     
     def save_config(self):
         """Save configuration to JSON file"""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self._dirty = False
+        self._write(*self._snapshot())
+    
+    def save_config_async(self):
+        """Serialize now, write to disk on a background thread"""
+        self._dirty = False
+        generation, data = self._snapshot()
+        
+        def _worker():
+            try:
+                self._write(generation, data)
+            except Exception as e:
+                print(f"Warning: Failed to save config: {e}")
+        
+        thread = threading.Thread(target=_worker)
+        thread.daemon = True
+        thread.start()
+    
+    def _snapshot(self):
+        """Return (generation, serialized config) for a pending write"""
+        with self._lock:
+            self._generation += 1
+            return self._generation, json.dumps(self.config, indent=2)
+    
+    def _write(self, generation, data):
+        """Atomically replace the config file, skipping snapshots older than the last write"""
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+            self._written_generation = generation
+    
+    @contextmanager
+    def batch(self, background=False):
+        """Defer the disk writes done by set() until the block exits, then save once.
+        
+        Args:
+            background: If True, the final write happens on a worker thread
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                if background:
+                    self.save_config_async()
+                else:
+                    self.save_config()
     
     def get(self, key, default=None):
         """Get configuration value"""
@@ -57,7 +120,29 @@ class ConfigManager:
                 config[k] = {}
             config = config[k]
         config[keys[-1]] = value
-        self.save_config()
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_config()
+    
+    def update(self, values, background=False):
+        """Set several dotted keys at once and save the config a single time
+        
+        Args:
+            values: Mapping of dotted key -> value
+            background: If True, the write happens on a worker thread
+        
+        Returns:
+            True if anything changed (and was saved), False otherwise
+        """
+        changed = {key: value for key, value in values.items()
+                   if self.get(key, _MISSING) != value}
+        if not changed:
+            return False
+        with self.batch(background=background):
+            for key, value in changed.items():
+                self.set(key, value)
+        return True
 
 
 class TextFileManager:
@@ -118,6 +203,28 @@ class TextFileManager:
         self.write_items([])
 
 
+def create_http_adapter(pool_connections=10, pool_maxsize=20):
+    """Build a pooled, retrying HTTPAdapter.
+    
+    Mount the same instance on several requests sessions to let them share
+    keep-alive connections while keeping their own cookies and headers.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy,
+        pool_block=False
+    )
+
+
 def ensure_download_directory(base_path, subfolder):
     """Create and return download directory path"""
     download_path = os.path.join(base_path, subfolder)
@@ -146,6 +253,20 @@ def build_download_subfolder(source_type: str, identifier: str) -> str:
     return ident
 
 
+def strip_www(netloc):
+    """Drop a leading 'www.' from a host name (only the prefix, unlike str.replace)"""
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def parse_url_entry(url_entry):
+    """Split a 'URL' or 'URL FolderName' entry into (url, folder name or None)"""
+    entry = url_entry.strip()
+    parts = entry.split(None, 1)
+    if len(parts) < 2:
+        return entry, None
+    return parts[0], parts[1]
+
+
 def sanitize_filename(filename):
     """Remove invalid characters from filename"""
     invalid_chars = '<>:"/\\|?*'
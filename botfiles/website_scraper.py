@@ -13,7 +13,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import warnings
 import logging
-from .utils import ensure_download_directory, sanitize_filename
+from .utils import ensure_download_directory, sanitize_filename, create_http_adapter, parse_url_entry, strip_www
 from .history import DownloadHistory
 from .sitemap_scanner import GalleryDLDownloader
 from .download_queue import DownloadQueue
@@ -34,25 +34,14 @@ class WebsiteScraper:
         history: DownloadHistory instance
         max_workers: concurrency for downloads
         aggressive_popup: if True, perform aggressive popup / overlay removal during Playwright rendering
+        http_adapter: optional shared HTTPAdapter (see utils.create_http_adapter)
     """
     
-    def __init__(self, history=None, max_workers=3, aggressive_popup=True, duplicate_checker=None, cookies=None, custom_headers=None):
+    def __init__(self, history=None, max_workers=3, aggressive_popup=True, duplicate_checker=None, cookies=None, custom_headers=None,
+                 http_adapter=None):
         self.session = requests.Session()
         # Optimize connection pooling for faster downloads
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=retry_strategy,
-            pool_block=False
-        )
+        adapter = http_adapter or create_http_adapter()
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         
@@ -183,10 +172,7 @@ class WebsiteScraper:
         Format: 'URL' or 'URL FolderName'
         Returns: (url, custom_folder_name or None)
         """
-        parts = url_entry.strip().split(None, 1)  # Split on first whitespace
-        url = parts[0]
-        custom_name = parts[1] if len(parts) > 1 else None
-        return url, custom_name
+        return parse_url_entry(url_entry)
     
     def scrape_url(self, url_entry, base_path, progress_callback=None, max_pages=50, scroll_count=5, collect_only=False):
         """Scrape media from a URL or sitemap.
@@ -291,7 +277,7 @@ class WebsiteScraper:
             if custom_name:
                 folder_name = sanitize_filename(custom_name)
             else:
-                domain = urlparse(sitemap_url).netloc.replace('www.', '')
+                domain = strip_www(urlparse(sitemap_url).netloc)
                 folder_name = sanitize_filename(domain)
             from .utils import build_download_subfolder
             download_path = ensure_download_directory(base_path, build_download_subfolder('website', folder_name))
@@ -963,7 +949,7 @@ class WebsiteScraper:
             if custom_name:
                 folder_name = sanitize_filename(custom_name)
             else:
-                domain = urlparse(url).netloc.replace('www.', '')
+                domain = strip_www(urlparse(url).netloc)
                 folder_name = sanitize_filename(domain)
             from .utils import build_download_subfolder
             download_path = ensure_download_directory(base_path, build_download_subfolder('website', folder_name))
@@ -1836,8 +1822,13 @@ class WebsiteScraper:
         progress_callback=None,
         pause_checker=None,
         progress_hook=None,
+        resume_event=None,
     ) -> List[str]:
-        """Download all pending items stored in a DownloadQueue with concurrent processing."""
+        """Download all pending items stored in a DownloadQueue with concurrent processing.
+
+        If resume_event (a threading.Event, set while running) is given, a pause blocks
+        on it instead of polling pause_checker.
+        """
         downloaded: List[str] = []
         processed = 0
         
@@ -1921,7 +1912,14 @@ class WebsiteScraper:
             
             for future in as_completed(future_to_item):
                 # Check pause
-                if pause_checker:
+                if resume_event is not None:
+                    if not resume_event.is_set():
+                        if progress_callback:
+                            progress_callback("⏸ Paused - resume to continue downloads")
+                        resume_event.wait()
+                        if progress_callback:
+                            progress_callback("▶ Resuming downloads...")
+                elif pause_checker:
                     notified = False
                     while pause_checker():
                         if progress_callback and not notified: